@@ -0,0 +1,135 @@
+"""
+File        : bench_excel_parser.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Benchmark of the excel parser, full workbook against read-only streaming.
+
+A workbook of translation lines is generated, with an id column, a source
+column, the translated column and a comment column. Each mode reads the
+translated column with the id column in a new process, so its peak RSS is
+measured alone: the full mode loads the whole workbook with its cell objects
+like the parser did before, the streaming mode is excel_parser.iter_file.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_excel_parser
+"""
+
+
+# == Imports ==================================================================
+
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook, load_workbook
+
+from rawtextcheck.default_parser import excel_parser
+
+
+# == Constants ================================================================
+
+ROWS = 200_000
+MODES: list[str] = ["full", "streaming"]
+ARGUMENTS: dict[str, str] = {"col": "C", "colID": "A"}
+
+
+# == Functions ================================================================
+
+def generate_workbook(filepath: str, rows: int = ROWS) -> None:
+    """write a workbook of translation lines
+
+    Args:
+        filepath (str): path of the .xlsx file
+        rows (int, optional): number of rows. Defaults to ROWS.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for i in range(1, rows + 1):
+        ws.append([f"ID_{i:06d}", f"Source line number {i} of the game.",
+                   f"Ligne traduite numéro {i} du jeu." if i % 10 else None, f"comment {i % 7}"])
+    wb.save(filepath)
+
+
+def read_full(filepath: str) -> int:
+    """read the column like the parser before streaming, with the whole workbook loaded
+
+    Args:
+        filepath (str): path of the .xlsx file
+
+    Returns:
+        int: number of lines read
+    """
+    wb = load_workbook(filepath, data_only=True)
+    ws = wb.active
+    lines: list[tuple[str, str]] = []
+    for row in ws.iter_rows(min_row=1):
+        cell_value = row[2]
+        if cell_value.value is not None and str(cell_value.value).strip():
+            lines.append((str(row[0].value), str(cell_value.value)))
+    return len(lines)
+
+
+def read_streaming(filepath: str) -> int:
+    """read the column with the read-only streaming parser
+
+    Args:
+        filepath (str): path of the .xlsx file
+
+    Returns:
+        int: number of lines read
+    """
+    return sum(1 for _ in excel_parser.iter_file(filepath, ARGUMENTS))
+
+
+def peak_rss_mb() -> float | None:
+    """get the peak RSS of the current process
+
+    Returns:
+        float | None: peak RSS in MB, None if it can't be read
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench(mode: str, filepath: str) -> None:
+    """read the workbook in this process and print the time, peak RSS and number of lines
+
+    Args:
+        mode (str): "full" or "streaming"
+        filepath (str): path of the .xlsx file
+    """
+    logging.disable(logging.INFO)
+    start_time: float = time.perf_counter()
+    lines: int = read_full(filepath) if mode == "full" else read_streaming(filepath)
+    seconds: float = time.perf_counter() - start_time
+    print(seconds, peak_rss_mb(), lines)
+
+
+def run() -> None:
+    """run the benchmarks, each mode in its own process"""
+    with tempfile.TemporaryDirectory() as folder:
+        filepath: str = os.path.join(folder, "bench.xlsx")
+        generate_workbook(filepath)
+        print(f"{ROWS} rows, {os.path.getsize(filepath) / (1024 * 1024):.1f} MB")
+        print(f"{'mode':>10} {'time (s)':>9} {'peak RSS (MB)':>14} {'lines':>7}")
+        for mode in MODES:
+            output: str = subprocess.run([sys.executable, "-m", "benchmarks.bench_excel_parser", mode, filepath],
+                                         capture_output=True, text=True, check=True).stdout
+            seconds, rss, lines = output.split()
+            rss_text: str = f"{float(rss):.0f}" if rss != "None" else "n/a"
+            print(f"{mode:>10} {float(seconds):>9.2f} {rss_text:>14} {lines:>7}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        bench(sys.argv[1], sys.argv[2])
+    else:
+        run()
@@ -0,0 +1,85 @@
+"""
+File        : bench_ignored_rules.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Benchmark of the ignored rules disabled in LanguageTool against filtered afterwards.
+
+A fake LanguageTool server takes a fixed time for each rule it runs on a request.
+A project ignores most of the noisy rules: the time of the server is measured
+when every rule runs and the ignored ones are filtered out of the matches,
+and when the ignored rules are disabled in the requests.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_ignored_rules
+"""
+
+
+# == Imports ==================================================================
+
+import logging
+import time
+from unittest.mock import patch
+
+from rawtextcheck.script import languagetool, languagetool_cache
+from rawtextcheck.script.batcher import AdaptiveBatcher
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+from tests.fake_languagetool_server import FakeLanguageTool
+
+
+# == Constants ================================================================
+
+LINES = 2_000
+RULES = 40
+"""number of rules of the fake server"""
+IGNORED_RULES = 30
+"""number of rules ignored by the project"""
+RULE_DELAY = 0.0005
+"""time taken by the fake server for each rule run on a batch, in seconds"""
+
+
+# == Functions ================================================================
+
+def bench(push_down: bool) -> tuple[float, float, int]:
+    """analyze lines with the rules of the project disabled in the requests or filtered afterwards
+
+    Args:
+        push_down (bool): True to disable the ignored rules in the requests
+
+    Returns:
+        tuple[float, float, int]: server time, total time in seconds, and number of errors
+    """
+    rule_delays: dict[str, float] = {f"NOISY_RULE_{i}": RULE_DELAY for i in range(RULES)}
+    ignored_rules: frozenset[str] = frozenset(f"NOISY_RULE_{i}" for i in range(IGNORED_RULES))
+    texts: list[tuple[str, str]] = [(str(i), f"Ligne {i} avec une fote.") for i in range(LINES)]
+    tool = FakeLanguageTool(rule_delays=rule_delays)
+    pool = LanguageToolPool("fr", lambda: tool, 1)
+    pool.batcher = AdaptiveBatcher(max_lines=20)
+    pool.start()
+    real_rules_params = languagetool.rules_params
+
+    def rules_params(*args, **kwargs) -> dict[str, str]:
+        # without push down, the requests keep only the rules configured in LanguageTool
+        return real_rules_params() if not push_down else real_rules_params(*args, **kwargs)
+
+    with (patch.object(languagetool, "pool", pool),
+          patch.object(languagetool_cache, "get_cache", return_value=None),
+          patch.object(languagetool, "rules_params", rules_params)):
+        start_time: float = time.perf_counter()
+        errors: int = len(languagetool.analyze_text(texts, set(), ignored_rules))
+        seconds: float = time.perf_counter() - start_time
+    pool.close()
+    return tool.server.busy_seconds, seconds, errors
+
+
+def run() -> None:
+    """run the benchmarks"""
+    logging.disable(logging.INFO)
+    print(f"{LINES} lines, {RULES} rules, {IGNORED_RULES} ignored by the project")
+    print(f"{'ignored rules':>16} {'server (s)':>11} {'total (s)':>10} {'errors':>7}")
+    for name, push_down in (("filtered after", False), ("disabled", True)):
+        server_seconds, seconds, errors = bench(push_down)
+        print(f"{name:>16} {server_seconds:>11.3f} {seconds:>10.3f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    run()
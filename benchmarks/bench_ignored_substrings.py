@@ -0,0 +1,90 @@
+"""
+File        : bench_ignored_substrings.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Micro-benchmark of the ignored substrings cleaning.
+
+Compare a scan of the line per dictionary of ignored substrings, as the
+cleaning was done before, with a TextCleaner compiled once, on long lines full of markup.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_ignored_substrings
+"""
+
+
+# == Imports ==================================================================
+
+import random
+import timeit
+
+from rawtextcheck.script.text_matcher import TextCleaner
+
+
+# == Constants ================================================================
+
+SUBSTRINGS_INTO_SPACE: dict[str, list[str]] = {"<": [">"], "[[": ["]]", "|"], "<!--": ["-->"]}
+SUBSTRINGS_INTO_NOTHING: dict[str, list[str]] = {"{": ["}"], "#": ["#"], "\\c[": ["]"]}
+TOKENS: list[str] = ["<b>", "</b>", "<color=#ff0000>", "[[link|", "]]", "{0}", "#tag#", "\\c[2]", "<!-- note -->"]
+WORDS: list[str] = ["Bonjour", "le", "monde", "épée", "coup", "d'un", "!", "?", " ", " ", " <3 "]
+"""words of the text, " <3 " opens a start delimiter that only the next markup closes"""
+LINE_LENGTHS: list[int] = [1_000, 10_000, 50_000]
+REPEAT = 5
+
+
+# == Functions ================================================================
+
+def generate_line(rng: random.Random, length: int) -> str:
+    """generate a line of at least length characters mixing words and markup"""
+    parts: list[str] = []
+    size: int = 0
+    while size < length:
+        part: str = rng.choice(TOKENS) if rng.random() < 0.2 else rng.choice(WORDS)
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+
+def remove_ignored_substrings(text: str, ignored_substrings: dict[str, list[str]], replacement: str) -> str:
+    """reference cleaning, one scan of the text for a dictionary of ignored substrings"""
+    result: list[str] = []
+    i: int = 0
+    while i < len(text):
+        for start, ends in ignored_substrings.items():
+            if not text.startswith(start, i):
+                continue
+            found: list[tuple[int, int]] = [(text.find(end, i + len(start)), index)
+                                            for index, end in enumerate(ends)]
+            found = [(position, index) for position, index in found if position != -1]
+            if found:
+                position, index = min(found)
+                result.append(replacement)
+                i = position + len(ends[index])
+                break
+        else:
+            result.append(text[i])
+            i += 1
+    return "".join(result)
+
+
+def run() -> None:
+    """run the benchmark and print the timings"""
+    rng = random.Random(42)
+    cleaner = TextCleaner({}, [], [], SUBSTRINGS_INTO_SPACE, SUBSTRINGS_INTO_NOTHING)
+
+    print(f"{'length':>8} {'reference (s)':>14} {'cleaner (s)':>12} {'speedup':>8}")
+    for length in LINE_LENGTHS:
+        line: str = generate_line(rng, length)
+
+        def reference() -> str:
+            text: str = remove_ignored_substrings(line, SUBSTRINGS_INTO_SPACE, " ")
+            return remove_ignored_substrings(text, SUBSTRINGS_INTO_NOTHING, "")
+
+        reference_time: float = min(timeit.repeat(reference, number=1, repeat=REPEAT))
+        cleaner_time: float = min(timeit.repeat(lambda: cleaner.sub(line), number=1, repeat=REPEAT))
+        print(f"{length:>8} {reference_time:>14.4f} {cleaner_time:>12.4f} {reference_time / cleaner_time:>7.1f}x")
+
+
+# == Main =====================================================================
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,89 @@
+"""
+File        : bench_languagetool_client.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Benchmark of the LanguageTool HTTP client against a fake server.
+
+A fake LanguageTool server stands in for Java, so the cost of the client can be
+measured alone: latency of one request with a new connection each time against
+a kept-alive connection, then throughput of check_lines with pools of servers
+answering with a fixed delay.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_languagetool_client
+"""
+
+
+# == Imports ==================================================================
+
+import logging
+import time
+import timeit
+from unittest.mock import patch
+
+import requests
+
+from rawtextcheck.script import languagetool
+from rawtextcheck.script.batcher import AdaptiveBatcher
+from rawtextcheck.script.languagetool_client import LanguageToolClient
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+from tests.fake_languagetool_server import FakeLanguageTool, FakeLanguageToolServer
+
+
+# == Constants ================================================================
+
+REQUESTS = 300
+TEXT = "Bonjour, une fote dans la phrase.\n" * 20
+POOL_SIZES: list[int] = [1, 2, 4, 8]
+SERVER_DELAY = 0.02
+"""time taken by the fake server for each batch, in seconds"""
+LINES = 4_000
+
+
+# == Functions ================================================================
+
+def bench_latency() -> None:
+    """print the time of one request, with a new connection each time and with a kept-alive one"""
+    server = FakeLanguageToolServer()
+    client = LanguageToolClient(server.url, "fr")
+
+    def new_connection() -> None:
+        requests.post(server.url + "check", data={"language": "fr", "text": TEXT}, timeout=10).json()
+
+    def kept_alive() -> None:
+        client.check(TEXT)
+
+    new_time: float = timeit.timeit(new_connection, number=REQUESTS) / REQUESTS
+    new_connections: int = server.connections
+    kept_time: float = timeit.timeit(kept_alive, number=REQUESTS) / REQUESTS
+    print(f"latency, new connection: {new_time * 1e3:.3f} ms ({new_connections} connections), "
+          f"kept alive: {kept_time * 1e3:.3f} ms ({server.connections - new_connections} connection), "
+          f"{REQUESTS} requests")
+    client.close()
+    server.close()
+
+
+def bench_throughput() -> None:
+    """print the time of check_lines for pools of growing size"""
+    texts: list[tuple[str, str]] = [(str(i), f"Ligne {i} avec une fote.") for i in range(LINES)]
+    print(f"{'servers':>8} {'time (s)':>9} {'lines/s':>9}")
+    for size in POOL_SIZES:
+        pool = LanguageToolPool("fr", lambda: FakeLanguageTool(delay=SERVER_DELAY), size)
+        pool.start()
+        with patch.object(languagetool, "pool", pool):
+            start_time: float = time.perf_counter()
+            languagetool.check_lines(texts, AdaptiveBatcher(max_lines=50))
+            seconds: float = time.perf_counter() - start_time
+        pool.close()
+        print(f"{size:>8} {seconds:>9.3f} {LINES / seconds:>9.0f}")
+
+
+def run() -> None:
+    """run the benchmarks"""
+    logging.disable(logging.INFO)
+    bench_latency()
+    bench_throughput()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,68 @@
+"""
+File        : bench_line_mapping.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Micro-benchmark of the mapping of LanguageTool matches to their line.
+
+Compare the linear search on the line offsets with languagetool.find_line_index,
+on a synthetic stream of match offsets, for batches of growing size.
+The time per match of the bisect search must stay flat.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_line_mapping
+"""
+
+
+# == Imports ==================================================================
+
+import random
+import timeit
+
+from rawtextcheck.script import languagetool
+
+
+# == Constants ================================================================
+
+BATCH_SIZES: list[int] = [100, 800, 3_000, 10_000]
+MATCHES_PER_LINE = 2
+REPEAT = 3
+
+
+# == Functions ================================================================
+
+def generate_batch(rng: random.Random, size: int) -> list[tuple[str, str]]:
+    """generate a batch of lines of random length"""
+    return [(str(i), "x" * rng.randint(10, 120)) for i in range(size)]
+
+
+def linear_line_index(line_offsets: list[int], offset: int) -> int:
+    """previous mapping, a linear search on the offsets followed by the end of the text"""
+    return next(i for i, line_offset in enumerate(line_offsets) if line_offset > offset) - 1
+
+
+def run() -> None:
+    """run the benchmark and print the timings per match"""
+    rng = random.Random(42)
+
+    print(f"{'lines':>8} {'matches':>8} {'linear (µs)':>12} {'bisect (µs)':>12}")
+    for size in BATCH_SIZES:
+        batch: list[tuple[str, str]] = generate_batch(rng, size)
+        combined_text, line_starts = languagetool.combine_lines(batch)
+        line_offsets: list[int] = list(line_starts) + [len(combined_text) + 1]
+        offsets: list[int] = [rng.randrange(len(combined_text)) for _ in range(size * MATCHES_PER_LINE)]
+
+        def linear() -> list[int]:
+            return [linear_line_index(line_offsets, offset) for offset in offsets]
+
+        def bisect() -> list[int]:
+            return [languagetool.find_line_index(line_starts, offset) for offset in offsets]
+
+        assert linear() == bisect()
+        linear_time: float = min(timeit.repeat(linear, number=1, repeat=REPEAT))
+        bisect_time: float = min(timeit.repeat(bisect, number=1, repeat=REPEAT))
+        print(f"{size:>8} {len(offsets):>8} {linear_time / len(offsets) * 1e6:>12.3f} "
+              f"{bisect_time / len(offsets) * 1e6:>12.3f}")
+
+
+if __name__ == "__main__":
+    run()
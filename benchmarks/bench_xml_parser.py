@@ -0,0 +1,84 @@
+"""
+File        : bench_xml_parser.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Benchmark of the streaming xml parser on files of growing size.
+
+XML dumps of dialog lines are generated with 10 times more elements at each
+size, without id attribute so every line number comes from the parser. The
+time per element must stay flat, and the peak memory traced by tracemalloc
+must not grow with the size of the file.
+
+Run from the root of the repository:
+    python -m benchmarks.bench_xml_parser
+"""
+
+
+# == Imports ==================================================================
+
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from rawtextcheck.default_parser import xml_parser
+
+
+# == Constants ================================================================
+
+ELEMENTS: list[int] = [10_000, 100_000, 1_000_000]
+
+
+# == Functions ================================================================
+
+def generate_xml(filepath: str, elements: int) -> None:
+    """write an xml dump of dialog lines
+
+    Args:
+        filepath (str): path of the .xml file
+        elements (int): number of line elements
+    """
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<dialogs>\n')
+        for i in range(elements):
+            f.write(f'  <scene name="scene_{i // 50}">\n' if i % 50 == 0 else "")
+            f.write(f'    <line speaker="npc_{i % 13}">Ligne de dialogue numéro {i} &amp; sa suite.</line>\n')
+            f.write("  </scene>\n" if i % 50 == 49 or i == elements - 1 else "")
+        f.write("</dialogs>\n")
+
+
+def bench(filepath: str) -> tuple[float, float, int]:
+    """read every line element of a file
+
+    Args:
+        filepath (str): path of the .xml file
+
+    Returns:
+        tuple[float, float, int]: time in seconds, peak traced memory in MB, and number of lines
+    """
+    tracemalloc.start()
+    start_time: float = time.perf_counter()
+    lines: int = sum(1 for _ in xml_parser.iter_file(filepath, {"tag": "line"}))
+    seconds: float = time.perf_counter() - start_time
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / (1024 * 1024), lines
+
+
+def run() -> None:
+    """run the benchmarks"""
+    logging.disable(logging.INFO)
+    print(f"{'elements':>10} {'file (MB)':>10} {'time (s)':>9} {'us/element':>11} {'peak (MB)':>10}")
+    with tempfile.TemporaryDirectory() as folder:
+        for elements in ELEMENTS:
+            filepath: str = os.path.join(folder, f"bench_{elements}.xml")
+            generate_xml(filepath, elements)
+            seconds, peak_mb, lines = bench(filepath)
+            size_mb: float = os.path.getsize(filepath) / (1024 * 1024)
+            print(f"{lines:>10} {size_mb:>10.1f} {seconds:>9.2f} {seconds / lines * 1e6:>11.2f} {peak_mb:>10.2f}")
+            os.remove(filepath)
+
+
+if __name__ == "__main__":
+    run()
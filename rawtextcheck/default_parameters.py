@@ -177,8 +177,127 @@ BANWORD_TEXT_ERROR: str = QCA.translate("error text", "This word is not authoriz
 BANWORD_TEXT_ERROR_TYPE = "BANWORD"
 """Type uesd in result for banword error"""
 
+RESULTS_METADATA_FOLDER = ".metadata"
+"""Folder keeping the metadata of the results of a project, in the folder of its results.
+Its name has no .json extension, it is never the name of a result"""
+
+CHECK_MODE_FULL = "full"
+"""Check mode running every LanguageTool rule, with invalid characters and banwords"""
+
+CHECK_MODE_QUICK = "quick"
+"""Check mode running only LanguageTool spelling rules, with invalid characters and banwords"""
+
+CHECK_MODES: list[tuple[str, str]] = [
+    (CHECK_MODE_FULL, QCA.translate("check mode", "Full check")),
+    (CHECK_MODE_QUICK, QCA.translate("check mode", "Quick check (spelling only)"))
+    ]
+"""Check modes of a run with their names, first value is default value"""
+
+RESULTS_FIRST_CHUNK_LINES = 500
+"""Number of lines analyzed before the first results are shown, the next chunks are twice bigger"""
+
+RESULTS_MAX_CHUNK_LINES = 20_000
+"""Maximum number of lines analyzed before the results are shown"""
+
+BANWORD_CASE_FOLD = False
+"""If True, banwords are found whatever the case of the text"""
+
+BANWORD_STRIP_PUNCTUATION = True
+"""If True, punctuation around a word is ignored when looking for banwords"""
+
+BANWORD_PUNCTUATION = ".,;:!?()[]{}\"'«»“”‘’…¡¿-—–*_/\\"
+"""Punctuation removed around words when looking for banwords"""
+
 LANGUAGETOOL_SPELLING_CATEGORY = "misspelling"
 """LanguageTool category used to detect errors as spelling errors"""
 
+LANGUAGETOOL_SPELLING_CATEGORIES: list[str] = ["TYPOS"]
+"""LanguageTool categories of the spelling rules, the only ones run by the quick check mode"""
+
 LANGUAGETOOL_MAX_LINES_PER_BATCH = 800
 """Maximum number of lines to process in a single batch with LanguageTool"""
+
+LANGUAGETOOL_POOL_SIZE = 0
+"""Number of LanguageTool servers analyzing batches at the same time, 0 for the number of cores"""
+
+LANGUAGETOOL_MEMORY_BUDGET_MB = 4_096
+"""Memory in MB that the LanguageTool servers of every language kept started can use,
+when it is not set from the RAM"""
+
+LANGUAGETOOL_MEMORY_BUDGET_SHARE = 0.5
+"""Share of the RAM that the LanguageTool servers of every language kept started can use"""
+
+LANGUAGETOOL_SERVER_MEMORY_MB = 512
+"""Estimated memory in MB used by one LanguageTool server, when its heap is not set by the app"""
+
+LANGUAGETOOL_JVM_OVERHEAD_MB = 256
+"""Memory in MB used by a LanguageTool server besides its Java heap"""
+
+LANGUAGETOOL_LANGUAGES_IN_BUDGET = 2
+"""Number of languages whose servers fit in the memory budget, used to set the heap from the RAM"""
+
+LANGUAGETOOL_IDLE_TIMEOUT = 900.0
+"""Time in seconds after which LanguageTool servers of a language not used are closed"""
+
+LANGUAGETOOL_MIN_HEAP_MB = 512
+"""Minimum Java heap in MB of one LanguageTool server, when set from the RAM"""
+
+LANGUAGETOOL_MAX_HEAP_MB = 4_096
+"""Maximum Java heap in MB of one LanguageTool server, when set from the RAM"""
+
+LANGUAGETOOL_DEFAULT_RAM_MB = 8_192
+"""RAM in MB used to set the LanguageTool settings when it can't be read"""
+
+LANGUAGETOOL_CACHE_SIZE_PER_HEAP_MB = 10
+"""Number of sentences cached by a LanguageTool server for each MB of its heap"""
+
+LANGUAGETOOL_REQUEST_TIMEOUT = 300.0
+"""Time in seconds to wait for the answer of LanguageTool to one batch"""
+
+LANGUAGETOOL_INITIAL_CHARS_PER_BATCH = 20_000
+"""Number of characters of the first batch sent to LanguageTool, adjusted after each batch"""
+
+LANGUAGETOOL_MIN_CHARS_PER_BATCH = 1_000
+"""Minimum number of characters of a batch, a longer line is still sent alone"""
+
+LANGUAGETOOL_MAX_CHARS_PER_BATCH = 200_000
+"""Maximum number of characters of a batch, a longer line is still sent alone"""
+
+LANGUAGETOOL_TARGET_SECONDS_PER_BATCH = 3.0
+"""Time wanted for LanguageTool to analyze one batch, used to adjust the size of batches"""
+
+LANGUAGETOOL_RETRIES = 2
+"""Number of times a failed batch is sent again before being split to find the lines LanguageTool fails on"""
+
+LANGUAGETOOL_RETRY_DELAY = 1.0
+"""Time in seconds before sending a failed batch again, doubled after each retry"""
+
+LANGUAGETOOL_MAX_SKIPPED_LINES_SHOWN = 20
+"""Maximum number of line numbers written in the message about the lines LanguageTool failed on"""
+
+LANGUAGETOOL_PREWARM = True
+"""If True, LanguageTool is started for the language of the last project when the app starts"""
+
+LANGUAGETOOL_WARMUP_TEXT = "Ceci est une phrase pour charger les règles. This is a sentence to load the rules."
+"""Text analyzed once by each new LanguageTool server, so the rules are loaded before the first file"""
+
+LANGUAGETOOL_STATE_STARTING = "starting"
+"""State of the LanguageTool servers of a language being started"""
+
+LANGUAGETOOL_STATE_READY = "ready"
+"""State of the LanguageTool servers of a language ready to analyze texts"""
+
+LANGUAGETOOL_STATE_FAILED = "failed"
+"""State of the LanguageTool servers of a language that could not be started"""
+
+
+# ------- Cache Config ----------
+
+CACHE_FOLDER = "cache"
+"""Folder where cache files are stored"""
+
+LANGUAGETOOL_CACHE_PATH = CACHE_FOLDER + "/languagetool_cache.sqlite3"
+"""Path to the SQLite file caching the LanguageTool matches of each line"""
+
+LANGUAGETOOL_CACHE_MAX_ENTRIES = 500_000
+"""Maximum number of lines in the LanguageTool cache, least recently used lines are removed first"""
@@ -10,6 +10,7 @@ from the specified column. The first column starts at 1.
 
 # == Imports ==================================================================
 
+from collections.abc import Iterator
 import csv
 from logging import Logger
 
@@ -37,6 +38,25 @@ logger: Logger = get_logger(__name__)
 def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]]:
     """Parse a CSV file and return each non-empty cell from the specified column with its row identifier.
 
+    Args:
+        filepath (str): Path to the CSV file (.csv).
+        arguments (dict[str, str]): Specific argument for this file, see iter_file.
+
+    Returns:
+        list[tuple[str, str]]: List of (row ID as string, cell content),
+        empty if the file can't be read.
+    """
+    try:
+        return list(iter_file(filepath, arguments))
+    except Exception:
+        return []
+
+
+def iter_file(filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+    """Read a CSV file and yield each non-empty cell from the specified column with its row identifier.
+    If the file is not valid, the error is shown and raised after the lines read
+    before it, so the check of the file is stopped and not saved as complete.
+
     Args:
         filepath (str): Path to the CSV file (.csv).
         argument (str): Specific argument for this file.
@@ -45,8 +65,11 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                 - "colID": Optional column number (1-based index) for row
                         identifier (default is the row number).
 
-    Returns:
-        list[tuple[str, str]]: List of (row ID as string, cell content).
+    Raises:
+        Exception: error of the reading of the file, once shown
+
+    Yields:
+        Iterator[tuple[str, str]]: (row ID as string, cell content).
     """
     try:
         col_value_index: int = int(arguments[COL_ARG.name])
@@ -54,7 +77,7 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
         if COL_ID_ARG.name in arguments.keys():
             col_id_index = int(arguments[COL_ID_ARG.name])
         if col_value_index < 1 or (col_id_index is not None and col_id_index < 1):
-            return []
+            return
 
     except ValueError:
         logger.error("%s is not a valid argument for the CSV parser.", arguments)
@@ -62,9 +85,7 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                       QCA.translate("message error",
                                                     f"{arguments} is not a valid argument for the CSV parser.")
                                       )
-        return []
-
-    results: list[tuple[str, str]] = []
+        return
 
     try:
         with open(filepath, newline='', encoding='utf-8') as csvfile:
@@ -82,12 +103,11 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                     else:
                         row_id = str(i)
 
-                    results.append((row_id, value))
+                    yield row_id, value
     except Exception as e:
         logger.error("Error when parsing the CSV %s : %s", filepath, e)
         popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
                                       QCA.translate("message error",
                                                     "Error when parsing the CSV file.")
                                       )
-
-    return results
+        raise
@@ -11,9 +11,14 @@ This parser acts as a default parser for excel files.
 
 # == Imports ==================================================================
 
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from logging import Logger
+import multiprocessing
+import os
+from typing import Any
 
-from openpyxl import Workbook, load_workbook
+from openpyxl import load_workbook
 from openpyxl.utils import column_index_from_string
 from PyQt5.QtCore import QCoreApplication as QCA
 
@@ -26,8 +31,16 @@ from rawtextcheck.ui.messagebox import popup_manager
 
 COL_ARG = ParserArgument(name="col", optional=False)
 COL_ID_ARG = ParserArgument(name="colID", optional=True)
+SHEETS_ARG = ParserArgument(name="sheets", optional=True)
 
-LIST_ARGUMENTS: list[ParserArgument] = [COL_ARG, COL_ID_ARG]
+LIST_ARGUMENTS: list[ParserArgument] = [COL_ARG, COL_ID_ARG, SHEETS_ARG]
+
+ALL_SHEETS = "all"
+"""Value of the sheets argument to read every sheet"""
+
+PARALLEL_MIN_FILE_SIZE = 5 * 1024 * 1024
+"""Size in bytes from which the sheets of a file are read in parallel, below the start
+of the processes takes longer than reading the sheets one after the other"""
 
 
 # == Global Variables =========================================================
@@ -40,15 +53,45 @@ logger: Logger = get_logger(__name__)
 def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]]:
     """Parse an Excel file and return each non-empty cell from the specified column with row identifier.
 
+    Args:
+        filepath (str): Path to the Excel file (.xlsx).
+        arguments (dict[str, str]): Specific argument for this file, see iter_file.
+
+    Returns:
+        list[tuple[str, str]]: List of (row ID as string, cell content),
+        empty if the file can't be read.
+    """
+    try:
+        return list(iter_file(filepath, arguments))
+    except Exception:
+        return []
+
+
+def iter_file(filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+    """Read an Excel file and yield each non-empty cell from the specified column with row identifier.
+    The workbook is read in read-only mode, row by row, only the values of the columns
+    between col and colID are loaded. It is closed when the file is read or the reading stops.
+    With several sheets in a file of PARALLEL_MIN_FILE_SIZE or more, each sheet is read in its
+    own process, and the sheets are yielded in the order asked as soon as they are read.
+    The memory then holds the sheets read and not yet yielded, instead of one row.
+    If the file or a sheet can't be read, the error is shown and raised after the lines
+    read before it, so the check of the file is stopped and not saved as complete.
+
     Args:
         filepath (str): Path to the Excel file (.xlsx).
         argument (dict[str, str]): Specific argument for this file.
             keys:
                 - "col": Column letter (e.g., "A") to parse.
                 - "colID": Optional column letter for row identifier (default is the row number).
+                - "sheets": Optional sheets to read, names or numbers (1-based) separated by "|",
+                        or "all". Row identifiers are prefixed by the sheet name, as "Sheet!12".
+                        Default is the active sheet, without prefix.
 
-    Returns:
-        list[tuple[str, str]]: List of (row ID as string, cell content).
+    Raises:
+        Exception: error of the reading of the file, once shown
+
+    Yields:
+        Iterator[tuple[str, str]]: (row ID as string, cell content).
     """
     try:
         col_value_index: int = column_index_from_string(arguments[COL_ARG.name])
@@ -61,36 +104,172 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                       QCA.translate("message error",
                                                     f"{arguments} is not a valid argument for the excel parser.")
                                       )
-        return []
+        return
 
     try:
-        wb: Workbook = load_workbook(filepath, data_only=True)
-        ws = wb.active
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+    except Exception as e:
+        show_parsing_error(filepath, e)
+        raise
 
-        results: list[tuple[str, str]] = []
+    try:
+        if SHEETS_ARG.name not in arguments.keys():
+            ws = wb.active
+            if ws is not None:
+                yield from iter_sheet(ws, col_value_index, col_id_index)
+            return
 
-        if ws is not None:
-            for row in ws.iter_rows(min_row=1):
-                if col_value_index > len(row):
-                    continue  # Value column out of range
+        sheet_names: list[str] = select_sheets(wb.sheetnames, arguments[SHEETS_ARG.name])
+        if len(sheet_names) == 1 or os.path.getsize(filepath) < PARALLEL_MIN_FILE_SIZE:
+            for sheet_name in sheet_names:
+                yield from iter_sheet(wb[sheet_name], col_value_index, col_id_index, sheet_name)
+            return
+    except Exception as e:
+        show_parsing_error(filepath, e)
+        raise
+    finally:
+        wb.close()
 
-                cell_value = row[col_value_index - 1]
+    if sheet_names:
+        yield from iter_sheets_parallel(filepath, sheet_names, col_value_index, col_id_index)
 
-                if cell_value.value is not None and str(cell_value.value).strip():
-                    if col_id_index is not None and col_id_index <= len(row):
-                        cell_id = row[col_id_index - 1]
-                        row_id: str = str(cell_id.value).strip() if cell_id.value is not None else str(cell_value.row)
-                    else:
-                        row_id = str(cell_value.row)
 
-                    results.append((row_id, str(cell_value.value)))
+def iter_sheet(ws: Any, col_value_index: int, col_id_index: int | None,
+               sheet_name: str | None = None) -> Iterator[tuple[str, str]]:
+    """Read the rows of a sheet opened in read-only mode.
 
-        return results
+    Args:
+        ws (Any): sheet of the workbook
+        col_value_index (int): column of the text (1-based index)
+        col_id_index (int | None): column of the row identifier (1-based index), None for the row number
+        sheet_name (str | None, optional): name of the sheet prefixed to the row identifiers,
+        None for no prefix. Defaults to None.
 
-    except Exception as e:
-        logger.error("Error when parsing the Excel file %s : %s", filepath, e)
-        popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
-                                      QCA.translate("message error",
-                                                    "Error when parsing the Excel file.")
-                                      )
-        return []
+    Yields:
+        Iterator[tuple[str, str]]: (row ID as string, cell content).
+    """
+    min_col: int = min(col_value_index, col_id_index or col_value_index)
+    max_col: int = max(col_value_index, col_id_index or col_value_index)
+    value_offset: int = col_value_index - min_col
+    id_offset: int | None = col_id_index - min_col if col_id_index is not None else None
+    prefix: str = f"{sheet_name}!" if sheet_name is not None else ""
+
+    rows = ws.iter_rows(min_row=1, min_col=min_col, max_col=max_col, values_only=True)
+    for row_number, row in enumerate(rows, start=1):
+        if value_offset >= len(row):
+            continue  # Value column out of range
+
+        value = row[value_offset]
+        if value is not None and str(value).strip():
+            if id_offset is not None and id_offset < len(row) and row[id_offset] is not None:
+                row_id: str = str(row[id_offset]).strip()
+            else:
+                row_id = str(row_number)
+
+            yield prefix + row_id, str(value)
+
+
+def read_sheet(filepath: str, sheet_name: str, col_value_index: int,
+               col_id_index: int | None) -> list[tuple[str, str]]:
+    """Read a sheet of an Excel file, in a process of the pool.
+    Errors are raised to the process reading the file.
+
+    Args:
+        filepath (str): Path to the Excel file (.xlsx).
+        sheet_name (str): name of the sheet, prefixed to the row identifiers
+        col_value_index (int): column of the text (1-based index)
+        col_id_index (int | None): column of the row identifier (1-based index), None for the row number
+
+    Returns:
+        list[tuple[str, str]]: List of (row ID as string, cell content).
+    """
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        return list(iter_sheet(wb[sheet_name], col_value_index, col_id_index, sheet_name))
+    finally:
+        wb.close()
+
+
+def iter_sheets_parallel(filepath: str, sheet_names: list[str], col_value_index: int,
+                         col_id_index: int | None) -> Iterator[tuple[str, str]]:
+    """Read several sheets of an Excel file at the same time, one process by sheet.
+    Each sheet is read whole in its process then sent as a list, so the memory
+    grows with the size of the sheets and not by row like iter_sheet.
+    The sheets not started yet are cancelled if the reading stops, or if a sheet can't be read.
+
+    Args:
+        filepath (str): Path to the Excel file (.xlsx).
+        sheet_names (list[str]): names of the sheets, in the order they are yielded
+        col_value_index (int): column of the text (1-based index)
+        col_id_index (int | None): column of the row identifier (1-based index), None for the row number
+
+    Raises:
+        Exception: error of the reading of a sheet, once shown
+
+    Yields:
+        Iterator[tuple[str, str]]: (row ID as string, cell content).
+    """
+    # spawn and not fork, the app runs threads (LanguageTool, Qt) that a fork would copy in a bad state
+    executor = ProcessPoolExecutor(max_workers=min(len(sheet_names), os.cpu_count() or 1),
+                                   mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures: list[Future[list[tuple[str, str]]]] = [
+            executor.submit(read_sheet, filepath, sheet_name, col_value_index, col_id_index)
+            for sheet_name in sheet_names
+        ]
+        for sheet_name, future in zip(sheet_names, futures):
+            try:
+                lines: list[tuple[str, str]] = future.result()
+            except Exception as e:
+                show_parsing_error(f"{filepath} ({sheet_name})", e)
+                raise
+            logger.info("Sheet %s of %s read, %d lines.", sheet_name, filepath, len(lines))
+            yield from lines
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def select_sheets(sheet_names: list[str], sheets: str) -> list[str]:
+    """Get the sheets asked by the sheets argument.
+    A value is a sheet name, else a sheet number (1-based index).
+
+    Args:
+        sheet_names (list[str]): names of the sheets of the workbook
+        sheets (str): names or numbers separated by "|", or ALL_SHEETS
+
+    Returns:
+        list[str]: names of the sheets, in the order asked, without duplicates
+    """
+    if sheets.strip().lower() == ALL_SHEETS:
+        return list(sheet_names)
+
+    selected: list[str] = []
+    for value in (val.strip() for val in sheets.split("|") if val.strip()):
+        if value in sheet_names:
+            sheet_name: str = value
+        elif value.isdigit() and 1 <= int(value) <= len(sheet_names):
+            sheet_name = sheet_names[int(value) - 1]
+        else:
+            logger.error("Sheet %s not found in the Excel file.", value)
+            popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
+                                          QCA.translate("message error",
+                                                        f"Sheet {value} not found in the Excel file.")
+                                          )
+            continue
+        if sheet_name not in selected:
+            selected.append(sheet_name)
+    return selected
+
+
+def show_parsing_error(filepath: str, error: Exception) -> None:
+    """Log and show an error of the reading of an Excel file.
+
+    Args:
+        filepath (str): Path to the Excel file (.xlsx).
+        error (Exception): error raised
+    """
+    logger.error("Error when parsing the Excel file %s : %s", filepath, error)
+    popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
+                                  QCA.translate("message error",
+                                                "Error when parsing the Excel file.")
+                                  )
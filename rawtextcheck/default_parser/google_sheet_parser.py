@@ -85,6 +85,10 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                 - "col": Column letter (e.g., "A") to parse.
                 - "colID": Optional column letter for row identifier (default is the row number).
 
+    Raises:
+        RuntimeError: the google sheet can't be read, once shown, so the check
+        of the file is stopped and not saved as complete.
+
     Returns:
         list[tuple[str, str]]: List of (row ID as string, cell content).
     """
@@ -104,16 +108,19 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
     id_sheet: str = extract_id_from_url(filepath)
 
     spreadsheet: Spreadsheet | None = google_sheet_api.open_spreadsheet(id_sheet)
-    if spreadsheet is None:
-        return []
-
-    worksheet: Worksheet | None = google_sheet_api.open_worksheet(spreadsheet, 0)
-    if worksheet is None:
-        return []
-
-    values: list[list[str]] | None = google_sheet_api.get_worksheet_values(worksheet)
+    worksheet: Worksheet | None = None
+    if spreadsheet is not None:
+        worksheet = google_sheet_api.open_worksheet(spreadsheet, 0)
+    values: list[list[str]] | None = None
+    if worksheet is not None:
+        values = google_sheet_api.get_worksheet_values(worksheet)
     if values is None:
-        return []
+        logger.error("Error when reading the google sheet %s.", filepath)
+        popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
+                                      QCA.translate("message error",
+                                                    "Error when reading the google sheet.")
+                                      )
+        raise RuntimeError(f"Google sheet {filepath} can't be read.")
 
     results: list[tuple[str, str]] = []
 
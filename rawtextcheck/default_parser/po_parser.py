@@ -43,6 +43,10 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
         keys:
             - "id": Optional identifier for the row, can be "line" or "msgid".
 
+    Raises:
+        Exception: error of the reading of the file, once shown, so the check
+        of the file is stopped and not saved as complete.
+
     Returns:
         list[tuple[str, str]]: List of (row identifier, msgstr).
     """
@@ -70,4 +74,4 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                       QCA.translate("message error",
                                                     "Error when parsing the PO file.")
                                       )
-        return []
+        raise
@@ -4,12 +4,13 @@ Author      : Silous
 Created on  : 2025-07-19
 Description : Parser for plain text files.
 
-This module provides a function to parse a text file and return its non-empty lines.
-This parser acts as a default parser for text files.
+This module provides a function to parse a text file and return its non-empty lines,
+read one by one by iter_file. This parser acts as a default parser for text files.
 """
 
 # == Imports ==================================================================
 
+from collections.abc import Iterator
 from logging import Logger
 
 from PyQt5.QtCore import QCoreApplication as QCA
@@ -44,6 +45,25 @@ logger: Logger = get_logger(__name__)
 def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]]:
     """Parse a file and return each non-empty line with its line number.
 
+    Args:
+        filepath (str): Path of the file.
+        arguments (dict[str, str]): Specific argument for this file, see iter_file.
+
+    Returns:
+        list[tuple[str, str]]: List of tuples (line number as string, line content),
+        empty if the file can't be read.
+    """
+    try:
+        return list(iter_file(filepath, arguments))
+    except Exception:
+        return []
+
+
+def iter_file(filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+    """Read a file and yield each non-empty line with its line number.
+    If the file is not valid UTF-8, the error is shown and raised after the lines read
+    before it, so the check of the file is stopped and not saved as complete.
+
     Args:
         filepath (str): Path of the file.
         arguments (dict[str, str]): Specific argument for this file.
@@ -57,8 +77,11 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
             - "contains": Optional substring that each line must contain.
             - "notContains": Optional substring that each line must not contain.
 
-    Returns:
-        list[tuple[str, str]]: List of tuples (line number as string, line content).
+    Raises:
+        Exception: error of the reading of the file, once shown
+
+    Yields:
+        Iterator[tuple[str, str]]: tuples (line number as string, line content).
     """
     begin_line_number = None
     if BEGIN_LINE_NUMBER.name in arguments.keys():
@@ -99,7 +122,6 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
         not_contains_vals = [val.strip() for val in arguments[NOT_CONTAINS.name].split("|") if val.strip()]
 
     is_begin_text_found = False
-    lines: list[tuple[str, str]] = []
 
     try:
         with open(filepath, "r", encoding="utf-8") as f:
@@ -129,9 +151,7 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
 
                 stripped: str = line.strip()
                 if stripped:
-                    lines.append((str(i), stripped))
-
-        return lines
+                    yield str(i), stripped
     except UnicodeDecodeError as e:
         logger.error("Error when parsing the textfile %s : %s", filepath, e)
         popup_manager.show_error.emit(QCA.translate("window title", "Parser Error"),
@@ -139,4 +159,4 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                                     "Error when parsing the text file. "
                                                     "The file might not be a valid UTF-8 text file.")
                                       )
-        return lines
+        raise
@@ -6,13 +6,17 @@ Description : Parser for xml files.
 
 This module provides a function to parse an xml file and return its non-empty lines.
 This parser acts as a default parser for xml files.
+
+The file is read by chunks with expat, the parser used by ElementTree, without
+building the tree: only the text of the element being read is kept, and the line
+of each element is the line of its start tag given by expat.
 """
 
 # == Imports ==================================================================
 
+from collections.abc import Iterator
 from logging import Logger
-import xml.etree.ElementTree as ET
-import xml.sax.saxutils as saxutils
+from xml.parsers import expat
 
 from PyQt5.QtCore import QCoreApplication as QCA
 
@@ -29,30 +33,139 @@ ID_ATTR_ARG = ParserArgument(name="idAttr", optional=True)
 
 LIST_ARGUMENTS: list[ParserArgument] = [TAG_ARG, ATTR_ARG, ID_ATTR_ARG]
 
+READ_CHUNK_SIZE = 64 * 1024
+"""Number of bytes of the file given to the parser at a time"""
+
 
 # == Global Variables =========================================================
 
 logger: Logger = get_logger(__name__)
 
 
+# == Classes ==================================================================
+
+class TagReader:
+    """Handlers of expat keeping the texts or attributes of the elements of a tag.
+    Tags and attributes are named like in ElementTree, "{namespace}name" for a name with a namespace.
+    Attributes:
+        lines (list[tuple[str, str]]): (row ID, value) found since the last read, in document order
+    """
+
+    def __init__(self, tag: str, attr: str | None, id_attr: str | None) -> None:
+        """Initialize the reader.
+
+        Args:
+            tag (str): tag of the elements to read
+            attr (str | None): attribute to read instead of the text, None for the text
+            id_attr (str | None): attribute used as row identifier, None for the line number
+        """
+        self.lines: list[tuple[str, str]] = []
+        self._tag: str = tag
+        self._attr: str | None = attr
+        self._id_attr: str | None = id_attr
+        self._parser = expat.ParserCreate(namespace_separator="}")
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+        self._parser.CharacterDataHandler = self._character_data
+        # row ID of the element whose text is read, and the parts of its text
+        self._text_row_id: str | None = None
+        self._text: list[str] = []
+
+    def feed(self, data: bytes, is_final: bool = False) -> None:
+        """Give the next bytes of the file to the parser.
+
+        Args:
+            data (bytes): next bytes of the file
+            is_final (bool, optional): True for the end of the file. Defaults to False.
+
+        Raises:
+            expat.ExpatError: if the file is not a valid XML file
+        """
+        self._parser.Parse(data, is_final)
+
+    def _start_element(self, name: str, attributes: dict[str, str]) -> None:
+        """Start tag read by expat."""
+        # the text of an element stops at its first child
+        self._end_text()
+        if to_element_tree_name(name) != self._tag:
+            return
+        attributes = {to_element_tree_name(key): value for key, value in attributes.items()}
+
+        if self._id_attr and self._id_attr in attributes:
+            row_id: str = attributes[self._id_attr].strip()
+        else:
+            row_id = str(self._parser.CurrentLineNumber)
+
+        if self._attr:
+            self._add_line(row_id, attributes.get(self._attr, ""))
+        else:
+            self._text_row_id = row_id
+
+    def _end_element(self, name: str) -> None:
+        """End tag read by expat."""
+        self._end_text()
+
+    def _character_data(self, data: str) -> None:
+        """Text read by expat."""
+        if self._text_row_id is not None:
+            self._text.append(data)
+
+    def _end_text(self) -> None:
+        """Add the text of the element being read."""
+        if self._text_row_id is not None:
+            self._add_line(self._text_row_id, "".join(self._text))
+            self._text_row_id = None
+            self._text = []
+
+    def _add_line(self, row_id: str, value: str) -> None:
+        """Add a value if it is not empty.
+
+        Args:
+            row_id (str): row identifier
+            value (str): text or attribute of the element
+        """
+        value = value.strip()
+        if value:
+            self.lines.append((row_id, value))
+
+
 # == Functions ================================================================
 
-def build_line_map(filepath: str) -> dict[int, str]:
-    """Build a mapping of line numbers to raw content (stripped).
+def to_element_tree_name(name: str) -> str:
+    """Convert a name given by expat, "namespace}name", to the name of ElementTree.
 
     Args:
-        filepath (str): Path to the XML file.
+        name (str): tag or attribute name given by expat
+
+    Returns:
+        str: "{namespace}name" for a name with a namespace, else the name
     """
-    line_map: dict[int, str] = {}
-    with open(filepath, encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            line_map[i] = saxutils.unescape(line.rstrip("\n"))
-    return line_map
+    return "{" + name if "}" in name else name
 
 
 def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]]:
     """Parse an XML file and return non-empty texts with a row identifier.
 
+    Args:
+        filepath (str): Path to the XML file.
+        arguments (dict[str, str]): Parser arguments, see iter_file.
+
+    Returns:
+        list[tuple[str, str]]: List of (row ID as string, text/attribute content),
+        empty if the file can't be read.
+    """
+    try:
+        return list(iter_file(filepath, arguments))
+    except Exception:
+        return []
+
+
+def iter_file(filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+    """Read an XML file by chunks and yield non-empty texts with a row identifier.
+    If the file is not valid, the error is shown and raised after the lines read
+    before it, so the check of the file is stopped and not saved as complete.
+
     Args:
         filepath (str): Path to the XML file.
         arguments (dict[str, str]): Parser arguments.
@@ -60,10 +173,13 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                 - "tag": The XML element tag to extract.
                 - "attr": (optional) Attribute name to extract instead of element text.
                 - "idAttr": (optional) Attribute name to use as row identifier.
-                           Defaults to line number in the file.
+                           Defaults to the line of the element in the file.
 
-    Returns:
-        list[tuple[str, str]]: List of (row ID as string, text/attribute content).
+    Raises:
+        Exception: error of the reading of the file, once shown
+
+    Yields:
+        Iterator[tuple[str, str]]: (row ID as string, text/attribute content).
     """
     try:
         tag: str = arguments[TAG_ARG.name]
@@ -75,36 +191,18 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                       QCA.translate("message error",
                                                     f"Missing required argument {TAG_ARG.name}")
                                       )
-        return []
+        return
 
-    results: list[tuple[str, str]] = []
+    reader = TagReader(tag, attr, id_attr)
     try:
-        line_map: dict[int, str] = build_line_map(filepath)
-
-        tree: ET.ElementTree[ET.Element[str]] = ET.parse(filepath)
-        root: ET.Element[str] = tree.getroot()
-
-        for elem in root.iter(tag):
-            if attr:
-                value: str = elem.attrib.get(attr, "").strip()
-            else:
-                value = (elem.text or "").strip()
-
-            if not value:
-                continue
-
-            if id_attr and id_attr in elem.attrib:
-                row_id: str = elem.attrib[id_attr].strip()
-            else:
-                row_id = "?"
-                for line_no, raw in line_map.items():
-                    if f"<{tag}" in raw and value in raw:
-                        row_id = str(line_no)
-                        break
-
-            results.append((row_id, value))
-
-        return results
+        with open(filepath, "rb") as f:
+            while True:
+                data: bytes = f.read(READ_CHUNK_SIZE)
+                reader.feed(data, is_final=not data)
+                yield from reader.lines
+                reader.lines = []
+                if not data:
+                    break
 
     except Exception as e:
         logger.error("Error when parsing the XML file %s : %s", filepath, e)
@@ -112,4 +210,4 @@ def parse_file(filepath: str, arguments: dict[str, str]) -> list[tuple[str, str]
                                       QCA.translate("message error",
                                                     "Error when parsing the XML file.")
                                       )
-        return []
+        raise
@@ -10,6 +10,7 @@ This script initializes the application, sets up the main window, and starts the
 
 # == Imports ==================================================================
 
+import multiprocessing
 import sys
 
 from PyQt5.QtCore import QTranslator
@@ -22,6 +23,9 @@ from rawtextcheck import startup_translation
 
 if __name__ == "__main__":
 
+    # processes of the parsers started from the packaged app run their task instead of the app
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
 
     translator: QTranslator | None = startup_translation.init_translator()
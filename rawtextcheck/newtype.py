@@ -73,6 +73,48 @@ class ItemResult(TypedDict):
     suggestion: str
 
 
+class ItemResultMetadata(TypedDict):
+    """TypedDict for the metadata of a result file.
+    Attributes:
+        check_mode (str): check mode of the run, CHECK_MODE_FULL or CHECK_MODE_QUICK
+    """
+    check_mode: str
+
+
+class ItemMatch(TypedDict):
+    """TypedDict for a LanguageTool match of one line, as stored in the cache.
+    Attributes:
+        offset (int): Start of the match in the line.
+        length (int): Length of the match.
+        matched_text (str): Text of the match.
+        rule_id (str): LanguageTool rule of the match.
+        rule_issue_type (str): Category of the rule, used to find spelling error.
+        message (str): Explanation of the match.
+        replacements (list[str]): Suggested replacements.
+    """
+    offset: int
+    length: int
+    matched_text: str
+    rule_id: str
+    rule_issue_type: str
+    message: str
+    replacements: list[str]
+
+
+class ItemLanguageToolServer(TypedDict):
+    """TypedDict for the settings of the local LanguageTool servers
+    Attributes:
+        heap_mb (int): maximum Java heap of one server, in MB
+        cache_size (int): number of sentences kept in the cache of one server
+        pipeline_caching (bool): if True, a server reuses its analysis pipelines between requests
+        max_check_threads (int): number of threads analyzing texts in one server
+    """
+    heap_mb: int
+    cache_size: int
+    pipeline_caching: bool
+    max_check_threads: int
+
+
 class ItemConfig(TypedDict):
     """TypedDict for config file
     This class defines the structure of the config file
@@ -81,12 +123,14 @@ class ItemConfig(TypedDict):
         theme (str): theme for the apparence
         hidden_column (list[str]): last config for visibility of column of result table
         last_project (str): name of the last project, to reload it at launch
+        languagetool_server (ItemLanguageToolServer): settings of the LanguageTool servers
         """
     language: str
     theme: str
     hidden_column: list[str]
     last_project: str
     credentials_google: dict[str, str]
+    languagetool_server: ItemLanguageToolServer
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,106 @@
+"""
+File        : banword_matcher.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Matcher finding the banwords and banned phrases of a project in lines.
+
+A banword can be one word or a phrase of several words separated by spaces.
+Words of the text and of the banwords are normalized the same way, punctuation
+around a word can be stripped and the case can be folded. Banwords are stored
+in a trie of normalized words, the children of a node being a dict: a single
+word is found with one hash lookup, and a phrase is followed word by word from
+where its first word is found. Each line is split and scanned once, so the cost
+does not depend on the number of banwords.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Iterable, Iterator
+
+from rawtextcheck.default_parameters import (
+    BANWORD_CASE_FOLD,
+    BANWORD_PUNCTUATION,
+    BANWORD_STRIP_PUNCTUATION
+    )
+
+
+# == Classes ==================================================================
+
+class BanwordMatcher:
+    """Find banwords and banned phrases in lines.
+    Attributes:
+        case_fold (bool): if True, the case is ignored
+        strip_punctuation (bool): if True, punctuation around words is ignored
+    """
+
+    def __init__(self, banwords: Iterable[str],
+                 case_fold: bool = BANWORD_CASE_FOLD,
+                 strip_punctuation: bool = BANWORD_STRIP_PUNCTUATION) -> None:
+        """Compile the matcher.
+
+        Args:
+            banwords (Iterable[str]): banwords and banned phrases, empty ones are ignored
+            case_fold (bool, optional): if True, the case is ignored.
+            Defaults to BANWORD_CASE_FOLD.
+            strip_punctuation (bool, optional): if True, punctuation around words is ignored.
+            Defaults to BANWORD_STRIP_PUNCTUATION.
+        """
+        self.case_fold: bool = case_fold
+        self.strip_punctuation: bool = strip_punctuation
+
+        # normalized word -> child node, the key None holds the banword ending at this node
+        self._root: dict = {}
+        for banword in banwords:
+            words: list[str] = [self.normalize(word) for word in banword.split()]
+            if not words:
+                continue
+            node: dict = self._root
+            for word in words:
+                node = node.setdefault(word, {})
+            node.setdefault(None, banword)
+
+    def __bool__(self) -> bool:
+        """True if the matcher has at least one banword."""
+        return bool(self._root)
+
+    def normalize(self, word: str) -> str:
+        """Normalize a word of the text or of a banword.
+        A word made only of punctuation is kept as it is.
+
+        Args:
+            word (str): the word
+
+        Returns:
+            str: the normalized word
+        """
+        if self.strip_punctuation:
+            word = word.strip(BANWORD_PUNCTUATION) or word
+        if self.case_fold:
+            word = word.casefold()
+        return word
+
+    def finditer(self, line: str) -> Iterator[str]:
+        """Find every banword of a line, in the order of the text.
+        Overlapping banwords are all found.
+
+        Args:
+            line (str): text of the line
+
+        Yields:
+            str: the banword found, as written in the banwords
+        """
+        if not self._root:
+            return
+        words: list[str] = [self.normalize(word) for word in line.split()]
+        root: dict = self._root
+        for index, word in enumerate(words):
+            node: dict | None = root.get(word)
+            next_index: int = index + 1
+            while node is not None:
+                if None in node:
+                    yield node[None]
+                if next_index == len(words):
+                    break
+                node = node.get(words[next_index])
+                next_index += 1
@@ -0,0 +1,138 @@
+"""
+File        : batcher.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Batching of lines sent to LanguageTool, sized from observed timings.
+
+Lines are packed into batches limited by a number of characters and a number
+of lines, a line is never split. After each request, the time taken gives the
+throughput of LanguageTool on this machine, and the character budget is moved
+toward the size that would be analyzed in the target time. A failed request
+halves the budget, as it is often a timeout of a too large request.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Iterator
+from logging import Logger
+
+from rawtextcheck.default_parameters import (
+    LANGUAGETOOL_INITIAL_CHARS_PER_BATCH,
+    LANGUAGETOOL_MAX_CHARS_PER_BATCH,
+    LANGUAGETOOL_MAX_LINES_PER_BATCH,
+    LANGUAGETOOL_MIN_CHARS_PER_BATCH,
+    LANGUAGETOOL_TARGET_SECONDS_PER_BATCH
+    )
+from rawtextcheck.logger import get_logger
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+
+# == Classes ==================================================================
+
+class AdaptiveBatcher:
+    """Pack lines into batches, with a character budget adjusted from the time of each request.
+    Attributes:
+        char_budget (int): current maximum number of characters of a batch
+        max_lines (int): maximum number of lines of a batch
+        min_chars (int): lowest value of the character budget
+        max_chars (int): highest value of the character budget
+        target_seconds (float): wanted time of a request
+    """
+
+    MAX_GROWTH: float = 2.0
+    """Highest factor applied to the budget after one request"""
+
+    def __init__(self,
+                 char_budget: int = LANGUAGETOOL_INITIAL_CHARS_PER_BATCH,
+                 max_lines: int = LANGUAGETOOL_MAX_LINES_PER_BATCH,
+                 min_chars: int = LANGUAGETOOL_MIN_CHARS_PER_BATCH,
+                 max_chars: int = LANGUAGETOOL_MAX_CHARS_PER_BATCH,
+                 target_seconds: float = LANGUAGETOOL_TARGET_SECONDS_PER_BATCH) -> None:
+        """Initialize the batcher.
+
+        Args:
+            char_budget (int, optional): character budget of the first batch.
+            Defaults to LANGUAGETOOL_INITIAL_CHARS_PER_BATCH.
+            max_lines (int, optional): maximum number of lines of a batch.
+            Defaults to LANGUAGETOOL_MAX_LINES_PER_BATCH.
+            min_chars (int, optional): lowest value of the character budget.
+            Defaults to LANGUAGETOOL_MIN_CHARS_PER_BATCH.
+            max_chars (int, optional): highest value of the character budget.
+            Defaults to LANGUAGETOOL_MAX_CHARS_PER_BATCH.
+            target_seconds (float, optional): wanted time of a request.
+            Defaults to LANGUAGETOOL_TARGET_SECONDS_PER_BATCH.
+        """
+        self.min_chars: int = min_chars
+        self.max_chars: int = max_chars
+        self.max_lines: int = max_lines
+        self.target_seconds: float = target_seconds
+        self.char_budget: int = self._clamp(char_budget)
+
+    def _clamp(self, char_budget: float) -> int:
+        """Keep a budget between the minimum and the maximum.
+
+        Args:
+            char_budget (float): wanted budget
+
+        Returns:
+            int: budget to use
+        """
+        return int(max(self.min_chars, min(self.max_chars, char_budget)))
+
+    def batches(self, texts: list[tuple[str, str]]) -> Iterator[list[tuple[str, str]]]:
+        """Split the lines into batches.
+        The budget is read when each batch starts, so a budget changed
+        by record() is used from the next batch.
+
+        Args:
+            texts (list[tuple[str, str]]): list of every [line number, line text]
+
+        Yields:
+            list[tuple[str, str]]: lines of a batch
+        """
+        start: int = 0
+        while start < len(texts):
+            end: int = start
+            # a line is joined to the previous one with a line break
+            size: int = -1
+            while end < len(texts) and end - start < self.max_lines:
+                line_size: int = len(texts[end][1]) + 1
+                if end > start and size + line_size > self.char_budget:
+                    break
+                size += line_size
+                end += 1
+            yield texts[start:end]
+            start = end
+
+    def record(self, chars: int, seconds: float) -> None:
+        """Adjust the budget from the time of a request.
+
+        Args:
+            chars (int): number of characters of the request
+            seconds (float): time taken by the request
+        """
+        if chars <= 0:
+            return
+        if seconds <= 0:
+            ideal: float = self.char_budget * self.MAX_GROWTH
+        else:
+            ideal = chars / seconds * self.target_seconds
+        # half way toward the ideal size, to smooth the variations between requests
+        wanted: float = min((self.char_budget + ideal) / 2, self.char_budget * self.MAX_GROWTH)
+        old_budget: int = self.char_budget
+        self.char_budget = self._clamp(wanted)
+        if self.char_budget != old_budget:
+            logger.info("LanguageTool batch budget %d -> %d characters (%d characters in %.2f s)",
+                        old_budget, self.char_budget, chars, seconds)
+
+    def record_failure(self) -> None:
+        """Halve the budget after a failed request."""
+        old_budget: int = self.char_budget
+        self.char_budget = self._clamp(self.char_budget / 2)
+        logger.info("LanguageTool batch budget %d -> %d characters after a failure",
+                    old_budget, self.char_budget)
@@ -0,0 +1,76 @@
+"""
+File        : cancellation.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Token to stop a long task from another thread.
+
+The UI cancels the token, the task checks it between two steps (a chunk of lines,
+a batch sent to LanguageTool...) and returns early, so it stops after the step
+running when it was cancelled.
+"""
+
+
+# == Imports ==================================================================
+
+import threading
+import time
+
+
+# == Classes ==================================================================
+
+class CancellationToken:
+    """Flag telling a task to stop, safe to use from several threads."""
+
+    def __init__(self) -> None:
+        """Initialize the token, not cancelled."""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the task to stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True if the task was asked to stop."""
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until the task is asked to stop, or the timeout is over.
+
+        Args:
+            timeout (float): maximum time to wait, in seconds
+
+        Returns:
+            bool: True if the task was asked to stop
+        """
+        return self._event.wait(timeout)
+
+
+# == Functions ================================================================
+
+def is_cancelled(token: CancellationToken | None) -> bool:
+    """Check a token that can be missing.
+
+    Args:
+        token (CancellationToken | None): token of the task, None if it can't be cancelled
+
+    Returns:
+        bool: True if the task was asked to stop
+    """
+    return token is not None and token.cancelled
+
+
+def wait_cancelled(token: CancellationToken | None, timeout: float) -> bool:
+    """Wait for a delay, ended early if the token is cancelled.
+
+    Args:
+        token (CancellationToken | None): token of the task, None if it can't be cancelled
+        timeout (float): delay in seconds
+
+    Returns:
+        bool: True if the task was asked to stop
+    """
+    if token is None:
+        time.sleep(timeout)
+        return False
+    return token.wait(timeout)
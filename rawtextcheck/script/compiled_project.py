@@ -0,0 +1,145 @@
+"""
+File        : compiled_project.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Project configuration compiled for the analysis of files.
+
+A CompiledProject is built from an ItemProject: lists become frozensets for
+membership tests, codes and substrings become one TextCleaner compiled once,
+the valid characters an InvalidCharacterFinder and the banwords a BanwordMatcher,
+each compiled once.
+Compiled projects are memoized by project name and by a hash of the content of
+the project entry, so checking several files of the same project compiles
+the project only once, and any change of the configuration is seen at the next check.
+"""
+
+
+# == Imports ==================================================================
+
+from dataclasses import dataclass
+import hashlib
+import json
+from logging import Logger
+
+from rawtextcheck.logger import get_logger
+from rawtextcheck.newtype import ItemProject
+from rawtextcheck.script import json_projects
+from rawtextcheck.script.banword_matcher import BanwordMatcher
+from rawtextcheck.script.invalid_characters import InvalidCharacterFinder
+from rawtextcheck.script.text_matcher import TextCleaner
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+_compiled_projects: dict[str, tuple[str, "CompiledProject"]] = {}
+"""Cache of compiled projects, project name -> (hash of the entry, compiled project)"""
+
+
+# == Classes ==================================================================
+
+@dataclass(frozen=True)
+class CompiledProject:
+    """Project configuration ready to be used on every line of a file.
+    Attributes:
+        language (str): The language code for the project.
+        parser (str): The parser used for the project.
+        dictionary (frozenset[str]): Words of the project's dictionary.
+        ignored_rules (frozenset[str]): LanguageTool rules to ignore.
+        cleaner (TextCleaner): Replace codes, ignored codes and ignored substrings.
+        invalid_character_finder (InvalidCharacterFinder): Lookup table of the valid characters.
+        banword_matcher (BanwordMatcher): Trie of the banwords.
+    """
+    language: str
+    parser: str
+    dictionary: frozenset[str]
+    ignored_rules: frozenset[str]
+    cleaner: TextCleaner
+    invalid_character_finder: InvalidCharacterFinder
+    banword_matcher: BanwordMatcher
+
+    def clean_texts(self, texts: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Clean every line, lines empty after cleaning are removed.
+
+        Args:
+            texts (list[tuple[str, str]]): list of every [line number, line text]
+
+        Returns:
+            list[tuple[str, str]]: cleaned texts
+        """
+        cleaned_texts: list[tuple[str, str]] = []
+        for line_number, line in texts:
+            line = self.cleaner.sub(line)
+            if line:
+                cleaned_texts.append((line_number, line))
+        return cleaned_texts
+
+
+# == Functions ================================================================
+
+def hash_project_data(project_data: ItemProject) -> str:
+    """Hash the content of a project entry.
+
+    Args:
+        project_data (ItemProject): data of the project
+
+    Returns:
+        str: hexadecimal digest of the entry
+    """
+    content: str = json.dumps(project_data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compile_project(project_data: ItemProject) -> CompiledProject:
+    """Compile the data of a project.
+
+    Args:
+        project_data (ItemProject): data of the project
+
+    Returns:
+        CompiledProject: compiled project
+    """
+    return CompiledProject(
+        language=project_data["language"],
+        parser=project_data["parser"],
+        dictionary=frozenset(project_data["dictionary"]),
+        ignored_rules=frozenset(project_data["ignored_rules"]),
+        cleaner=TextCleaner(project_data["replace_codes"],
+                            project_data["ignored_codes_into_space"],
+                            project_data["ignored_codes_into_nothing"],
+                            project_data["ignored_substrings_into_space"],
+                            project_data["ignored_substrings_into_nothing"]),
+        invalid_character_finder=InvalidCharacterFinder(project_data["valid_characters"]),
+        banword_matcher=BanwordMatcher(project_data["banwords"])
+    )
+
+
+def get_compiled_project(project_name: str) -> CompiledProject | None:
+    """Get the compiled project, compiled again only if its entry changed.
+
+    Args:
+        project_name (str): id of the project
+
+    Returns:
+        CompiledProject | None: compiled project, None if the project does not exist
+    """
+    project_data: ItemProject | None = json_projects.get_project_data(project_name)
+    if project_data is None:
+        _compiled_projects.pop(project_name, None)
+        return None
+
+    project_hash: str = hash_project_data(project_data)
+    cached: tuple[str, CompiledProject] | None = _compiled_projects.get(project_name)
+    if cached is not None and cached[0] == project_hash:
+        return cached[1]
+
+    compiled: CompiledProject = compile_project(project_data)
+    _compiled_projects[project_name] = (project_hash, compiled)
+    logger.info("Compiled configuration of project %s.", project_name)
+    return compiled
+
+
+def clear_cache() -> None:
+    """Remove every compiled project from the cache."""
+    _compiled_projects.clear()
@@ -0,0 +1,103 @@
+"""
+File        : invalid_characters.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Detection of the characters not in the valid characters of a project.
+
+Every line is checked in one operation instead of one membership test per character.
+With NumPy, the lines are joined into one buffer of code points, tested against a
+boolean lookup table, and each invalid position is mapped back to its line with
+the array of line ends. Without NumPy, the valid characters are deleted from each
+line with str.translate, and what is left are the invalid characters, in order.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Iterable
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# == Classes ==================================================================
+
+class InvalidCharacterFinder:
+    """Find the characters of lines that are not valid characters.
+    Attributes:
+        valid_characters (frozenset[str]): valid characters
+    """
+
+    def __init__(self, valid_characters: Iterable[str]) -> None:
+        """Compile the lookup tables.
+
+        Args:
+            valid_characters (Iterable[str]): valid characters, as a str or a set
+        """
+        self.valid_characters: frozenset[str] = frozenset(valid_characters)
+        self._delete_table: dict[int, None] = {ord(c): None for c in self.valid_characters}
+
+        self._lookup = None
+        if np is not None:
+            size: int = max(self._delete_table, default=0) + 1
+            self._lookup = np.zeros(size, dtype=np.bool_)
+            self._lookup[list(self._delete_table)] = True
+
+    def find(self, lines: list[str]) -> list[tuple[int, str]]:
+        """Find every invalid character of the lines.
+
+        Args:
+            lines (list[str]): text of each line
+
+        Returns:
+            list[tuple[int, str]]: index of the line and invalid character,
+            one item per occurrence, in the order of the text
+        """
+        if self._lookup is not None:
+            return self._find_numpy(lines)
+        return self._find_translate(lines)
+
+    def _find_translate(self, lines: list[str]) -> list[tuple[int, str]]:
+        """Find every invalid character, by deleting the valid ones of each line.
+
+        Args:
+            lines (list[str]): text of each line
+
+        Returns:
+            list[tuple[int, str]]: index of the line and invalid character
+        """
+        found: list[tuple[int, str]] = []
+        delete_table: dict[int, None] = self._delete_table
+        for index, line in enumerate(lines):
+            for c in line.translate(delete_table):
+                found.append((index, c))
+        return found
+
+    def _find_numpy(self, lines: list[str]) -> list[tuple[int, str]]:
+        """Find every invalid character, with a lookup table on the code points of every line.
+
+        Args:
+            lines (list[str]): text of each line
+
+        Returns:
+            list[tuple[int, str]]: index of the line and invalid character
+        """
+        buffer: str = "".join(lines)
+        if not buffer:
+            return []
+        codes = np.frombuffer(buffer.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        lookup = self._lookup
+        size: int = len(lookup)
+        # code points beyond the table can't be valid
+        invalid = codes >= size
+        invalid |= ~lookup[np.minimum(codes, size - 1)]
+        positions = np.flatnonzero(invalid)
+        if not len(positions):
+            return []
+
+        line_ends: list[int] = list(accumulate(len(line) for line in lines))
+        line_indexes = np.searchsorted(np.asarray(line_ends), positions, side="right")
+        return [(index, buffer[position]) for index, position in zip(line_indexes.tolist(), positions.tolist())]
@@ -7,7 +7,8 @@ Description : Manage config file of the software.
 The config file is a json with one ItemConfig.
 It defines app language and theme, and has 2 parameters to remember
 last state of the UI: the project selected and the column hidden in
-the tableresult.
+the tableresult. It also keeps the settings of the LanguageTool servers,
+set from the RAM and the cores when the file is created.
 """
 
 # == Imports ==================================================================
@@ -20,7 +21,8 @@ from PyQt5.QtCore import QCoreApplication as QCA
 
 from rawtextcheck.default_parameters import CONFIG_FOLDER, JSON_CONFIG_PATH, LANGUAGES, THEMES
 from rawtextcheck.logger import get_logger
-from rawtextcheck.newtype import ItemConfig
+from rawtextcheck.newtype import ItemConfig, ItemLanguageToolServer
+from rawtextcheck.script.languagetool_settings import default_server_settings
 from rawtextcheck.ui.messagebox import Popup
 
 
@@ -44,7 +46,8 @@ def create_json() -> None:
                                   theme=THEMES[0][0],
                                   hidden_column=[],
                                   last_project="",
-                                  credentials_google={})
+                                  credentials_google={},
+                                  languagetool_server=default_server_settings())
     save_data(data)
     logger.info("Created %s.", JSON_CONFIG_PATH)
 
@@ -134,6 +137,31 @@ def set_credentials_google(credentials: dict[str, str]) -> None:
                )
 
 
+def get_languagetool_server() -> ItemLanguageToolServer:
+    """Get the settings of the LanguageTool servers.
+    The settings missing from the file, as in a file created by an older version,
+    are set from the RAM and the cores.
+
+    Returns:
+        ItemLanguageToolServer: settings of the servers
+    """
+    settings: ItemLanguageToolServer = default_server_settings()
+    settings.update(load_data().get("languagetool_server", {}))
+    return settings
+
+
+def set_languagetool_server(settings: ItemLanguageToolServer) -> None:
+    """Update the settings of the LanguageTool servers, used by the servers started after.
+
+    Args:
+        settings (ItemLanguageToolServer): settings of the servers
+    """
+    data: ItemConfig = load_data()
+    data["languagetool_server"] = settings
+    save_data(data)
+    logger.info("App configuration LanguageTool servers set to %s", data["languagetool_server"])
+
+
 def load_imported_credentials(filepath: str) -> dict[str, str] | None:
     """Load credentials from a JSON file.
     Args:
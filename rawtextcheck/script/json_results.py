@@ -27,13 +27,14 @@ Dependencies:
 
 # == Imports ==================================================================
 
+from collections.abc import Container
 import json
 from logging import Logger
 import os
 
-from rawtextcheck.default_parameters import RESULTS_FOLDER
+from rawtextcheck.default_parameters import RESULTS_FOLDER, RESULTS_METADATA_FOLDER
 from rawtextcheck.logger import get_logger
-from rawtextcheck.newtype import ItemResult
+from rawtextcheck.newtype import ItemResult, ItemResultMetadata
 from rawtextcheck.script.utils import sanitize_folder_name
 
 
@@ -66,7 +67,49 @@ def save_data(project_name: str, filename: str, data: dict[str, ItemResult]) ->
     logger.info("Result of %s from project %s saved.", filename, project_name)
 
 
-def generate_id_errors(result: list[ItemResult]) -> dict[str, ItemResult]:
+def save_metadata(project_name: str, filename: str, metadata: ItemResultMetadata) -> None:
+    """save the metadata of a result, in a json file of the same name
+    in the metadata folder of the project
+
+    Args:
+        project_name (str): id of the project
+        filename (str): name of the file
+        metadata (ItemResultMetadata): metadata to save
+    """
+    filename = sanitize_folder_name(filename)
+    folderpath: str = os.path.join(RESULTS_FOLDER,
+                                   sanitize_folder_name(project_name),
+                                   RESULTS_METADATA_FOLDER)
+    os.makedirs(folderpath, exist_ok=True)
+
+    with open(os.path.join(folderpath, filename + JSON_EXT), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=4)
+
+
+def get_metadata(project_name: str, filename: str) -> ItemResultMetadata | None:
+    """get the metadata of a result
+    The metadata left by a result deleted since is deleted.
+
+    Args:
+        project_name (str): id of the project
+        filename (str): name of the file
+
+    Returns:
+        ItemResultMetadata | None: metadata, None if the result has none
+    """
+    filepath: str = os.path.join(RESULTS_FOLDER, sanitize_folder_name(project_name),
+                                 RESULTS_METADATA_FOLDER, sanitize_folder_name(filename) + JSON_EXT)
+    if not os.path.isfile(filepath):
+        return None
+    if not is_result_exists(project_name, filename):
+        os.remove(filepath)
+        logger.info("Metadata of deleted result %s from project %s deleted.", filename, project_name)
+        return None
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generate_id_errors(result: list[ItemResult], used_ids: Container[str] = ()) -> dict[str, ItemResult]:
     """generate the id of the errors
     ex: 1a, 1b, 2a, 3a, 3b, 3c, 3d
     where 1, 2, 3 are the line numbers and
@@ -74,6 +117,8 @@ def generate_id_errors(result: list[ItemResult]) -> dict[str, ItemResult]:
 
     Args:
         result (list[ItemResult]): list of errors
+        used_ids (Container[str], optional): ids of the errors found before, not given again.
+        Defaults to ().
 
     Returns:
         dict[str, ItemResult]: dictionary with the id as key
@@ -82,10 +127,10 @@ def generate_id_errors(result: list[ItemResult]) -> dict[str, ItemResult]:
 
     for item in result:
         id_error: str = f"{item['line_number']}a"
-        if id_error in data:
+        if id_error in data or id_error in used_ids:
             # if the id already exists, increment the letter
             i: int = 1
-            while id_error in data:
+            while id_error in data or id_error in used_ids:
                 id_error = f"{item['line_number']}{chr(97 + i)}"
                 i = i + 1
         data[id_error] = item
@@ -153,6 +198,8 @@ def get_folder_data(project_name: str) -> list[tuple[str, dict[str, ItemResult]]
 
     data: list[tuple[str, dict[str, ItemResult]]] = []
     for file in files:
+        if not os.path.isfile(os.path.join(folderpath, file)):
+            continue
         data.append((file, get_file_data(project_name, file)))
 
     return data
@@ -10,137 +10,618 @@ This module provides functions to initialize and use LanguageTool for analyzing
 
 # == Imports ==================================================================
 
+from array import array
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Collection, Container, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+import hashlib
+import json
 from logging import Logger
+import sqlite3
+import threading
+import time
+from typing import Any
+import unicodedata
 
 
 import language_tool_python  # type: ignore
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtCore import QCoreApplication as QCA
 
-from rawtextcheck.default_parameters import LANGUAGETOOL_SPELLING_CATEGORY, LANGUAGETOOL_MAX_LINES_PER_BATCH
-from rawtextcheck.newtype import ItemResult
+from rawtextcheck.default_parameters import (
+    LANGUAGETOOL_MAX_SKIPPED_LINES_SHOWN,
+    LANGUAGETOOL_RETRIES,
+    LANGUAGETOOL_RETRY_DELAY,
+    LANGUAGETOOL_SPELLING_CATEGORY,
+    LANGUAGETOOL_STATE_FAILED,
+    LANGUAGETOOL_STATE_READY,
+    LANGUAGETOOL_STATE_STARTING,
+    LANGUAGETOOL_WARMUP_TEXT
+)
+from rawtextcheck.newtype import ItemLanguageToolServer, ItemMatch, ItemResult
 from rawtextcheck.logger import get_logger
+from rawtextcheck.script import languagetool_cache
+from rawtextcheck.script.batcher import AdaptiveBatcher
+from rawtextcheck.script.cancellation import CancellationToken, is_cancelled, wait_cancelled
+from rawtextcheck.script.languagetool_cache import LanguageToolCache
+from rawtextcheck.script.languagetool_client import utf16_to_index
+from rawtextcheck.script.languagetool_pool import LanguageToolPool, get_pool_size
+from rawtextcheck.script.languagetool_registry import EngineRegistry
+from rawtextcheck.script.languagetool_settings import (
+    apply_java_options,
+    default_memory_budget_mb,
+    estimated_server_memory_mb,
+    to_server_config
+)
 from rawtextcheck.ui.messagebox import popup_manager
 
+
+# == Classes ==================================================================
+
+class EngineStatus(QObject):
+    """State of the LanguageTool servers, shown by the UI.
+    Attributes:
+        language (str): language code of the last servers started
+        state (str): LANGUAGETOOL_STATE_STARTING, LANGUAGETOOL_STATE_READY,
+        LANGUAGETOOL_STATE_FAILED, or empty if no servers were started
+    """
+
+    changed = pyqtSignal(str, str)  # language, state
+
+    def __init__(self) -> None:
+        """Initialize the status, no servers started."""
+        super().__init__()
+        self.language: str = ""
+        self.state: str = ""
+
+    def set_state(self, language: str, state: str) -> None:
+        """Change the state and notify it.
+
+        Args:
+            language (str): language code of the servers
+            state (str): new state
+        """
+        self.language = language
+        self.state = state
+        self.changed.emit(language, state)
+
+
 # == Global Variables =========================================================
 
-tool: language_tool_python.LanguageTool | None = None
+pool: LanguageToolPool | None = None
+"""Pool of the language of the file analyzed"""
+registry: EngineRegistry = EngineRegistry(lambda language: start_pool(language))
+"""Pools of every language kept started"""
+engine_status: EngineStatus = EngineStatus()
+"""State of the LanguageTool servers, for the UI"""
+server_settings: ItemLanguageToolServer | None = None
+"""Settings of the servers started, LanguageTool defaults if None"""
 logger: Logger = get_logger(__name__)
 
 
 # == Functions ================================================================
 
-def initialize_tool(language: str) -> None:
-    """Initialize the global LanguageTool for the specified language.
+def configure_servers(settings: ItemLanguageToolServer) -> None:
+    """Set the settings of the LanguageTool servers started from now on,
+    and the memory budget of the registry from the RAM.
+
+    Args:
+        settings (ItemLanguageToolServer): settings of each server
+    """
+    global server_settings
+    server_settings = settings
+    registry.server_memory_mb = estimated_server_memory_mb(settings)
+    registry.memory_budget_mb = default_memory_budget_mb()
+    java_options: str = apply_java_options(settings)
+    logger.info("LanguageTool servers: %d per language, heap %d MB, cache %d sentences, "
+                "pipeline caching %s, %d check threads (JAVA_TOOL_OPTIONS=%s), memory budget %d MB",
+                get_pool_size(), settings["heap_mb"], settings["cache_size"],
+                settings["pipeline_caching"], settings["max_check_threads"], java_options,
+                registry.memory_budget_mb)
+
+
+def start_pool(language: str) -> LanguageToolPool:
+    """Start a pool of LanguageTool servers for the specified language.
 
     Args:
         language (str): The language code.
+
+    Returns:
+        LanguageToolPool: the started pool
     """
-    global tool
-    if tool is None:
-        try:
-            tool = language_tool_python.LanguageTool(language)
-        except ModuleNotFoundError as e:
-            logger.error(e)
-            popup_manager.show_error.emit(
-                QCA.translate("window title", "LanguageTool Error"),
-                QCA.translate("message error", "Java is not installed or not found.")
-            )
+    config: dict[str, Any] | None = to_server_config(server_settings) if server_settings is not None else None
+    new_pool = LanguageToolPool(language, partial(language_tool_python.LanguageTool, language, config=config),
+                                get_pool_size())
+    new_pool.start()
+    new_pool.warm_up(LANGUAGETOOL_WARMUP_TEXT)
+    return new_pool
+
+
+def prewarm(language: str) -> threading.Thread:
+    """Start the pool of LanguageTool servers of a language in a background thread.
+    The servers analyze a first text when they are started, so the first file
+    is analyzed without waiting for Java and the rules. If a file is processed
+    before the end, initialize_tool waits for the same pool instead of starting another.
+    The other languages and close_tool don't wait for it, a pool closed while it
+    starts is closed at the end of its start.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        threading.Thread: the thread starting the pool
+    """
+    def start() -> None:
+        if language in registry.languages:
+            engine_status.set_state(language, LANGUAGETOOL_STATE_READY)
             return
+        engine_status.set_state(language, LANGUAGETOOL_STATE_STARTING)
+        try:
+            registry.get(language)
         except Exception as e:
-            logger.error("Failed to initialize LanguageTool: %s", e, exc_info=True)
-            popup_manager.show_error.emit(
-                QCA.translate("window title", "LanguageTool Error"),
-                QCA.translate(
-                    "message error",
-                    (
-                        "Failed to initialize LanguageTool. Maybe you don't have the correct Java version. "
-                        "Java 17+ is required."
-                    )
-                )
-            )
+            # the error is shown to the user if a file is processed with this language
+            logger.error("Failed to prewarm LanguageTool with %s language: %s", language, e)
+            engine_status.set_state(language, LANGUAGETOOL_STATE_FAILED)
             return
-        logger.info("Loaded languagetool with %s language.", language)
-    elif tool.language == language:
+        logger.info("Prewarmed languagetool with %s language.", language)
+        engine_status.set_state(language, LANGUAGETOOL_STATE_READY)
+
+    thread = threading.Thread(target=start, name="languagetool-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def initialize_tool(language: str) -> None:
+    """Get the pool of LanguageTool servers of the specified language from the registry.
+    Servers of the other languages are kept started by the registry.
+
+    Args:
+        language (str): The language code.
+    """
+    global pool
+    if pool is not None and pool.language == language and language in registry.languages:
+        registry.get(language)
         logger.info("Languagetool already loaded with %s language", language)
+        return
+
+    pool = None
+    if language not in registry.languages:
+        engine_status.set_state(language, LANGUAGETOOL_STATE_STARTING)
+    try:
+        pool = registry.get(language)
+    except ModuleNotFoundError as e:
+        logger.error(e)
+        engine_status.set_state(language, LANGUAGETOOL_STATE_FAILED)
+        popup_manager.show_error.emit(
+            QCA.translate("window title", "LanguageTool Error"),
+            QCA.translate("message error", "Java is not installed or not found.")
+        )
+        return
+    except Exception as e:
+        logger.error("Failed to initialize LanguageTool: %s", e, exc_info=True)
+        engine_status.set_state(language, LANGUAGETOOL_STATE_FAILED)
+        popup_manager.show_error.emit(
+            QCA.translate("window title", "LanguageTool Error"),
+            QCA.translate(
+                "message error",
+                (
+                    "Failed to initialize LanguageTool. Maybe you don't have the correct Java version. "
+                    "Java 17+ is required."
+                )
+            )
+        )
+        return
+    engine_status.set_state(language, LANGUAGETOOL_STATE_READY)
+    logger.info("Loaded languagetool with %s language.", language)
+
+
+def close_tool() -> None:
+    """Close the LanguageTool servers of every language, and the cache.
+    """
+    global pool
+    pool = None
+    registry.close_all()
+    languagetool_cache.close_cache()
+
+
+def combine_lines(batch: list[tuple[str, str]]) -> tuple[str, array]:
+    """Join the lines of a batch with line breaks, and keep where each line starts.
+
+    Args:
+        batch (list[tuple[str, str]]): list of every [line number, line text]
+
+    Returns:
+        tuple[str, array]: combined text, and start offset of each line in it
+    """
+    line_starts: array = array("q")
+    lines: list[str] = []
+    position: int = 0
+    for _, text in batch:
+        line_starts.append(position)
+        lines.append(text)
+        position += len(text) + 1
+    return "\n".join(lines), line_starts
+
+
+def find_line_index(line_starts: array, offset: int) -> int:
+    """Get the index of the line containing an offset of the combined text.
+
+    Args:
+        line_starts (array): start offset of each line, sorted
+        offset (int): offset in the combined text
+
+    Returns:
+        int: index of the line in the batch
+    """
+    return bisect_right(line_starts, offset) - 1
+
+
+def rules_params(disabled_rules: Iterable[str] = (), disabled_categories: Iterable[str] = (),
+                 enabled_categories: Iterable[str] = ()) -> dict[str, str]:
+    """Get the rules configuration sent with each request, so LanguageTool does not run
+    the rules that would be ignored. The rules configured in LanguageTool are kept.
+    LanguageTool refuses disabled rules and categories with enabledOnly, so when only some
+    rules or categories are run, the disabled rules are not sent and must be filtered
+    out of the matches, and the disabled categories are removed from the enabled ones.
+
+    Args:
+        disabled_rules (Iterable[str], optional): rules not to run. Defaults to ().
+        disabled_categories (Iterable[str], optional): categories of rules not to run. Defaults to ().
+        enabled_categories (Iterable[str], optional): if not empty, only the rules of these
+        categories are run. Defaults to ().
+
+    Returns:
+        dict[str, str]: parameters of the request, empty if LanguageTool is not initialized
+    """
+    params: dict[str, str] = {}
+    if pool is None:
+        return params
+    tool: language_tool_python.LanguageTool = pool.primary
+    all_disabled_rules: set[str] = set(tool.disabled_rules).union(disabled_rules)
+    all_disabled_categories: set[str] = set(tool.disabled_categories).union(disabled_categories)
+    only_categories: set[str] = set(enabled_categories)
+    all_enabled_categories: set[str] = set(tool.enabled_categories) | only_categories
+    enabled_only: bool = bool(tool.enabled_rules_only or only_categories)
+    if enabled_only:
+        params["enabledOnly"] = "true"
+        all_enabled_categories -= all_disabled_categories
     else:
+        if all_disabled_rules:
+            params["disabledRules"] = ",".join(sorted(all_disabled_rules))
+        if all_disabled_categories:
+            params["disabledCategories"] = ",".join(sorted(all_disabled_categories))
+    if tool.enabled_rules:
+        params["enabledRules"] = ",".join(sorted(tool.enabled_rules))
+    if all_enabled_categories:
+        params["enabledCategories"] = ",".join(sorted(all_enabled_categories))
+    return params
+
+
+def rules_hash(params: dict[str, str]) -> str:
+    """Hash the rules configuration sent to LanguageTool, part of the cache key of a line.
+
+    Args:
+        params (dict[str, str]): rules parameters of the requests
+
+    Returns:
+        str: hexadecimal digest
+    """
+    content: str = json.dumps(params, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def to_item_match(match: dict[str, Any], text: str, start: int, end: int, line_start: int) -> ItemMatch:
+    """Convert a match of the LanguageTool API, with the offset relative to its line.
+
+    Args:
+        match (dict[str, Any]): match of the answer of LanguageTool
+        text (str): text analyzed
+        start (int): start of the match in the text
+        end (int): end of the match in the text
+        line_start (int): start of the line in the text
+
+    Returns:
+        ItemMatch: the match
+    """
+    return ItemMatch(
+        offset=start - line_start,
+        length=end - start,
+        matched_text=text[start:end],
+        rule_id=str(match["rule"]["id"]),
+        rule_issue_type=str(match["rule"].get("issueType", "")),
+        message=unicodedata.normalize("NFKC", str(match["message"])),
+        replacements=[str(replacement["value"]) for replacement in match["replacements"]]
+    )
+
+
+def convert_matches(combined_text: str, line_starts: array,
+                    matches: list[dict[str, Any]]) -> list[list[ItemMatch]]:
+    """Convert the matches of a batch and give them to their line.
+
+    Args:
+        combined_text (str): text of the batch
+        line_starts (array): start offset of each line in the text
+        matches (list[dict[str, Any]]): matches of the answer of LanguageTool
+
+    Returns:
+        list[list[ItemMatch]]: matches of each line of the batch
+    """
+    to_index: Callable[[int], int] = utf16_to_index(combined_text)
+    batch_matches: list[list[ItemMatch]] = [[] for _ in line_starts]
+    for match in matches:
+        start: int = to_index(int(match["offset"]))
+        end: int = to_index(int(match["offset"]) + int(match["length"]))
+        line_index: int = find_line_index(line_starts, start)
+        batch_matches[line_index].append(to_item_match(match, combined_text, start, end, line_starts[line_index]))
+    return batch_matches
+
+
+def check_batch(tool_pool: LanguageToolPool, combined_text: str, params: dict[str, str],
+                retries: int = LANGUAGETOOL_RETRIES,
+                cancel_token: CancellationToken | None = None) -> tuple[list[dict[str, Any]], float]:
+    """Analyze the text of one batch with a server of the pool.
+    A failed request is sent again after a delay doubled each time.
+
+    Args:
+        tool_pool (LanguageToolPool): pool of LanguageTool servers
+        combined_text (str): text of the batch
+        params (dict[str, str]): rules parameters of the request
+        retries (int, optional): number of times the request is sent again. Defaults to LANGUAGETOOL_RETRIES.
+        cancel_token (CancellationToken | None, optional): once cancelled, the request is not
+        sent again, the delay before it is stopped. Defaults to None.
+
+    Raises:
+        Exception: error of the last request, or of the request failed before the cancellation
+
+    Returns:
+        tuple[list[dict[str, Any]], float]: matches of the answer, and time taken in seconds
+    """
+    attempt: int = 0
+    while True:
+        start_time: float = time.perf_counter()
         try:
-            tool = language_tool_python.LanguageTool(language)
-        except ModuleNotFoundError as e:
-            logger.error(e)
-            popup_manager.show_error.emit(
-                QCA.translate("window title", "LanguageTool Error"),
-                QCA.translate("message error", "Java is not installed or not found.")
-            )
-            return
+            matches: list[dict[str, Any]] = tool_pool.check(combined_text, params)
+            return matches, time.perf_counter() - start_time
         except Exception as e:
-            logger.error("Failed to re-initialize LanguageTool: %s", e)
-            popup_manager.show_error.emit(
-                QCA.translate("window title", "LanguageTool Error"),
-                QCA.translate("message error", "Failed to initialize LanguageTool.")
-            )
-            return
-        logger.info("Reloaded languagetool with %s language.", language)
+            if attempt >= retries or is_cancelled(cancel_token):
+                raise
+            delay: float = LANGUAGETOOL_RETRY_DELAY * 2 ** attempt
+            logger.warning("LanguageTool failed on a batch (%s), sending it again in %.1f s.", e, delay)
+            if wait_cancelled(cancel_token, delay):
+                raise
+            attempt += 1
 
 
-def close_tool() -> None:
-    """Close the global LanguageTool.
+def check_lines(texts: list[tuple[str, str]], batcher: AdaptiveBatcher | None = None,
+                params: dict[str, str] | None = None,
+                cancel_token: CancellationToken | None = None) -> list[list[ItemMatch] | None]:
+    """Analyze lines with LanguageTool, in batches sent at the same time to every server of the pool.
+    The matches of a finished batch are converted after the next batch is sent,
+    so the servers work while the results are converted.
+    A batch still failing after its retries is split in two halves, sent again without
+    retries, until the lines LanguageTool fails on are found alone. Only these lines are skipped.
+    The halves are sent before the next batches, at most one batch or half per server at a time.
+
+    Args:
+        texts (list[tuple[str, str]]): list of every [line number, line text]
+        batcher (AdaptiveBatcher | None, optional): batcher making the batches,
+        the one of the pool if None. Defaults to None.
+        params (dict[str, str] | None, optional): rules parameters of the requests,
+        from rules_params() if None. Defaults to None.
+        cancel_token (CancellationToken | None, optional): once cancelled, no more batches
+        are sent, the batches being analyzed are waited for. Defaults to None.
+
+    Returns:
+        list[list[ItemMatch] | None]: matches of each line, None if LanguageTool failed on it
+        or its batch was not sent
     """
-    global tool
-    if tool is not None:
-        tool.close()
-        tool = None
+    lines_matches: list[list[ItemMatch] | None] = [None] * len(texts)
+    tool_pool: LanguageToolPool | None = pool
+    if tool_pool is None:
+        return lines_matches
 
+    if batcher is None:
+        batcher = tool_pool.batcher
+    if params is None:
+        params = rules_params()
+    batches: Iterator[list[tuple[str, str]]] = batcher.batches(texts)
+    # future of each batch sent -> (start, end, text, line starts, is half of a failed batch) of the batch
+    pending: dict[Future, tuple[int, int, str, array, bool]] = {}
+    # (start, end) of the halves of the failed batches, to send again
+    halves: deque[tuple[int, int]] = deque()
+    # index of the lines LanguageTool failed on
+    skipped_indexes: list[int] = []
+    # batches answered, to convert
+    answered: list[tuple[int, int, str, array, list[dict[str, Any]]]] = []
+    batch_end: int = 0
+    workers: int = max(1, len(tool_pool.tools))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # one batch per server, the next batch is made when a server is free, with the new budget
+            while len(pending) < workers and not is_cancelled(cancel_token):
+                if halves:
+                    half_start, half_end = halves.popleft()
+                    half_text, half_line_starts = combine_lines(texts[half_start:half_end])
+                    half_future: Future = executor.submit(check_batch, tool_pool, half_text, params, 0,
+                                                          cancel_token)
+                    pending[half_future] = (half_start, half_end, half_text, half_line_starts, True)
+                    continue
+                batch: list[tuple[str, str]] | None = next(batches, None)
+                if batch is None:
+                    break
+                combined_text, line_starts = combine_lines(batch)
+                batch_start: int = batch_end
+                batch_end += len(batch)
+                logger.info("Analyzing %d lines (%d characters, budget %d) (lines %d to %d of %d)",
+                            len(batch), len(combined_text), batcher.char_budget,
+                            batch_start + 1, batch_end, len(texts))
+                future: Future = executor.submit(check_batch, tool_pool, combined_text, params,
+                                                 cancel_token=cancel_token)
+                pending[future] = (batch_start, batch_end, combined_text, line_starts, False)
 
-def analyze_text(texts: list[tuple[str, str]], ignored_words: list[str],
-                 ignored_rules: list[str]) -> list[ItemResult]:
+            for start, end, combined_text, line_starts, matches in answered:
+                lines_matches[start:end] = convert_matches(combined_text, line_starts, matches)
+            answered = []
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, end, combined_text, line_starts, is_half = pending.pop(future)
+                try:
+                    matches, seconds = future.result()
+                except Exception as e:
+                    if is_cancelled(cancel_token):
+                        # not sent again, its lines are left not analyzed
+                        continue
+                    if not is_half:
+                        # often a timeout of a too large batch
+                        batcher.record_failure()
+                    if end - start == 1:
+                        logger.error("LanguageTool failed on line %s, skipped: %s", texts[start][0], e)
+                        skipped_indexes.append(start)
+                        continue
+                    logger.warning("LanguageTool failed on lines %d to %d, splitting the batch: %s",
+                                   start + 1, end, e)
+                    middle: int = (start + end) // 2
+                    halves.extend(((start, middle), (middle, end)))
+                    continue
+                batcher.record(len(combined_text), seconds)
+                answered.append((start, end, combined_text, line_starts, matches))
+    if is_cancelled(cancel_token):
+        logger.info("LanguageTool analysis cancelled after %d lines of %d.", batch_end, len(texts))
+    if skipped_indexes:
+        skipped_indexes.sort()
+        shown: str = ", ".join(texts[index][0] for index in skipped_indexes[:LANGUAGETOOL_MAX_SKIPPED_LINES_SHOWN])
+        if len(skipped_indexes) > LANGUAGETOOL_MAX_SKIPPED_LINES_SHOWN:
+            shown += ", ..."
+        popup_manager.show_error.emit(
+            QCA.translate("window title", "LanguageTool Error"),
+            QCA.translate("message error", "LanguageTool failed to analyze {0} lines, they were skipped: {1}")
+            .format(len(skipped_indexes), shown)
+        )
+    return lines_matches
+
+
+def analyze_text(texts: list[tuple[str, str]], ignored_words: Container[str],
+                 ignored_rules: Collection[str], cancel_token: CancellationToken | None = None,
+                 enabled_categories: Collection[str] = (),
+                 analyzed_lines: dict[str, list[ItemMatch]] | None = None) -> list[ItemResult]:
+    """Analyze lines with LanguageTool, lines already analyzed are taken from the cache.
+    The ignored rules are disabled in the requests, so LanguageTool does not run them.
+    They are still filtered out of the matches, as lines of the cache can be analyzed
+    with fewer rules disabled, and as no rules are disabled when only the rules of
+    enabled_categories run. The dictionary is applied on the matches, the local
+    server can't take words for one request only.
+
+    Args:
+        texts (list[tuple[str, str]]): list of every [line number, line text]
+        ignored_words (Container[str]): words of the dictionary, not spelling errors
+        ignored_rules (Collection[str]): LanguageTool rules to ignore
+        cancel_token (CancellationToken | None, optional): stops the analysis between two batches,
+        the errors of the lines analyzed are still returned. Defaults to None.
+        enabled_categories (Collection[str], optional): if not empty, only the rules of these
+        categories are run. Defaults to ().
+        analyzed_lines (dict[str, list[ItemMatch]] | None, optional): matches of the lines
+        already analyzed by the previous calls, by line text, so a line repeated in the next
+        chunks of a file is analyzed once. The lines analyzed are added to it. Defaults to None.
+
+    Returns:
+        list[ItemResult]: LanguageTool errors
+    """
     output: list[ItemResult] = []
 
-    if tool is None:
+    if pool is None:
         logger.error("LanguageTool not initialized.")
         return output
 
-    for batch_start in range(0, len(texts), LANGUAGETOOL_MAX_LINES_PER_BATCH):
-        batch: list[tuple[str, str]] = texts[batch_start:batch_start + LANGUAGETOOL_MAX_LINES_PER_BATCH]
-        combined_text: str = "\n".join([x[1] for x in batch])
+    if analyzed_lines is None:
+        analyzed_lines = {}
+    params: dict[str, str] = rules_params(ignored_rules, enabled_categories=enabled_categories)
+    # rules run by LanguageTool but not wanted, filtered out of the matches
+    filtered_rules: Container[str] = ignored_rules
+    # rules not run by LanguageTool, kept by the lines of the cache
+    disabled_rules: Collection[str] = ignored_rules
+    if params.get("enabledOnly") == "true":
+        filtered_rules = set(ignored_rules).union(pool.primary.disabled_rules)
+        disabled_rules = ()
+    cache: LanguageToolCache | None = languagetool_cache.get_cache()
+    lines_matches: list[list[ItemMatch] | None] = [None] * len(texts)
+    missing_indexes: list[int] = []
+    for index, (_, line) in enumerate(texts):
+        if line in analyzed_lines:
+            lines_matches[index] = analyzed_lines[line]
+        else:
+            missing_indexes.append(index)
+    keys: dict[int, str] = {}
+    if cache is not None and missing_indexes:
+        language: str = pool.language
+        version: str = str(pool.primary.language_tool_download_version)
+        # the ignored rules are kept by each line of the cache, not in the key
+        config_hash: str = rules_hash(rules_params(enabled_categories=enabled_categories))
+        keys = {index: languagetool_cache.make_key(language, version, config_hash, texts[index][1])
+                for index in missing_indexes}
+        try:
+            cached: dict[str, list[ItemMatch]] = cache.get_many(list(keys.values()), ignored_rules)
+        except sqlite3.Error as e:
+            logger.error("Failed to read the LanguageTool cache: %s", e)
+            cached = {}
+        looked_up: int = len(missing_indexes)
+        missing_indexes = []
+        for index, key in keys.items():
+            if key in cached:
+                lines_matches[index] = cached[key]
+                analyzed_lines[texts[index][1]] = cached[key]
+            else:
+                missing_indexes.append(index)
+        logger.info("LanguageTool cache: %d lines found, %d lines to analyze (total %d hits, %d misses)",
+                    looked_up - len(missing_indexes), len(missing_indexes), cache.hits, cache.misses)
 
-        # offset position of lines in combined_text
-        line_offsets: list[int] = [0]
-        for text in [x[1] for x in batch]:
-            line_offsets.append(line_offsets[-1] + len(text) + 1)
+    if missing_indexes:
+        # identical lines are analyzed once, their matches are given to every occurrence
+        indexes_by_line: dict[str, list[int]] = {}
+        for index in missing_indexes:
+            indexes_by_line.setdefault(texts[index][1], []).append(index)
 
-        try:
-            logger.info("Analyzing %d lines (%d characters) (batch %s of %s)",
-                        len(batch), len(combined_text),
-                        batch_start // LANGUAGETOOL_MAX_LINES_PER_BATCH + 1,
-                        (len(texts) + LANGUAGETOOL_MAX_LINES_PER_BATCH - 1) // LANGUAGETOOL_MAX_LINES_PER_BATCH)
-            errors: list[language_tool_python.Match] = tool.check(combined_text)
-        except Exception as e:
-            logger.error("LanguageTool failed on batch %d: %s", batch_start, e)
-            popup_manager.show_error.emit(
-                QCA.translate("window title", "LanguageTool Error"),
-                QCA.translate("message error", "LanguageTool failed to analyze the text.")
-            )
-            continue
+        checked: list[list[ItemMatch] | None] = check_lines(
+            [texts[indexes[0]] for indexes in indexes_by_line.values()],
+            params=params,
+            cancel_token=cancel_token
+        )
+        new_entries: dict[str, list[ItemMatch]] = {}
+        for (line, indexes), matches in zip(indexes_by_line.items(), checked):
+            for index in indexes:
+                lines_matches[index] = matches
+            if matches is None:
+                continue
+            analyzed_lines[line] = matches
+            if cache is not None:
+                new_entries[keys[indexes[0]]] = matches
+        if cache is not None:
+            try:
+                cache.put_many(new_entries, disabled_rules)
+            except sqlite3.Error as e:
+                logger.error("Failed to write the LanguageTool cache: %s", e)
 
-        for error in errors:
-            if (str(error.matchedText) in ignored_words and str(error.ruleIssueType) == LANGUAGETOOL_SPELLING_CATEGORY):
+    for (line_number, line), matches in zip(texts, lines_matches):
+        for match in matches or []:
+            if match["matched_text"] in ignored_words and match["rule_issue_type"] == LANGUAGETOOL_SPELLING_CATEGORY:
                 continue
-            if str(error.ruleId) in ignored_rules:
+            # lines of the cache analyzed with this rule, or rules that could not be disabled
+            if match["rule_id"] in filtered_rules:
                 continue
 
-            line_number: int = next(
-                i for i, offset in enumerate(line_offsets) if offset > int(error.offset)  # type: ignore
-            ) - 1
-
             output.append(
                 ItemResult(
-                    line_number=batch[line_number][0],
-                    line=batch[line_number][1],
-                    error=str(error.matchedText),
-                    error_type=str(error.ruleId),
-                    error_issue_type=error.ruleIssueType,
-                    explanation=str(error.message),
-                    suggestion=str(error.replacements)
+                    line_number=line_number,
+                    line=line,
+                    error=match["matched_text"],
+                    error_type=match["rule_id"],
+                    error_issue_type=match["rule_issue_type"],
+                    explanation=match["message"],
+                    suggestion=str(match["replacements"])
                 )
             )
     return output
@@ -0,0 +1,216 @@
+"""
+File        : languagetool_cache.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Persistent cache of the LanguageTool matches of each line.
+
+The matches of a line are stored in a SQLite file, with offsets relative to the line.
+The key of a line is a hash of the language, the version of LanguageTool, the
+configuration of the rules sent to LanguageTool and the cleaned text of the line,
+so a change of any of them misses the cache. The ignored rules of the project
+are not part of the key: each line keeps the rules that were disabled when it
+was analyzed, and is found only by a request disabling at least the same rules,
+the matches of the other rules being filtered out afterwards. The dictionary is
+applied after the cache, so the matches stay valid when it changes.
+When there are too many lines, the least recently used are removed.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Collection
+import hashlib
+import json
+from logging import Logger
+import os
+import sqlite3
+import threading
+import time
+
+from rawtextcheck.default_parameters import LANGUAGETOOL_CACHE_MAX_ENTRIES, LANGUAGETOOL_CACHE_PATH
+from rawtextcheck.logger import get_logger
+from rawtextcheck.newtype import ItemMatch
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+_cache: "LanguageToolCache | None" = None
+"""Cache opened by get_cache"""
+
+_SQL_MAX_VARIABLES = 500
+"""Maximum number of keys in one SQL query"""
+
+
+# == Classes ==================================================================
+
+class LanguageToolCache:
+    """SQLite cache of the LanguageTool matches of lines.
+    Attributes:
+        path (str): path of the SQLite file
+        max_entries (int): maximum number of lines in the cache
+        hits (int): number of lines found in the cache
+        misses (int): number of lines not found in the cache
+    """
+
+    def __init__(self, path: str = LANGUAGETOOL_CACHE_PATH,
+                 max_entries: int = LANGUAGETOOL_CACHE_MAX_ENTRIES) -> None:
+        """Open the cache, create the file if needed.
+
+        Args:
+            path (str, optional): path of the SQLite file. Defaults to LANGUAGETOOL_CACHE_PATH.
+            max_entries (int, optional): maximum number of lines in the cache.
+            Defaults to LANGUAGETOOL_CACHE_MAX_ENTRIES.
+        """
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+        folder: str = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS line_matches ("
+                "key TEXT PRIMARY KEY, matches TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS line_matches_last_used ON line_matches (last_used)"
+            )
+            columns: list[str] = [row[1] for row in self._connection.execute("PRAGMA table_info(line_matches)")]
+            if "disabled_rules" not in columns:
+                # lines cached before the column were analyzed without disabled rules
+                self._connection.execute(
+                    "ALTER TABLE line_matches ADD COLUMN disabled_rules TEXT NOT NULL DEFAULT ''"
+                )
+
+    def get_many(self, keys: list[str], disabled_rules: Collection[str] = ()) -> dict[str, list[ItemMatch]]:
+        """Get the matches of the lines found in the cache.
+        A line analyzed with a rule that is now disabled is found, its matches of this rule
+        have to be filtered out. A line analyzed with a rule disabled that is now enabled is not found.
+
+        Args:
+            keys (list[str]): keys of the lines
+            disabled_rules (Collection[str], optional): rules disabled in the request. Defaults to ().
+
+        Returns:
+            dict[str, list[ItemMatch]]: matches of each key found
+        """
+        unique_keys: list[str] = list(dict.fromkeys(keys))
+        found: dict[str, list[ItemMatch]] = {}
+        now: float = time.time()
+        with self._lock, self._connection:
+            for start in range(0, len(unique_keys), _SQL_MAX_VARIABLES):
+                chunk: list[str] = unique_keys[start:start + _SQL_MAX_VARIABLES]
+                placeholders: str = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, matches, disabled_rules FROM line_matches WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, matches, line_disabled_rules in rows:
+                    if all(rule in disabled_rules for rule in _split_rules(line_disabled_rules)):
+                        found[key] = json.loads(matches)
+                self._connection.execute(
+                    f"UPDATE line_matches SET last_used = ? WHERE key IN ({placeholders})", [now, *chunk]
+                )
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, list[ItemMatch]], disabled_rules: Collection[str] = ()) -> None:
+        """Store the matches of lines, then remove the least recently used lines if needed.
+
+        Args:
+            items (dict[str, list[ItemMatch]]): matches of each key
+            disabled_rules (Collection[str], optional): rules disabled when the lines were analyzed.
+            Defaults to ().
+        """
+        if not items:
+            return
+        now: float = time.time()
+        rules: str = ",".join(sorted(disabled_rules))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO line_matches (key, matches, last_used, disabled_rules) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(matches, ensure_ascii=False), now, rules) for key, matches in items.items()]
+            )
+            count: int = self._connection.execute("SELECT COUNT(*) FROM line_matches").fetchone()[0]
+            if count > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM line_matches WHERE key IN "
+                    "(SELECT key FROM line_matches ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+                logger.info("Removed %d lines from the LanguageTool cache.", count - self.max_entries)
+
+    def __len__(self) -> int:
+        """Number of lines in the cache."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM line_matches").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every line of the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM line_matches")
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+
+# == Functions ================================================================
+
+def _split_rules(rules: str) -> list[str]:
+    """Split the rules stored in a row of the cache.
+
+    Args:
+        rules (str): rules separated by commas
+
+    Returns:
+        list[str]: the rules
+    """
+    return rules.split(",") if rules else []
+
+
+def make_key(language: str, version: str, rules_hash: str, line: str) -> str:
+    """Get the cache key of a line.
+
+    Args:
+        language (str): language code of LanguageTool
+        version (str): version of LanguageTool
+        rules_hash (str): hash of the rules configuration sent to LanguageTool
+        line (str): cleaned text of the line
+
+    Returns:
+        str: hexadecimal key
+    """
+    content: str = "\0".join((language, version, rules_hash, line))
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def get_cache() -> LanguageToolCache | None:
+    """Get the cache, opened at the first call.
+
+    Returns:
+        LanguageToolCache | None: the cache, None if it can't be opened
+    """
+    global _cache
+    if _cache is None:
+        try:
+            _cache = LanguageToolCache()
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Failed to open the LanguageTool cache: %s", e)
+            return None
+    return _cache
+
+
+def close_cache() -> None:
+    """Close the cache if it is opened."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
@@ -0,0 +1,130 @@
+"""
+File        : languagetool_client.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : HTTP client for a local LanguageTool server.
+
+The client sends texts to the /check endpoint of a LanguageTool server through
+a requests.Session, so the connection is kept alive and reused between batches
+instead of being opened for each request. It returns the matches as decoded
+from the JSON answer, the conversion of the matches is left to the caller.
+
+LanguageTool runs on Java and gives offsets in UTF-16 code units, so characters
+outside the Basic Multilingual Plane (emojis...) count as two. Offsets are
+converted to Python string indexes with utf16_to_index.
+"""
+
+
+# == Imports ==================================================================
+
+from bisect import bisect_left
+from collections.abc import Callable
+from logging import Logger
+import re
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rawtextcheck.default_parameters import LANGUAGETOOL_REQUEST_TIMEOUT
+from rawtextcheck.logger import get_logger
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+_ASTRAL_CHARACTER = re.compile("[\U00010000-\U0010FFFF]")
+"""Characters taking two UTF-16 code units"""
+
+
+# == Functions ================================================================
+
+def utf16_to_index(text: str) -> Callable[[int], int]:
+    """Get a function converting an UTF-16 offset of the text to a Python index.
+
+    Args:
+        text (str): the text analyzed
+
+    Returns:
+        Callable[[int], int]: converter of offsets
+    """
+    if text.isascii():
+        return int
+    # UTF-16 offset of every character taking two code units
+    astral_offsets: list[int] = [
+        match.start() + count for count, match in enumerate(_ASTRAL_CHARACTER.finditer(text))
+    ]
+    if not astral_offsets:
+        return int
+
+    def convert(offset: int) -> int:
+        return offset - bisect_left(astral_offsets, offset)
+    return convert
+
+
+# == Classes ==================================================================
+
+class LanguageToolClient:
+    """Client of a LanguageTool HTTP server, with a persistent connection.
+    Attributes:
+        url (str): url of the API of the server, like http://localhost:8081/v2/
+        language (str): language code sent with each text
+        timeout (float): timeout of a request in seconds
+    """
+
+    def __init__(self, url: str, language: str, timeout: float = LANGUAGETOOL_REQUEST_TIMEOUT,
+                 max_connections: int = 2) -> None:
+        """Initialize the client.
+
+        Args:
+            url (str): url of the API of the server
+            language (str): language code sent with each text
+            timeout (float, optional): timeout of a request in seconds.
+            Defaults to LANGUAGETOOL_REQUEST_TIMEOUT.
+            max_connections (int, optional): connections kept alive to the server. Defaults to 2.
+        """
+        self.url: str = url if url.endswith("/") else url + "/"
+        self.language: str = language
+        self.timeout: float = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def check(self, text: str, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        """Analyze a text.
+
+        Args:
+            text (str): text to analyze
+            params (dict[str, str] | None, optional): other parameters of the request,
+            like disabledRules. Defaults to None.
+
+        Raises:
+            requests.RequestException: the server did not answer correctly
+
+        Returns:
+            list[dict[str, Any]]: matches of the answer, offsets in UTF-16 code units
+        """
+        data: dict[str, str] = {"language": self.language, "text": text}
+        if params:
+            data.update(params)
+        response = self._session.post(self.url + "check", data=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()["matches"]
+
+    def is_alive(self) -> bool:
+        """Check that the server answers.
+
+        Returns:
+            bool: True if the health check of the server succeeded
+        """
+        try:
+            response = self._session.get(self.url + "healthcheck", timeout=self.timeout)
+        except requests.RequestException:
+            return False
+        return response.ok
+
+    def close(self) -> None:
+        """Close the connections to the server."""
+        self._session.close()
@@ -0,0 +1,238 @@
+"""
+File        : languagetool_pool.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Pool of local LanguageTool servers checking texts in parallel.
+
+Each LanguageTool object runs its own local server, a JVM analyzing one request
+at a time. The pool starts several of them for one language, talks to each one
+with a LanguageToolClient keeping its connection alive, and lends a free server
+to each request, so several batches can be analyzed at the same time.
+A server failing a request is checked and restarted if it does not answer anymore.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+import os
+import queue
+import threading
+import time
+from typing import Any
+
+import language_tool_python  # type: ignore
+
+from rawtextcheck.default_parameters import LANGUAGETOOL_POOL_SIZE
+from rawtextcheck.logger import get_logger
+from rawtextcheck.script.batcher import AdaptiveBatcher
+from rawtextcheck.script.languagetool_client import LanguageToolClient
+
+
+# == Constants ================================================================
+
+_POOL_CLOSED: int = -1
+"""Put in the queue of the free servers when the pool is closed, to wake the requests waiting"""
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+
+# == Functions ================================================================
+
+def get_pool_size(size: int = LANGUAGETOOL_POOL_SIZE) -> int:
+    """Get the number of servers of a pool.
+
+    Args:
+        size (int, optional): wanted size, 0 for the number of cores. Defaults to LANGUAGETOOL_POOL_SIZE.
+
+    Returns:
+        int: number of servers, at least 1
+    """
+    if size <= 0:
+        size = os.cpu_count() or 1
+    return max(1, size)
+
+
+# == Classes ==================================================================
+
+class LanguageToolPool:
+    """Pool of LanguageTool servers of one language.
+    Attributes:
+        language (str): language code of the servers
+        size (int): wanted number of servers
+        tools (list[language_tool_python.LanguageTool]): LanguageTool servers started
+        clients (list[LanguageToolClient]): client of each server
+        last_used (float): time.monotonic() of the last use of the pool
+        batcher (AdaptiveBatcher): batcher of the requests, its budget is kept between files
+    """
+
+    def __init__(self, language: str,
+                 create_tool: Callable[[], language_tool_python.LanguageTool], size: int) -> None:
+        """Initialize the pool, servers are started by start().
+
+        Args:
+            language (str): language code of the servers
+            create_tool (Callable[[], language_tool_python.LanguageTool]): function starting one server
+            size (int): wanted number of servers
+        """
+        self.language: str = language
+        self.size: int = max(1, size)
+        self.tools: list[language_tool_python.LanguageTool] = []
+        self.clients: list[LanguageToolClient] = []
+        self.last_used: float = time.monotonic()
+        self.batcher: AdaptiveBatcher = AdaptiveBatcher()
+        self._create_tool: Callable[[], language_tool_python.LanguageTool] = create_tool
+        # index of the free servers
+        self._free_servers: queue.Queue[int] = queue.Queue()
+        self._closed: bool = False
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> language_tool_python.LanguageTool:
+        """First LanguageTool started, used for its configuration."""
+        return self.tools[0]
+
+    def start(self) -> None:
+        """Start the servers.
+        The first server is started alone, so LanguageTool is downloaded once if needed,
+        then the others at the same time. If only some servers can't start, the pool
+        runs with the others.
+
+        Raises:
+            Exception: error of the first server if it can't start
+        """
+        self._add_tool(self._create_tool())
+        if self.size == 1:
+            return
+        with ThreadPoolExecutor(max_workers=self.size - 1) as executor:
+            futures = [executor.submit(self._create_tool) for _ in range(self.size - 1)]
+            for future in futures:
+                try:
+                    self._add_tool(future.result())
+                except Exception as e:
+                    logger.error("Failed to start a LanguageTool server of the pool: %s", e)
+        logger.info("Started %d LanguageTool servers for %s language.", len(self.tools), self.language)
+
+    def _add_tool(self, tool: language_tool_python.LanguageTool) -> None:
+        """Add a started server to the pool.
+
+        Args:
+            tool (language_tool_python.LanguageTool): LanguageTool server
+        """
+        with self._lock:
+            self.tools.append(tool)
+            self.clients.append(LanguageToolClient(tool.url, self.language))
+            index: int = len(self.tools) - 1
+        self._free_servers.put(index)
+
+    def _restart_server(self, index: int) -> None:
+        """Close a server and start a new one in its place.
+        The old server is kept if the new one can't be started.
+
+        Args:
+            index (int): index of the server not answering anymore
+        """
+        logger.warning("A LanguageTool server of the pool does not answer, restarting it.")
+        try:
+            new_tool: language_tool_python.LanguageTool = self._create_tool()
+        except Exception as e:
+            logger.error("Failed to restart a LanguageTool server: %s", e)
+            return
+        with self._lock:
+            if index >= len(self.tools):
+                # pool closed in the meantime
+                new_tool.close()
+                return
+            old_tool: language_tool_python.LanguageTool = self.tools[index]
+            old_client: LanguageToolClient = self.clients[index]
+            self.tools[index] = new_tool
+            self.clients[index] = LanguageToolClient(new_tool.url, self.language)
+        old_client.close()
+        try:
+            old_tool.close()
+        except Exception as e:
+            logger.error("Failed to close a LanguageTool server: %s", e)
+
+    def warm_up(self, text: str) -> None:
+        """Analyze a text once with every server at the same time, so each one loads its rules.
+        A server failing the text is only logged, it is checked again by the next request.
+
+        Args:
+            text (str): text to analyze, the matches are not kept
+        """
+        with self._lock:
+            clients: list[LanguageToolClient] = list(self.clients)
+        if not clients:
+            return
+        start_time: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            futures = [executor.submit(client.check, text) for client in clients]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Failed to warm up a LanguageTool server of the pool: %s", e)
+        logger.info("Warmed up %d LanguageTool servers for %s language in %.2f s.",
+                    len(clients), self.language, time.perf_counter() - start_time)
+
+    def is_busy(self) -> bool:
+        """True if a server of the pool is analyzing a text."""
+        return self._free_servers.qsize() < len(self.tools)
+
+    def check(self, text: str, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        """Analyze a text with the first free server, wait if every server is busy.
+
+        Args:
+            text (str): text to analyze
+            params (dict[str, str] | None, optional): other parameters of the request. Defaults to None.
+
+        Raises:
+            RuntimeError: if the pool is closed, before or while waiting for a free server
+
+        Returns:
+            list[dict[str, Any]]: matches of LanguageTool, offsets in UTF-16 code units
+        """
+        if self._closed or not self.tools:
+            raise RuntimeError(f"LanguageTool servers of {self.language} language are closed.")
+        index: int = self._free_servers.get()
+        with self._lock:
+            closed: bool = index == _POOL_CLOSED or self._closed
+            client: LanguageToolClient | None = None if closed else self.clients[index]
+        if client is None:
+            # given back so the next request waiting is woken too
+            self._free_servers.put(index)
+            raise RuntimeError(f"LanguageTool servers of {self.language} language are closed.")
+        self.last_used = time.monotonic()
+        try:
+            return client.check(text, params)
+        except Exception:
+            if not self._closed and not client.is_alive():
+                self._restart_server(index)
+            raise
+        finally:
+            self.last_used = time.monotonic()
+            self._free_servers.put(index)
+
+    def close(self) -> None:
+        """Close every server of the pool.
+        The requests waiting for a free server are woken and fail.
+        """
+        with self._lock:
+            tools: list[language_tool_python.LanguageTool] = self.tools
+            clients: list[LanguageToolClient] = self.clients
+            self.tools = []
+            self.clients = []
+            self._closed = True
+        self._free_servers.put(_POOL_CLOSED)
+        for client in clients:
+            client.close()
+        for tool in tools:
+            try:
+                tool.close()
+            except Exception as e:
+                logger.error("Failed to close a LanguageTool server: %s", e)
@@ -0,0 +1,205 @@
+"""
+File        : languagetool_registry.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Registry keeping the LanguageTool servers of several languages started.
+
+Starting LanguageTool for a language costs a JVM and the loading of its models.
+The registry keeps the pool of each language used, so going back to a project
+of another language reuses its servers. Pools are closed when they are not used
+for longer than the idle timeout, and the least recently used ones are closed
+when the estimated memory of every pool goes over the budget. The pool just
+asked for and the pools analyzing a text are never closed.
+A pool is started outside the lock of the registry, so the other languages and
+close_all don't wait for it, the callers asking for the same language wait for
+the same start.
+"""
+
+
+# == Imports ==================================================================
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from logging import Logger
+import threading
+import time
+
+from rawtextcheck.default_parameters import (
+    LANGUAGETOOL_IDLE_TIMEOUT,
+    LANGUAGETOOL_MEMORY_BUDGET_MB,
+    LANGUAGETOOL_SERVER_MEMORY_MB
+    )
+from rawtextcheck.logger import get_logger
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
+
+
+# == Classes ==================================================================
+
+class EngineRegistry:
+    """Started pools of LanguageTool servers, by language, least recently used first.
+    Attributes:
+        memory_budget_mb (int): memory that every pool can use
+        server_memory_mb (int): estimated memory of one server
+        idle_timeout (float): time in seconds after which a pool not used is closed
+    """
+
+    def __init__(self, start_pool: Callable[[str], LanguageToolPool],
+                 memory_budget_mb: int = LANGUAGETOOL_MEMORY_BUDGET_MB,
+                 server_memory_mb: int = LANGUAGETOOL_SERVER_MEMORY_MB,
+                 idle_timeout: float = LANGUAGETOOL_IDLE_TIMEOUT) -> None:
+        """Initialize the registry.
+
+        Args:
+            start_pool (Callable[[str], LanguageToolPool]): function starting the pool of a language
+            memory_budget_mb (int, optional): memory that every pool can use.
+            Defaults to LANGUAGETOOL_MEMORY_BUDGET_MB.
+            server_memory_mb (int, optional): estimated memory of one server.
+            Defaults to LANGUAGETOOL_SERVER_MEMORY_MB.
+            idle_timeout (float, optional): time in seconds after which a pool not used is closed.
+            Defaults to LANGUAGETOOL_IDLE_TIMEOUT.
+        """
+        self.memory_budget_mb: int = memory_budget_mb
+        self.server_memory_mb: int = server_memory_mb
+        self.idle_timeout: float = idle_timeout
+        self._start_pool: Callable[[str], LanguageToolPool] = start_pool
+        # language -> pool, least recently used first
+        self._pools: OrderedDict[str, LanguageToolPool] = OrderedDict()
+        # language -> pool being started
+        self._starting: dict[str, Future[LanguageToolPool]] = {}
+        # incremented by close_all, a pool started before is closed at the end of its start
+        self._generation: int = 0
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
+    @property
+    def languages(self) -> list[str]:
+        """Languages with a started pool, least recently used first."""
+        with self._lock:
+            return list(self._pools)
+
+    def memory_mb(self) -> int:
+        """Estimated memory used by every pool.
+
+        Returns:
+            int: memory in MB
+        """
+        with self._lock:
+            return sum(len(pool.tools) for pool in self._pools.values()) * self.server_memory_mb
+
+    def get(self, language: str) -> LanguageToolPool:
+        """Get the pool of a language, started if needed.
+        If the pool is being started by another thread, its start is waited for.
+
+        Args:
+            language (str): language code
+
+        Raises:
+            Exception: error of the pool if it can't start
+            RuntimeError: if close_all was called during the start
+
+        Returns:
+            LanguageToolPool: the pool of the language
+        """
+        with self._lock:
+            self.close_idle()
+            pool: LanguageToolPool | None = self._pools.get(language)
+            if pool is not None:
+                self._pools.move_to_end(language)
+                pool.last_used = time.monotonic()
+                logger.info("Reusing LanguageTool servers of %s language.", language)
+                return pool
+            starting: Future[LanguageToolPool] | None = self._starting.get(language)
+            if starting is None:
+                future: Future[LanguageToolPool] = Future()
+                self._starting[language] = future
+                generation: int = self._generation
+
+        if starting is not None:
+            logger.info("Waiting for the start of LanguageTool servers of %s language.", language)
+            return starting.result()
+
+        try:
+            pool = self._start_pool(language)
+        except BaseException as e:
+            with self._lock:
+                self._starting.pop(language, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._starting.pop(language, None)
+            closed: bool = generation != self._generation
+            if not closed:
+                self._pools[language] = pool
+                self._close_over_budget()
+                self._schedule_idle_check()
+        if closed:
+            logger.info("Closing LanguageTool servers of %s language (closed while starting).", language)
+            pool.close()
+            error = RuntimeError(f"LanguageTool servers of {language} language closed while starting")
+            future.set_exception(error)
+            raise error
+        future.set_result(pool)
+        return pool
+
+    def _close(self, language: str, reason: str) -> None:
+        """Close the pool of a language and remove it from the registry.
+
+        Args:
+            language (str): language code
+            reason (str): reason written in the log
+        """
+        pool: LanguageToolPool = self._pools.pop(language)
+        logger.info("Closing LanguageTool servers of %s language (%s).", language, reason)
+        pool.close()
+
+    def _close_over_budget(self) -> None:
+        """Close the least recently used pools while the memory is over the budget.
+        The most recent pool is always kept.
+        """
+        for language in list(self._pools)[:-1]:
+            if self.memory_mb() <= self.memory_budget_mb:
+                return
+            if not self._pools[language].is_busy():
+                self._close(language, "memory budget")
+
+    def close_idle(self) -> None:
+        """Close the pools not used for longer than the idle timeout."""
+        with self._lock:
+            now: float = time.monotonic()
+            for language, pool in list(self._pools.items()):
+                if now - pool.last_used > self.idle_timeout and not pool.is_busy():
+                    self._close(language, "idle")
+
+    def _schedule_idle_check(self) -> None:
+        """Check the idle pools regularly while there are pools."""
+        if self._timer is not None or not self._pools:
+            return
+
+        def check() -> None:
+            with self._lock:
+                self._timer = None
+                self.close_idle()
+                self._schedule_idle_check()
+
+        self._timer = threading.Timer(self.idle_timeout / 2, check)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def close_all(self) -> None:
+        """Close every pool. The pools being started are closed at the end of their start,
+        without waiting for them.
+        """
+        with self._lock:
+            self._generation += 1
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for language in list(self._pools):
+                self._close(language, "closing")
@@ -0,0 +1,152 @@
+"""
+File        : languagetool_settings.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Settings of the local LanguageTool servers, set from the RAM and cores.
+
+The Java heap, the sentence cache, the pipeline caching and the number of check
+threads of each server decide the throughput and the memory of LanguageTool.
+Their defaults share the cores between the servers of a pool, and the memory
+budget of the registry, a share of the RAM, between the servers of
+LANGUAGETOOL_LANGUAGES_IN_BUDGET languages. A server is estimated to use its
+heap and the memory of the JVM, so the registry keeps these languages started.
+The heap is given to Java with the JAVA_TOOL_OPTIONS environment variable,
+read by every JVM started after, the other settings are written in the
+configuration file of the server.
+"""
+
+
+# == Imports ==================================================================
+
+import ctypes
+import os
+import sys
+from typing import Any
+
+from rawtextcheck.default_parameters import (
+    LANGUAGETOOL_CACHE_SIZE_PER_HEAP_MB,
+    LANGUAGETOOL_DEFAULT_RAM_MB,
+    LANGUAGETOOL_JVM_OVERHEAD_MB,
+    LANGUAGETOOL_LANGUAGES_IN_BUDGET,
+    LANGUAGETOOL_MAX_HEAP_MB,
+    LANGUAGETOOL_MEMORY_BUDGET_SHARE,
+    LANGUAGETOOL_MIN_HEAP_MB
+    )
+from rawtextcheck.newtype import ItemLanguageToolServer
+from rawtextcheck.script.languagetool_pool import get_pool_size
+
+
+# == Global Variables =========================================================
+
+_JAVA_TOOL_OPTIONS: str = os.environ.get("JAVA_TOOL_OPTIONS", "")
+"""JAVA_TOOL_OPTIONS set before the app started, kept with the heap option"""
+
+
+# == Functions ================================================================
+
+def get_total_memory_mb() -> int | None:
+    """Get the RAM of the computer.
+
+    Returns:
+        int | None: RAM in MB, None if it can't be read
+    """
+    if sys.platform == "win32":
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):  # type: ignore
+            return None
+        return status.ullTotalPhys // (1024 * 1024)
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_server_settings(total_memory_mb: int | None = None,
+                            cores: int | None = None) -> ItemLanguageToolServer:
+    """Get the settings of a server, sharing the cores between the servers of a pool, and the
+    memory budget between the servers of LANGUAGETOOL_LANGUAGES_IN_BUDGET languages.
+
+    Args:
+        total_memory_mb (int | None, optional): RAM in MB, read if None. Defaults to None.
+        cores (int | None, optional): number of cores, read if None. Defaults to None.
+
+    Returns:
+        ItemLanguageToolServer: settings of one server
+    """
+    if cores is None:
+        cores = os.cpu_count() or 1
+    servers: int = get_pool_size()
+    server_memory_mb: float = default_memory_budget_mb(total_memory_mb) / (LANGUAGETOOL_LANGUAGES_IN_BUDGET * servers)
+    heap_mb: int = int(server_memory_mb - LANGUAGETOOL_JVM_OVERHEAD_MB)
+    heap_mb = min(LANGUAGETOOL_MAX_HEAP_MB, max(LANGUAGETOOL_MIN_HEAP_MB, heap_mb))
+    return ItemLanguageToolServer(
+        heap_mb=heap_mb,
+        cache_size=heap_mb * LANGUAGETOOL_CACHE_SIZE_PER_HEAP_MB,
+        pipeline_caching=True,
+        max_check_threads=max(1, cores // servers)
+    )
+
+
+def default_memory_budget_mb(total_memory_mb: int | None = None) -> int:
+    """Get the memory that the servers of every language kept started can use, from the RAM.
+
+    Args:
+        total_memory_mb (int | None, optional): RAM in MB, read if None. Defaults to None.
+
+    Returns:
+        int: memory budget in MB
+    """
+    if total_memory_mb is None:
+        total_memory_mb = get_total_memory_mb() or LANGUAGETOOL_DEFAULT_RAM_MB
+    return int(total_memory_mb * LANGUAGETOOL_MEMORY_BUDGET_SHARE)
+
+
+def estimated_server_memory_mb(settings: ItemLanguageToolServer) -> int:
+    """Get the estimated memory of one server, its heap and the memory of the JVM.
+
+    Args:
+        settings (ItemLanguageToolServer): settings of the server
+
+    Returns:
+        int: memory in MB
+    """
+    return settings["heap_mb"] + LANGUAGETOOL_JVM_OVERHEAD_MB
+
+
+def to_server_config(settings: ItemLanguageToolServer) -> dict[str, Any]:
+    """Get the configuration file of a server from its settings.
+
+    Args:
+        settings (ItemLanguageToolServer): settings of the server
+
+    Returns:
+        dict[str, Any]: config of language_tool_python.LanguageTool
+    """
+    return {
+        "cacheSize": settings["cache_size"],
+        "pipelineCaching": settings["pipeline_caching"],
+        "maxCheckThreads": settings["max_check_threads"],
+    }
+
+
+def apply_java_options(settings: ItemLanguageToolServer) -> str:
+    """Set the heap of the servers started from now on, in JAVA_TOOL_OPTIONS.
+    The options set before the app started are kept.
+
+    Args:
+        settings (ItemLanguageToolServer): settings of the servers
+
+    Returns:
+        str: new JAVA_TOOL_OPTIONS
+    """
+    options: str = f"{_JAVA_TOOL_OPTIONS} -Xmx{settings['heap_mb']}m".strip()
+    os.environ["JAVA_TOOL_OPTIONS"] = options
+    return options
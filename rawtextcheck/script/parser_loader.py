@@ -7,15 +7,23 @@ Description : Dynamically load parsers from a specified directory.
 This module provides functionality to dynamically load parser functions
 from Python files located in a specified directory. It is useful for
 extending the application with custom parsers without modifying the core code.
+
+A parser has a parse_file(filepath, arguments) function returning the list of
+(line number, text) of the file, or an iter_file(filepath, arguments) generator
+yielding them one by one, so the file is checked while it is read.
 """
 
 
 # == Imports ==================================================================
 
+from collections.abc import Iterator
+from dataclasses import dataclass
 import os
 from logging import Logger
 from importlib.machinery import ModuleSpec
 import importlib.util
+import threading
+import time
 from types import ModuleType
 
 from rawtextcheck.default_parameters import PLUGIN_PARSER_FOLDER
@@ -24,53 +32,157 @@ from rawtextcheck.logger import get_logger
 from rawtextcheck.newtype import ParserArgument
 
 
+# == Classes ==================================================================
+
+@dataclass(frozen=True)
+class LoadedPlugin:
+    """Plugin file loaded by the registry.
+    Attributes:
+        module (ModuleType | None): module of the plugin, None if it failed to load or is not a parser
+        mtime_ns (int): modification time of the file when it was loaded
+        size (int): size of the file when it was loaded
+        load_time (float): time in seconds taken to load the module
+        load_count (int): number of times the file was loaded
+    """
+    module: ModuleType | None
+    mtime_ns: int
+    size: int
+    load_time: float
+    load_count: int
+
+
+class PluginRegistry:
+    """Plugin parsers of a folder, each file loaded once and loaded again only when it changes.
+    A file is considered changed when its modification time or its size is different.
+    Attributes:
+        folder (str): folder of the plugin parsers
+    """
+
+    def __init__(self, folder: str = PLUGIN_PARSER_FOLDER) -> None:
+        """Initialize the registry, plugins are loaded by get_parsers().
+
+        Args:
+            folder (str, optional): folder of the plugin parsers. Defaults to PLUGIN_PARSER_FOLDER.
+        """
+        self.folder: str = folder
+        # module name -> plugin loaded
+        self._plugins: dict[str, LoadedPlugin] = {}
+        self._lock = threading.Lock()
+
+    def get_parsers(self) -> dict[str, ModuleType]:
+        """Get the plugin parsers, loading the new and changed files.
+
+        Returns:
+            dict[str, ModuleType]: plugin modules with a parse_file or iter_file function, by module name
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        with self._lock:
+            found: set[str] = set()
+            for entry in os.scandir(self.folder):
+                if not entry.name.endswith(".py") or not entry.is_file():
+                    continue
+                module_name: str = entry.name[:-3]  # remove .py extension
+                found.add(module_name)
+                stat: os.stat_result = entry.stat()
+                plugin: LoadedPlugin | None = self._plugins.get(module_name)
+                if plugin is None or (plugin.mtime_ns, plugin.size) != (stat.st_mtime_ns, stat.st_size):
+                    self._plugins[module_name] = self._load(module_name, entry.path, stat,
+                                                            plugin.load_count if plugin else 0)
+            for module_name in self._plugins.keys() - found:
+                logger.info("Parser %s removed.", module_name)
+                del self._plugins[module_name]
+            return {module_name: plugin.module for module_name, plugin in sorted(self._plugins.items())
+                    if plugin.module is not None}
+
+    def _load(self, module_name: str, filepath: str, stat: os.stat_result, load_count: int) -> LoadedPlugin:
+        """Load a plugin file. A file failing to load is kept without module until it changes.
+
+        Args:
+            module_name (str): name of the module
+            filepath (str): path of the file
+            stat (os.stat_result): stat of the file before it is loaded
+            load_count (int): number of times the file was loaded before
+
+        Returns:
+            LoadedPlugin: plugin loaded
+        """
+        start_time: float = time.perf_counter()
+        module: ModuleType | None = None
+        # Load the module from the given file path
+        spec: ModuleSpec | None = importlib.util.spec_from_file_location(module_name, filepath)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            try:
+                # Execute the module to load its contents
+                spec.loader.exec_module(module)
+            except Exception as e:
+                logger.error("Error loading parser %s: %s", module_name, e)
+                module = None
+        # Check if the module has a 'parse_file' or 'iter_file' function
+        if module is not None and not (hasattr(module, "parse_file") or hasattr(module, "iter_file")):
+            module = None
+        load_time: float = time.perf_counter() - start_time
+        logger.info("Parser %s loaded in %.3f s.", module_name, load_time)
+        return LoadedPlugin(module, stat.st_mtime_ns, stat.st_size, load_time, load_count + 1)
+
+    def get_metrics(self) -> dict[str, LoadedPlugin]:
+        """Get the files loaded, with their load time and load count.
+
+        Returns:
+            dict[str, LoadedPlugin]: plugins loaded, by module name
+        """
+        with self._lock:
+            return dict(self._plugins)
+
+    def clear(self) -> None:
+        """Forget every plugin, they are loaded again by the next get_parsers()."""
+        with self._lock:
+            self._plugins.clear()
+
+
 # == Global Variables =========================================================
 
 logger: Logger = get_logger(__name__)
 
+registry: PluginRegistry = PluginRegistry()
+"""Plugin parsers of PLUGIN_PARSER_FOLDER"""
+
 
 # == Functions ================================================================
 
 def get_all_parsers() -> dict[str, ModuleType]:
     """
-    Dynamically load all .py plugin files from a given directory,
-    and extract their 'parse_file' function.
+    Get the default parsers and the plugin parsers of PLUGIN_PARSER_FOLDER.
+    Plugin files are loaded once, and loaded again only when they change.
 
     Returns:
         dict[str, ModuleType]: A mapping of module names.
     """
-    plugin_parser: dict[str, ModuleType] = {}
-
-    os.makedirs(PLUGIN_PARSER_FOLDER, exist_ok=True)
-
-    # Iterate over all .py files in the plugin directory
-    for filename in os.listdir(PLUGIN_PARSER_FOLDER):
-        if filename.endswith(".py"):
-            module_name: str = filename[:-3]  # remove .py extension
-            filepath: str = os.path.join(PLUGIN_PARSER_FOLDER, filename)
-
-            # Load the module from the given file path
-            spec: ModuleSpec | None = importlib.util.spec_from_file_location(module_name, filepath)
-            if spec and spec.loader:
-                module: ModuleType = importlib.util.module_from_spec(spec)
-                try:
-                    # Execute the module to load its contents
-                    spec.loader.exec_module(module)
-
-                    # Check if the module has a 'parse_file' function
-                    if hasattr(module, "parse_file"):
-                        # Store the parse_file function under the module's name
-                        plugin_parser[module_name] = module
-                except Exception as e:
-                    logger.error("Error loading parser %s: %s", module_name, e)
-
     all_parsers: dict[str, ModuleType] = {
         **LIST_DEFAULT_PARSER,
-        **plugin_parser
+        **registry.get_parsers()
     }
     return all_parsers
 
 
+def iter_parser_file(parser: ModuleType, filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+    """Read the lines of a file with a parser, one by one.
+    iter_file of the parser is used if it has one, else the list of parse_file is read.
+
+    Args:
+        parser (ModuleType): module of the parser
+        filepath (str): path of the file
+        arguments (dict[str, str]): arguments of the parser
+
+    Yields:
+        Iterator[tuple[str, str]]: line number and text of each line
+    """
+    if hasattr(parser, "iter_file"):
+        yield from parser.iter_file(filepath, arguments)
+    else:
+        yield from parser.parse_file(filepath, arguments)
+
+
 def call_is_filepath_valid(parser_name: str, filepath: str) -> tuple[bool, bool]:
     """call is_filepath_valid of a parser, and return result and existence of the
     method in the parser
@@ -12,20 +12,31 @@ tool to perform the analysis and returns structured results.
 
 # == Imports ==================================================================
 
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from logging import Logger
 import os
 from types import ModuleType
 
 from rawtextcheck.default_parameters import (
+    CHECK_MODE_FULL,
+    CHECK_MODE_QUICK,
     INVALID_CHAR_TEXT_ERROR_TYPE,
     INVALID_CHAR_TEXT_ERROR,
     BANWORD_TEXT_ERROR_TYPE,
-    BANWORD_TEXT_ERROR
+    BANWORD_TEXT_ERROR,
+    LANGUAGETOOL_SPELLING_CATEGORIES,
+    RESULTS_FIRST_CHUNK_LINES,
+    RESULTS_MAX_CHUNK_LINES
     )
 
 from rawtextcheck.logger import get_logger
-from rawtextcheck.newtype import ItemProject, ItemResult
-from rawtextcheck.script import json_projects, json_results, languagetool, parser_loader, utils
+from rawtextcheck.newtype import ItemMatch, ItemResult, ItemResultMetadata
+from rawtextcheck.script import compiled_project, json_results, languagetool, parser_loader, utils
+from rawtextcheck.script.banword_matcher import BanwordMatcher
+from rawtextcheck.script.cancellation import CancellationToken, is_cancelled
+from rawtextcheck.script.compiled_project import CompiledProject
+from rawtextcheck.script.invalid_characters import InvalidCharacterFinder
 
 
 # == Global Variables =========================================================
@@ -35,240 +46,222 @@ logger: Logger = get_logger(__name__)
 
 # == Functions ================================================================
 
-def remove_ignored_substrings(text: str, ignored_substrings: dict[str, list[str]], insert_space: bool) -> str:
-    """Remove substrings from text that are enclosed by any of the ignored substrings.
+def generate_errors_invalid_characters(texts: list[tuple[str, str]],
+                                       valid_characters: Iterable[str] | InvalidCharacterFinder
+                                       ) -> list[ItemResult]:
+    """create errors for invalid characters in line of texts
 
     Args:
-        text (str): The input text.
-        ignored_substrings (dict[str, list[str]]): A dictionary where keys are the starting
-        substrings and values are lists of possible ending substrings.
-        insert_space (bool): Whether to insert a space where substrings are removed.
+        texts (list[tuple[str, str]]): The input text
+        valid_characters (Iterable[str] | InvalidCharacterFinder): valid characters of the text,
+        as a str or a set, or already compiled
 
     Returns:
-        str: The text with the ignored substrings removed.
+        list[ItemResult]: invalid characters errors
     """
-    i: int = 0
-    result: list[str] = []  # Accumulator for the final result
-    length: int = len(text)
-
-    # Loop through the text character by character
-    while i < length:
-        matched = False  # Flag to know if a substring was matched and skipped
-
-        for start, ends in ignored_substrings.items():
-
-            if text.startswith(start, i):
-                start_index: int = i + len(start)
-                end_index: int = length  # Default to end of string if no end is found
-                found = False  # Flag to signal a successful end match
-
-                # Look for the first matching end pattern after the start
-                for j in range(start_index, length):
-                    for end in ends:
-                        # If the text at position j starts with an end pattern
-                        if text.startswith(end, j):
-                            end_index = j + len(end)  # Define where the ignored block ends
-                            found = True
-                            break
-                    if found:
-                        break
-
-                if found:
-                    if insert_space:
-                        result.append(' ')
-                    i = end_index  # Move index to the end of the ignored block
-                    matched = True  # Mark the match
-                    break
-
-        # If no start pattern matched at current position, keep the character
-        if not matched:
-            result.append(text[i])  # Append current character to result
-            i += 1
-
-    # Join all parts into a single string and return
-    return ''.join(result)
-
-
-def remove_ignored_codes(text: str, ignored_codes: list[str], insert_space: bool) -> str:
-    """Remove codes of the game from the string
+    invalid_characters_found: list[ItemResult] = []
 
-    Args:
-        text (str): The input text.
-        ignored_codes (dict[str]): A dictionary where codes to removes
-        substrings and values are the ending substrings.
-        insert_space (bool): Whether to insert a space where substrings are removed.
+    finder: InvalidCharacterFinder = (valid_characters if isinstance(valid_characters, InvalidCharacterFinder)
+                                      else InvalidCharacterFinder(valid_characters))
+    for index, c in finder.find([line for _, line in texts]):
+        line_number, line = texts[index]
+        invalid_characters_found.append(
+            ItemResult(line_number=line_number,
+                       line=line,
+                       error=c,
+                       error_type=INVALID_CHAR_TEXT_ERROR_TYPE,
+                       error_issue_type=INVALID_CHAR_TEXT_ERROR_TYPE,
+                       explanation=INVALID_CHAR_TEXT_ERROR,
+                       suggestion="")
+        )
+    return invalid_characters_found
 
-    Returns:
-        str: The text with the ignored substrings removed.
-    """
-    for code in ignored_codes:
-        if insert_space:
-            text = text.replace(code, " ")
-        else:
-            text = text.replace(code, "")
-    return text
-
-
-def remove_ignored_elements_in_texts(
-        texts: list[tuple[str, str]],
-        ignored_codes_into_space: list[str], ignored_codes_into_nothing: list[str],
-        ignored_substrings_into_space: dict[str, list[str]], ignored_substrings_into_nothing: dict[str, list[str]]
-        ) -> list[tuple[str, str]]:
-    """call remove_ignored_substrings and remove_ignored_codes on every line
-    ignored codes will be processed first, then ignored substrings
+
+def generate_errors_banwords(texts: list[tuple[str, str]],
+                             banwords: Iterable[str] | BanwordMatcher) -> list[ItemResult]:
+    """create errors for banword in line of texts
 
     Args:
-        texts (list[tuple[str, str]]): list of every [line number, line text]
-        ignored_codes_into_space (list[str]): List of codes to ignore, replacing with space.
-        ignored_codes_into_nothing (list[str]): List of codes to ignore, replacing with nothing.
-        ignored_substrings_into_space (dict[str, list[str]]): Substrings to ignore, replacing with space.
-        ignored_substrings_into_nothing (dict[str, list[str]]): Substrings to ignore, replacing with nothing.
+        texts (list[tuple[str, str]]): The input text
+        banwords (Iterable[str] | BanwordMatcher): banwords and banned phrases of the text,
+        as a list or a set, or already compiled
 
     Returns:
-        list[tuple[str, str]]: texts with ignored elements removed
+        list[ItemResult]: banword errors
     """
-    cleaned_texts: list[tuple[str, str]] = []
+    banwords_found_in_text: list[ItemResult] = []
 
+    matcher: BanwordMatcher = banwords if isinstance(banwords, BanwordMatcher) else BanwordMatcher(banwords)
+    if not matcher:
+        return banwords_found_in_text
     for line_number, line in texts:
-        line = remove_ignored_codes(line, ignored_codes_into_space, insert_space=True)
-        line = remove_ignored_codes(line, ignored_codes_into_nothing, insert_space=False)
-
-        line: str = remove_ignored_substrings(line, ignored_substrings_into_space, insert_space=True)
-        line = remove_ignored_substrings(line, ignored_substrings_into_nothing, insert_space=False)
-
-        if line:
-            cleaned_texts.append((line_number, line))
+        for banword in matcher.finditer(line):
+            banwords_found_in_text.append(
+                ItemResult(line_number=line_number,
+                           line=line,
+                           error=banword,
+                           error_type=BANWORD_TEXT_ERROR_TYPE,
+                           error_issue_type=BANWORD_TEXT_ERROR_TYPE,
+                           explanation=BANWORD_TEXT_ERROR,
+                           suggestion="")
+            )
+    return banwords_found_in_text
 
-    return cleaned_texts
 
+def iter_chunks(texts: Iterable[tuple[str, str]], first_size: int = RESULTS_FIRST_CHUNK_LINES,
+                max_size: int = RESULTS_MAX_CHUNK_LINES) -> Iterator[list[tuple[str, str]]]:
+    """Split lines into chunks, the first one small so its results are shown quickly,
+    the next ones twice bigger each time, up to max_size.
 
-def replace_codes_in_texts(texts: list[tuple[str, str]],
-                           replace_codes: dict[str, str]) -> list[tuple[str, str]]:
-    """replace codes in texts with the given replace_codes
     Args:
-        texts (list[tuple[str, str]]): list of every [line number, line text]
-        replace_codes (dict[str, str]): codes to replace with the given value
-    Returns:
-        list[tuple[str, str]]: texts with replaced codes
+        texts (Iterable[tuple[str, str]]): every [line number, line text]
+        first_size (int, optional): lines of the first chunk. Defaults to RESULTS_FIRST_CHUNK_LINES.
+        max_size (int, optional): maximum lines of a chunk. Defaults to RESULTS_MAX_CHUNK_LINES.
+
+    Yields:
+        Iterator[list[tuple[str, str]]]: lines of each chunk
     """
-    replaced_texts: list[tuple[str, str]] = []
-    for line_number, line in texts:
-        for code, replacement in replace_codes.items():
-            line = line.replace(code, replacement)
-        if line:
-            replaced_texts.append((line_number, line))
-    return replaced_texts
+    iterator: Iterator[tuple[str, str]] = iter(texts)
+    size: int = max(1, first_size)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+        size = max(size, min(size * 2, max_size))
 
 
-def generate_errors_invalid_characters(texts: list[tuple[str, str]],
-                                       valid_characters: str) -> list[ItemResult]:
-    """create errors for invalid characters in line of texts
+def generate_errors(texts: list[tuple[str, str]], project: CompiledProject,
+                    cancel_token: CancellationToken | None = None,
+                    check_mode: str = CHECK_MODE_FULL,
+                    analyzed_lines: dict[str, list[ItemMatch]] | None = None) -> list[ItemResult]:
+    """Generate every error of cleaned lines, sorted by line.
 
     Args:
-        texts (list[tuple[str, str]]): The input text
-        valid_characters (str): valid characters of the text
+        texts (list[tuple[str, str]]): cleaned [line number, line text]
+        project (CompiledProject): project of the file
+        cancel_token (CancellationToken | None, optional): stops LanguageTool between two batches.
+        Defaults to None.
+        check_mode (str, optional): CHECK_MODE_QUICK to run only the spelling rules of LanguageTool.
+        Defaults to CHECK_MODE_FULL.
+        analyzed_lines (dict[str, list[ItemMatch]] | None, optional): LanguageTool matches of the
+        lines of the previous chunks of the file, by line text. Defaults to None.
 
     Returns:
-        list[ItemResult]: invalid characters errors
+        list[ItemResult]: LanguageTool, invalid characters and banwords errors
     """
-    invalid_characters_found: list[ItemResult] = []
+    enabled_categories: list[str] = LANGUAGETOOL_SPELLING_CATEGORIES if check_mode == CHECK_MODE_QUICK else []
+    languagetool_result: list[ItemResult] = languagetool.analyze_text(texts,
+                                                                      project.dictionary,
+                                                                      project.ignored_rules,
+                                                                      cancel_token,
+                                                                      enabled_categories,
+                                                                      analyzed_lines)
 
-    for line_number, line in texts:
-        for c in line:
-            if c not in valid_characters:
-                invalid_characters_found.append(
-                    ItemResult(line_number=line_number,
-                               line=line,
-                               error=c,
-                               error_type=INVALID_CHAR_TEXT_ERROR_TYPE,
-                               error_issue_type=INVALID_CHAR_TEXT_ERROR_TYPE,
-                               explanation=INVALID_CHAR_TEXT_ERROR,
-                               suggestion="")
-                )
-    return invalid_characters_found
+    invalid_characters_result: list[ItemResult] = generate_errors_invalid_characters(
+        texts,
+        project.invalid_character_finder
+        )
 
+    banwords_result: list[ItemResult] = generate_errors_banwords(texts, project.banword_matcher)
 
-def generate_errors_banwords(texts: list[tuple[str, str]], banwords: list[str]) -> list[ItemResult]:
-    """create errors for banword in line of texts
+    line_order: dict[str, int] = {line_number: idx for idx, (line_number, _) in enumerate(texts)}
 
-    Args:
-        texts (list[tuple[str, str]]): The input text
-        banwords (list[str]): banwords of the text
+    return sorted(
+        languagetool_result + invalid_characters_result + banwords_result,
+        key=lambda item: (line_order.get(item["line_number"], float('inf')))
+    )
 
-    Returns:
-        list[ItemResult]: banword errors
+
+def iter_errors(texts: Iterable[tuple[str, str]], project: CompiledProject,
+                cancel_token: CancellationToken | None = None,
+                check_mode: str = CHECK_MODE_FULL) -> Iterator[list[ItemResult]]:
+    """Clean and analyze lines chunk by chunk.
+    A line repeated in several chunks is analyzed by LanguageTool once for the file,
+    the share of lines saved this way is logged once the file is analyzed.
+
+    Args:
+        texts (Iterable[tuple[str, str]]): every [line number, line text] of the file
+        project (CompiledProject): project of the file
+        cancel_token (CancellationToken | None, optional): stops before the next chunk,
+        or the next batch of LanguageTool. Defaults to None.
+        check_mode (str, optional): CHECK_MODE_FULL or CHECK_MODE_QUICK. Defaults to CHECK_MODE_FULL.
+
+    Yields:
+        Iterator[list[ItemResult]]: errors of each chunk, sorted by line
     """
-    banwords_found_in_text: list[ItemResult] = []
+    analyzed_lines: dict[str, list[ItemMatch]] = {}
+    lines_count: int = 0
+    unique_lines: set[str] = set()
+    for chunk in iter_chunks(texts):
+        if is_cancelled(cancel_token):
+            break
+        cleaned_texts: list[tuple[str, str]] = project.clean_texts(chunk)
+        if cleaned_texts:
+            lines_count += len(cleaned_texts)
+            unique_lines.update(line for _, line in cleaned_texts)
+            yield generate_errors(cleaned_texts, project, cancel_token, check_mode, analyzed_lines)
+    if lines_count:
+        logger.info("Deduplicated %d lines of the file into %d unique lines (%.1f%% saved)",
+                    lines_count, len(unique_lines), 100 * (1 - len(unique_lines) / lines_count))
+
+
+def iter_read_lines(texts: Iterator[tuple[str, str]],
+                    read_errors: list[Exception]) -> Iterator[tuple[str, str]]:
+    """Yield the lines read by the parser, and stop at its first error.
+    Only the errors of the parser are caught, the error is added to read_errors
+    so the run knows the file was not read completely.
 
-    for line_number, line in texts:
-        for word in line.split():
-            if word in banwords:
-                banwords_found_in_text.append(
-                    ItemResult(line_number=line_number,
-                               line=line,
-                               error=word,
-                               error_type=BANWORD_TEXT_ERROR_TYPE,
-                               error_issue_type=BANWORD_TEXT_ERROR_TYPE,
-                               explanation=BANWORD_TEXT_ERROR,
-                               suggestion="")
-                )
-    return banwords_found_in_text
+    Args:
+        texts (Iterator[tuple[str, str]]): lines of the parser
+        read_errors (list[Exception]): receives the error of the parser
 
+    Yields:
+        Iterator[tuple[str, str]]: every [line number, line text] read
+    """
+    try:
+        yield from texts
+    except Exception as e:
+        read_errors.append(e)
 
-def process_file(filepath: str, project_name: str, argument_parser: str) -> None:
+
+def process_file(filepath: str, project_name: str, argument_parser: str,
+                 on_results: Callable[[dict[str, ItemResult]], None] | None = None,
+                 cancel_token: CancellationToken | None = None,
+                 check_mode: str = CHECK_MODE_FULL) -> bool:
     """generate errors of a file
+    The errors are given to on_results chunk by chunk, as soon as they are found,
+    and saved once at the end. A cancelled run stops after the current batch
+    and saves nothing, the previous result of the file is kept. So does a run
+    stopped by an error of the parser while the file is read.
 
     Args:
         filepath (str): path of the file
         project_name (str): project_name, for how to manage process of the file
         argument_parser (str): argument for the parser
+        on_results (Callable[[dict[str, ItemResult]], None] | None, optional): called with
+        the new errors of each chunk, by id. Defaults to None.
+        cancel_token (CancellationToken | None, optional): token to stop the run. Defaults to None.
+        check_mode (str, optional): CHECK_MODE_FULL for every LanguageTool rule, CHECK_MODE_QUICK
+        for its spelling rules only, saved in the metadata of the result. Defaults to CHECK_MODE_FULL.
+
+    Returns:
+        bool: True if the result was saved
     """
 
-    project_data: ItemProject | None = json_projects.get_project_data(project_name)
-    if project_data is None:
-        return
+    project: CompiledProject | None = compiled_project.get_compiled_project(project_name)
+    if project is None:
+        return False
 
     # Merge default and dynamic parsers
     all_parsers: dict[str, ModuleType] = parser_loader.get_all_parsers()
 
-    parser_name: str = project_data["parser"]
+    parser_name: str = project.parser
     if parser_name not in all_parsers:
-        return
+        return False
 
     # Parse the file using the selected parser
     argument_parser_dict: dict[str, str] = utils.parse_attributes(argument_parser)
-    texts: list[tuple[str, str]] = all_parsers[parser_name].parse_file(filepath, argument_parser_dict)
-
-    texts = replace_codes_in_texts(texts, project_data["replace_codes"])
-
-    texts = remove_ignored_elements_in_texts(
-        texts,
-        project_data["ignored_codes_into_space"],
-        project_data["ignored_codes_into_nothing"],
-        project_data["ignored_substrings_into_space"],
-        project_data["ignored_substrings_into_nothing"]
-    )
-
-    languagetool.initialize_tool(project_data["language"])
-    languagetool_result: list[ItemResult] = languagetool.analyze_text(texts,
-                                                                      project_data["dictionary"],
-                                                                      project_data["ignored_rules"])
-
-    invalid_characters_result: list[ItemResult] = generate_errors_invalid_characters(
-        texts,
-        project_data["valid_characters"]
-        )
-
-    banwords_result: list[ItemResult] = generate_errors_banwords(texts, project_data["banwords"])
-
-    line_order: dict[str, int] = {line_number: idx for idx, (line_number, _) in enumerate(texts)}
-
-    all_result: list[ItemResult] = sorted(
-        languagetool_result + invalid_characters_result + banwords_result,
-        key=lambda item: (line_order.get(item["line_number"], float('inf')))
-    )
-
-    data: dict[str, ItemResult] = json_results.generate_id_errors(all_result)
+    # lines are read while they are checked, with iter_file if the parser has one
+    texts: Iterator[tuple[str, str]] = parser_loader.iter_parser_file(all_parsers[parser_name], filepath,
+                                                                      argument_parser_dict)
 
     filename: str = filepath
     result, success = parser_loader.call_get_filename(parser_name, filepath)
@@ -277,4 +270,28 @@ def process_file(filepath: str, project_name: str, argument_parser: str) -> None
     else:
         filename = os.path.basename(filepath)
 
+    if is_cancelled(cancel_token):
+        logger.info("Process of %s cancelled.", filename)
+        return False
+
+    languagetool.initialize_tool(project.language)
+
+    data: dict[str, ItemResult] = {}
+    logger.info("Checking %s in %s mode.", filename, check_mode)
+    read_errors: list[Exception] = []
+    for errors in iter_errors(iter_read_lines(texts, read_errors), project, cancel_token, check_mode):
+        new_data: dict[str, ItemResult] = json_results.generate_id_errors(errors, data)
+        data.update(new_data)
+        if on_results is not None and new_data:
+            on_results(new_data)
+
+    if read_errors:
+        # the parser shows its errors, the lines read before are not a complete result
+        logger.error("Process of %s stopped, the file could not be read: %s", filename, read_errors[0])
+        return False
+    if is_cancelled(cancel_token):
+        logger.info("Process of %s cancelled.", filename)
+        return False
     json_results.save_data(project_name, filename, data)
+    json_results.save_metadata(project_name, filename, ItemResultMetadata(check_mode=check_mode))
+    return True
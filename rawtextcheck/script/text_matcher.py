@@ -0,0 +1,235 @@
+"""
+File        : text_matcher.py
+Author      : Silous
+Created on  : 2026-10-17
+Description : Compiled matchers used to clean lines before analysis.
+
+This module compiles the replace codes, the ignored codes and the ignored substrings
+of a project into a TextCleaner built once and reused on every line. Words are stored in a trie
+which is then translated into one regular expression, so the regex engine walks
+every word sharing a prefix at the same time instead of doing one pass per word.
+
+Matching semantics are leftmost-longest: the line is scanned from left to right,
+and at each position the longest code (or start delimiter) starting there wins.
+The result does not depend on the order of the codes in the project, and a
+replaced part is never scanned again, so removing a code can't create a new one.
+
+The TextCleaner fuses every cleaning of a project in one traversal per line.
+Compared to the replace codes, ignored codes and ignored substrings applied one
+after the other, the value of a replace code is not cleaned afterwards, and
+ignored codes are not removed before the ignored substrings are searched: at
+each position, the longest code or start delimiter wins.
+"""
+
+
+# == Imports ==================================================================
+
+from collections.abc import Iterable, Iterator
+import re
+
+
+# == Functions ================================================================
+
+def _build_trie(words: Iterable[str]) -> dict[str, dict]:
+    """Build a trie of the words, an empty key marks the end of a word.
+
+    Args:
+        words (Iterable[str]): words to insert, empty words are ignored.
+
+    Returns:
+        dict[str, dict]: root node of the trie
+    """
+    root: dict[str, dict] = {}
+    for word in words:
+        if not word:
+            continue
+        node: dict[str, dict] = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return root
+
+
+def _trie_to_pattern(node: dict[str, dict]) -> str:
+    """Translate a trie node into a regex source.
+    Longer branches are tried before the end of a word, so the regex
+    always matches the longest word at a position.
+
+    Args:
+        node (dict[str, dict]): node of the trie
+
+    Returns:
+        str: regex source matching every word below this node
+    """
+    is_terminal: bool = "" in node
+    leaves: list[str] = []
+    branches: list[str] = []
+
+    for char in sorted(key for key in node if key):
+        child: dict[str, dict] = node[char]
+        if list(child) == [""]:
+            leaves.append(char)
+        else:
+            branches.append(re.escape(char) + _trie_to_pattern(child))
+
+    if len(leaves) == 1:
+        branches.append(re.escape(leaves[0]))
+    elif leaves:
+        branches.append("[" + "".join(re.escape(char) for char in leaves) + "]")
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not is_terminal:
+        return branches[0]
+    pattern: str = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if is_terminal else pattern
+
+
+def build_trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex source matching any of the words, leftmost-longest.
+
+    Args:
+        words (Iterable[str]): words to match, empty words are ignored.
+
+    Returns:
+        str: regex source, empty if there is no word
+    """
+    return _trie_to_pattern(_build_trie(words))
+
+
+# == Classes ==================================================================
+
+class TextCleaner:
+    """Replace codes, ignored codes and ignored substrings of a line in one left-to-right pass.
+    An ignored substring goes from a start delimiter to the first end delimiter
+    of this start found after it. Ignored codes and substrings into space are
+    replaced with a space, into nothing are removed.
+
+    At a position, the longest code or start delimiter is used, a start delimiter
+    is only used if it has an end. For the same text, replace codes come first,
+    then ignored codes into space, into nothing, substrings into space and into
+    nothing. A start delimiter without any end after it is kept as text.
+    Replacements are never scanned again.
+    """
+
+    def __init__(self, replace_codes: dict[str, str],
+                 codes_into_space: Iterable[str], codes_into_nothing: Iterable[str],
+                 substrings_into_space: dict[str, list[str]],
+                 substrings_into_nothing: dict[str, list[str]]) -> None:
+        """Compile the cleaner.
+
+        Args:
+            replace_codes (dict[str, str]): codes to replace with the given value
+            codes_into_space (Iterable[str]): codes to replace with a space
+            codes_into_nothing (Iterable[str]): codes to remove
+            substrings_into_space (dict[str, list[str]]): start delimiters and their possible
+            end delimiters, replaced with a space
+            substrings_into_nothing (dict[str, list[str]]): start delimiters and their possible
+            end delimiters, removed
+        """
+        replacements: dict[str, str] = {code: "" for code in codes_into_nothing}
+        replacements.update({code: " " for code in codes_into_space})
+        replacements.update(replace_codes)
+        self._replacements: dict[str, str] = {code: value for code, value in replacements.items() if code}
+
+        # (code or start delimiter, end delimiters regex or None for a code, replacement), longest first
+        self._entries: list[tuple[str, re.Pattern[str] | None, str]] = [
+            (code, None, value) for code, value in self._replacements.items()
+        ]
+        for substrings, replacement in ((substrings_into_space, " "), (substrings_into_nothing, "")):
+            for start, ends in substrings.items():
+                end_pattern: str = build_trie_pattern(ends)
+                if start and end_pattern:
+                    self._entries.append((start, re.compile(end_pattern), replacement))
+        self._entries.sort(key=lambda entry: len(entry[0]), reverse=True)
+        self._has_substrings: bool = any(end_regex is not None for _, end_regex, _ in self._entries)
+
+        # entries indexed by their first character
+        self._entries_by_char: dict[str, list[int]] = {}
+        for index, (key, _, _) in enumerate(self._entries):
+            self._entries_by_char.setdefault(key[0], []).append(index)
+
+        self._pattern: re.Pattern[str] | None = None
+        if self._entries:
+            self._pattern = re.compile(build_trie_pattern(key for key, _, _ in self._entries))
+
+    def __bool__(self) -> bool:
+        """True if the cleaner has at least one code or pair of delimiters."""
+        return self._pattern is not None
+
+    def _iter_replaced(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Find every part of the text to replace, from left to right.
+
+        Args:
+            text (str): the input text
+
+        Yields:
+            tuple[int, int, str]: start, end and replacement of a replaced part
+        """
+        if self._pattern is None:
+            return
+        position: int = 0
+        # last end found for each delimiter, reused while it is still ahead,
+        # None once no end exists after the given index
+        found_ends: dict[int, tuple[int, re.Match[str] | None]] = {}
+
+        while True:
+            match: re.Match[str] | None = self._pattern.search(text, position)
+            if match is None:
+                return
+            index: int = match.start()
+            end_index: int = -1
+
+            for entry_index in self._entries_by_char[text[index]]:
+                key, end_regex, replacement = self._entries[entry_index]
+                if not text.startswith(key, index):
+                    continue
+                if end_regex is None:
+                    end_index = index + len(key)
+                    yield index, end_index, replacement
+                    break
+                search_from: int = index + len(key)
+                end_match: re.Match[str] | None
+                if entry_index in found_ends:
+                    searched_from, end_match = found_ends[entry_index]
+                    if end_match is None and searched_from <= search_from:
+                        continue
+                    if end_match is None or end_match.start() < search_from:
+                        end_match = end_regex.search(text, search_from)
+                        found_ends[entry_index] = (search_from, end_match)
+                else:
+                    end_match = end_regex.search(text, search_from)
+                    found_ends[entry_index] = (search_from, end_match)
+                if end_match is not None:
+                    end_index = end_match.end()
+                    yield index, end_index, replacement
+                    break
+
+            position = index + 1 if end_index == -1 else end_index
+
+    def sub(self, text: str) -> str:
+        """Clean the text.
+
+        Args:
+            text (str): the input text
+
+        Returns:
+            str: the cleaned text
+        """
+        if self._pattern is None:
+            return text
+        if not self._has_substrings:
+            replacements: dict[str, str] = self._replacements
+            return self._pattern.sub(lambda match: replacements[match.group()], text)
+
+        result: list[str] = []
+        last_end: int = 0
+        for start, end, replacement in self._iter_replaced(text):
+            result.append(text[last_end:start])
+            result.append(replacement)
+            last_end = end
+        if not result:
+            return text
+        result.append(text[last_end:])
+        return "".join(result)
+
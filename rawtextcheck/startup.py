@@ -5,7 +5,9 @@ Created on  : 2025-07-26
 Description : Startup module for the CheckFrench application.
 
 This module handles the initialization of the application,
-including creating necessary folders, creating JSON configuration.
+including creating necessary folders, creating JSON configuration,
+setting the LanguageTool servers and starting them for the last project
+in the background.
 """
 
 
@@ -14,9 +16,9 @@ including creating necessary folders, creating JSON configuration.
 import os
 
 from rawtextcheck.api import google_sheet_api
-from rawtextcheck.default_parameters import RESULTS_FOLDER, PLUGIN_PARSER_FOLDER
-from rawtextcheck.newtype import ItemConfig
-from rawtextcheck.script import json_config, json_projects
+from rawtextcheck.default_parameters import LANGUAGETOOL_PREWARM, RESULTS_FOLDER, PLUGIN_PARSER_FOLDER
+from rawtextcheck.newtype import ItemConfig, ItemProject
+from rawtextcheck.script import json_config, json_projects, languagetool
 
 
 # == Functions ================================================================
@@ -46,9 +48,33 @@ def set_google_credentials() -> None:
         google_sheet_api.set_credentials_info(config["credentials_google"])
 
 
-def startup_everything() -> None:
-    """Call every function of startup.py"""
+def configure_languagetool() -> None:
+    """Set the settings of the LanguageTool servers from the config file."""
+    languagetool.configure_servers(json_config.get_languagetool_server())
+
+
+def prewarm_languagetool() -> None:
+    """Start LanguageTool in the background for the language of the last project."""
+    project_name: str = json_config.load_data()["last_project"]
+    if not json_projects.is_project_name_exist(project_name):
+        return
+    project: ItemProject | None = json_projects.get_project_data(project_name)
+    if project is None or not project["language"]:
+        return
+    languagetool.prewarm(project["language"])
+
+
+def startup_everything(prewarm: bool = LANGUAGETOOL_PREWARM) -> None:
+    """Call every function of startup.py
+
+    Args:
+        prewarm (bool, optional): if True, start LanguageTool for the last project.
+        Defaults to LANGUAGETOOL_PREWARM.
+    """
     create_folders()
     create_json_config()
     create_json_projects()
     set_google_credentials()
+    configure_languagetool()
+    if prewarm:
+        prewarm_languagetool()
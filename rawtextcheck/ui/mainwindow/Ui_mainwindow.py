@@ -42,9 +42,15 @@ class Ui_MainWindow(object):
         self.horizontalLayout_4.setObjectName("horizontalLayout_4")
         self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.comboBox_checkMode = QtWidgets.QComboBox(self.centralwidget)
+        self.comboBox_checkMode.setObjectName("comboBox_checkMode")
+        self.horizontalLayout_3.addWidget(self.comboBox_checkMode)
         self.pushButton_process = QtWidgets.QPushButton(self.centralwidget)
         self.pushButton_process.setObjectName("pushButton_process")
         self.horizontalLayout_3.addWidget(self.pushButton_process)
+        self.pushButton_cancel = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_cancel.setObjectName("pushButton_cancel")
+        self.horizontalLayout_3.addWidget(self.pushButton_cancel)
         self.label_updateResult = QtWidgets.QLabel(self.centralwidget)
         self.label_updateResult.setObjectName("label_updateResult")
         self.horizontalLayout_3.addWidget(self.label_updateResult)
@@ -119,6 +125,7 @@ class Ui_MainWindow(object):
         MainWindow.setWindowTitle(_translate("MainWindow", "RawTextCheck"))
         self.label_fileOpened.setText(_translate("MainWindow", "test_result"))
         self.pushButton_process.setText(_translate("MainWindow", "Process"))
+        self.pushButton_cancel.setText(_translate("MainWindow", "Cancel"))
         self.label_updateResult.setText(_translate("MainWindow", "last_update"))
         self.label_argument.setText(_translate("MainWindow", "Argument parser"))
         self.menuManage.setTitle(_translate("MainWindow", "Manage"))
@@ -13,22 +13,29 @@ from typing import List
 # -------------------- Import Lib Tier -------------------
 from PyQt5.QtCore import QMimeData, QModelIndex, QUrl, QItemSelectionModel
 from PyQt5.QtGui import QCloseEvent, QDragEnterEvent, QDropEvent
-from PyQt5.QtWidgets import QMainWindow, QAction, QMenu, QActionGroup, QFileDialog, QMessageBox
+from PyQt5.QtWidgets import QMainWindow, QAction, QMenu, QActionGroup, QFileDialog, QLabel, QMessageBox
 
 # -------------------- Import Lib User -------------------
 from rawtextcheck.api import google_sheet_api
 from rawtextcheck.default_parameters import (
+    CHECK_MODE_FULL,
+    CHECK_MODE_QUICK,
+    CHECK_MODES,
     INVALID_CHAR_TEXT_ERROR_TYPE,
     BANWORD_TEXT_ERROR_TYPE,
     LANGUAGETOOL_SPELLING_CATEGORY,
+    LANGUAGETOOL_STATE_FAILED,
+    LANGUAGETOOL_STATE_READY,
+    LANGUAGETOOL_STATE_STARTING,
     LANGUAGES
 )
 from rawtextcheck.newtype import ItemResult
-from rawtextcheck.script import json_config
+from rawtextcheck.script import json_config, languagetool
+from rawtextcheck.script.cancellation import CancellationToken
 from rawtextcheck.ui.mainwindow.mainwindow_model import MainWindowModel
 from rawtextcheck.ui.mainwindow.Ui_mainwindow import Ui_MainWindow
 from rawtextcheck.ui.project_manager.project_manager import DialogProjectManager
-from rawtextcheck.ui.messagebox import popup_manager
+from rawtextcheck.ui.messagebox import Popup, popup_manager
 
 
 # == Classes ==================================================================
@@ -51,6 +58,8 @@ class MainWindow(QMainWindow):
 
         self.ui.tableView_result.set_columns_hidden_by_default(json_config.load_data()["hidden_column"])
         self.set_up_language_menu()
+        self.set_up_check_mode()
+        self.set_up_engine_status()
         self.set_up_model()
         self.set_up_connect()
 
@@ -62,6 +71,8 @@ class MainWindow(QMainWindow):
 
         self.ui.label_fileOpened.setText("")
         self.ui.label_updateResult.hide()
+        self.ui.pushButton_cancel.hide()
+        self.cancel_token: CancellationToken | None = None
 
         self.ui.tableView_result.custom_context_actions_requested.connect(self.add_custom_actions_to_menu)
 
@@ -87,6 +98,18 @@ class MainWindow(QMainWindow):
         self.action_language.setMenu(language_menu)
         self.ui.menuPreference.addAction(self.action_language)  # type: ignore
 
+    def set_up_check_mode(self) -> None:
+        """Fill the check mode combobox, the code of the mode is the item data."""
+        for code, name in CHECK_MODES:
+            self.ui.comboBox_checkMode.addItem(name, code)
+
+    def set_up_engine_status(self) -> None:
+        """Show the state of LanguageTool in the status bar."""
+        self.label_engineStatus = QLabel(self)
+        self.statusBar().addPermanentWidget(self.label_engineStatus)  # type: ignore
+        languagetool.engine_status.changed.connect(self.engine_status_changed)
+        self.engine_status_changed(languagetool.engine_status.language, languagetool.engine_status.state)
+
     def set_up_model(self) -> None:
         """Initialize the model for the main window."""
         self.model = MainWindowModel(self.ui.comboBox_project.currentText(), "")
@@ -106,8 +129,10 @@ class MainWindow(QMainWindow):
         self.ui.lineEdit_filepath.textChanged.connect(self.lineEdit_filepath_textChanged)
         # pushbutton
         self.ui.pushButton_process.clicked.connect(self.pushButton_process_clicked)
+        self.ui.pushButton_cancel.clicked.connect(self.pushButton_cancel_clicked)
         # worker
         self.model.worker.signal_run_process_start.connect(self.model.worker.run_process)
+        self.model.worker.signal_results_found.connect(self.model.resultsTableModel.append_data)
         self.model.worker.signal_run_process_finished.connect(self.run_process_finished)
 
 # -------------------- Slots --------------------
@@ -135,6 +160,7 @@ class MainWindow(QMainWindow):
         self.ui.lineEdit_argument.setText(self.model.get_argument_parser(index))
         self.model.resultsTableModel.project_name = self.model.titleComboBoxModel.get_value(index) or ""
         self.model.resultsTableModel.load_data()
+        self.show_result_check_mode()
         self.set_enabled_project_has_project(self.ui.comboBox_project.count() > 0)
 
     def lineEdit_filepath_textChanged(self) -> None:
@@ -151,6 +177,7 @@ class MainWindow(QMainWindow):
             self.model.resultsTableModel.filename = filename
             self.ui.label_fileOpened.setText(filename)
             self.model.resultsTableModel.load_data()
+            self.show_result_check_mode()
             self.set_enabled_file_valid(True)
         else:
             if self.ui.lineEdit_filepath.text():
@@ -167,19 +194,66 @@ class MainWindow(QMainWindow):
         project_name: str | None = self.model.titleComboBoxModel.get_value(self.ui.comboBox_project.currentIndex())
         if project_name is None:
             return
+        if (self.ui.comboBox_checkMode.currentData() == CHECK_MODE_QUICK
+                and self.model.resultsTableModel.check_mode == CHECK_MODE_FULL
+                and not Popup.question(self, self.tr("Quick check"),
+                                       self.tr("The result of this file comes from a full check. "
+                                               "A quick check replaces it with the spelling errors only. "
+                                               "Continue?"))):
+            return
         self.set_enabled_during_process(False)
+        # errors are added to the table while the file is processed
+        self.model.resultsTableModel.clear_data()
+        self.cancel_token = CancellationToken()
+        self.ui.pushButton_cancel.setEnabled(True)
+        self.ui.pushButton_cancel.show()
         self.model.worker.signal_run_process_start.emit(
             self.ui.lineEdit_filepath.text(),
             project_name,
-            self.ui.lineEdit_argument.text()
+            self.ui.lineEdit_argument.text(),
+            self.ui.comboBox_checkMode.currentData(),
+            self.cancel_token
             )
 
-    def run_process_finished(self) -> None:
+    def pushButton_cancel_clicked(self) -> None:
+        """Slot when the cancel button is clicked.
+        The worker stops after the batch being analyzed.
+        """
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        self.ui.pushButton_cancel.setEnabled(False)
+
+    def engine_status_changed(self, language: str, state: str) -> None:
+        """Slot when the state of LanguageTool changes.
+        Args:
+            language (str): language code of the servers
+            state (str): new state of the servers
+        """
+        if state == LANGUAGETOOL_STATE_STARTING:
+            text: str = self.tr("LanguageTool ({0}): starting...").format(language)
+        elif state == LANGUAGETOOL_STATE_READY:
+            text = self.tr("LanguageTool ({0}): ready").format(language)
+        elif state == LANGUAGETOOL_STATE_FAILED:
+            text = self.tr("LanguageTool ({0}): failed to start").format(language)
+        else:
+            text = ""
+        self.label_engineStatus.setText(text)
+
+    def run_process_finished(self, saved: bool) -> None:
         """Slot when the worker process is finished.
-        Updates the model and UI after processing is complete.
+        Updates the UI after processing is complete, the table already has the errors.
+        If the result was not saved, the previous result is loaded again.
+        Args:
+            saved (bool): True if the result was saved
         """
         self.set_enabled_during_process(True)
-        self.model.resultsTableModel.load_data()
+        self.cancel_token = None
+        self.ui.pushButton_cancel.hide()
+        if not saved:
+            self.model.resultsTableModel.load_data()
+        else:
+            self.model.resultsTableModel.load_check_mode()
+        self.show_result_check_mode()
 
 # -------------------- Events --------------------
 
@@ -226,12 +300,34 @@ class MainWindow(QMainWindow):
         """
         json_config.set_last_project(self.ui.comboBox_project.currentText())
         json_config.set_hidden_column(self.ui.tableView_result.get_hidden_columns_labels())
+        # a running process stops after its current batch, so the worker thread can end
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
         self.model.model_stop()
         if a0 is not None:
             a0.accept()
 
 # -------------------- Methods --------------------
 
+    def show_result_check_mode(self) -> None:
+        """Show the check mode of the loaded result next to the file name,
+        and select it for the next check of the file.
+        """
+        filename: str = self.model.resultsTableModel.filename
+        check_mode: str | None = self.model.resultsTableModel.check_mode
+        if not filename:
+            return
+        if check_mode is None:
+            self.ui.label_fileOpened.setText(filename)
+            return
+        index: int = self.ui.comboBox_checkMode.findData(check_mode)
+        if index >= 0:
+            self.ui.comboBox_checkMode.setCurrentIndex(index)
+        if check_mode == CHECK_MODE_QUICK:
+            self.ui.label_fileOpened.setText(self.tr("{0} (quick check, spelling only)").format(filename))
+        else:
+            self.ui.label_fileOpened.setText(filename)
+
     def set_enabled_file_valid(self, is_valid: bool) -> None:
         """Enable or disable UI elements based on file validity.
         Args:
@@ -258,6 +354,7 @@ class MainWindow(QMainWindow):
         self.ui.comboBox_project.setEnabled(is_enabled)
         self.ui.lineEdit_filepath.setEnabled(is_enabled)
         self.ui.pushButton_process.setEnabled(is_enabled)
+        self.ui.comboBox_checkMode.setEnabled(is_enabled)
         self.ui.tableView_result.setEnabled(is_enabled)
         self.ui.menuManage.setEnabled(is_enabled)
         self.ui.menuPreference.setEnabled(is_enabled)
@@ -21,13 +21,15 @@ from PyQt5.QtCore import QCoreApplication as QCA
 
 # -------------------- Import Lib User -------------------
 from rawtextcheck.default_parameters import (
+    CHECK_MODE_FULL,
     INVALID_CHAR_TEXT_ERROR_TYPE,
     BANWORD_TEXT_ERROR_TYPE,
     LANGUAGETOOL_SPELLING_CATEGORY,
 )
 from rawtextcheck.logger import get_logger
-from rawtextcheck.newtype import ItemProject, ItemResult
+from rawtextcheck.newtype import ItemProject, ItemResult, ItemResultMetadata
 from rawtextcheck.script import json_projects, json_results, languagetool, parser_loader
+from rawtextcheck.script.cancellation import CancellationToken
 from rawtextcheck.ui.mainwindow.mainwindow_worker import WorkerMainWindow
 
 
@@ -122,9 +124,10 @@ class MainWindowModel():
         else:
             return os.path.basename(filepath)
 
-    def generate_result(self, filepath: str, project_name: str, argument_parser: str) -> None:
+    def generate_result(self, filepath: str, project_name: str, argument_parser: str,
+                        check_mode: str = CHECK_MODE_FULL) -> None:
 
-        self.worker.run_process(filepath, project_name, argument_parser)
+        self.worker.run_process(filepath, project_name, argument_parser, check_mode, CancellationToken())
 
 
 class ProjectTitleComboBoxModel(QAbstractListModel):
@@ -195,6 +198,7 @@ class ResultsTableModel(QAbstractTableModel):
     Attributes:
         _keys (list[str]): List of IDs (keys) for the result items.
         _data (dict[str, ItemResult]): Mapping of ID to result data.
+        check_mode (str | None): check mode of the loaded result, None if no result is loaded.
     """
 
     HEADERS: list[str] = [QCA.translate("column title", "Line Number"),
@@ -214,6 +218,8 @@ class ResultsTableModel(QAbstractTableModel):
         self.project_name: str = project_name
         self.filename: str = file_name
         self._keys: list[str] = []
+        self._data: dict[str, ItemResult] = {}
+        self.check_mode: str | None = None
         if file_name != "":
             self.load_data()
 
@@ -227,13 +233,35 @@ class ResultsTableModel(QAbstractTableModel):
         self._data: dict[str, ItemResult] = json_results.get_file_data(self.project_name, self.filename)
         self._keys = list(self._data.keys())
         self.endResetModel()
+        self.load_check_mode()
+
+    def load_check_mode(self) -> None:
+        """Load the check mode of the result from its metadata.
+        A result saved without metadata comes from a full check.
+        """
+        metadata: ItemResultMetadata | None = json_results.get_metadata(self.project_name, self.filename)
+        self.check_mode = metadata["check_mode"] if metadata is not None else CHECK_MODE_FULL
 
     def clear_data(self) -> None:
         self.beginResetModel()
         self._data = {}
         self._keys = []
+        self.check_mode = None
         self.endResetModel()
 
+    def append_data(self, data: dict[str, ItemResult]) -> None:
+        """Add rows at the end of the model, without reloading the JSON file.
+        Args:
+            data (dict[str, ItemResult]): new errors by id
+        """
+        if not data:
+            return
+        first_row: int = len(self._keys)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(data) - 1)
+        self._data.update(data)
+        self._keys.extend(data)
+        self.endInsertRows()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return the number of rows in the model."""
         return len(self._keys)
@@ -8,9 +8,21 @@ Description : Worker for the main window to handle background tasks.
 
 # == Imports ==================================================================
 
+from logging import Logger
+
 from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QCoreApplication as QCA
 
+from rawtextcheck.logger import get_logger
+from rawtextcheck.newtype import ItemResult
+from rawtextcheck.script.cancellation import CancellationToken
 from rawtextcheck.script.process import process_file
+from rawtextcheck.ui.messagebox import popup_manager
+
+
+# == Global Variables =========================================================
+
+logger: Logger = get_logger(__name__)
 
 
 # == Classes ==================================================================
@@ -18,20 +30,44 @@ from rawtextcheck.script.process import process_file
 class WorkerMainWindow(QObject):
     """Worker for the main window to handle background tasks."""
 
-    signal_run_process_start = pyqtSignal(str, str, str)
-    signal_run_process_finished = pyqtSignal()
+    signal_run_process_start = pyqtSignal(str, str, str, str, object)  # ..., check mode, CancellationToken
+    signal_results_found = pyqtSignal(dict)  # new errors by id
+    signal_run_process_finished = pyqtSignal(bool)  # True if the result was saved
 
     def __init__(self) -> None:
         """Initialize the WorkerMainWindow."""
         super().__init__()
 
-    def run_process(self, filepath: str, project_name: str, argument_parser: str) -> None:
+    def run_process(self, filepath: str, project_name: str, argument_parser: str,
+                    check_mode: str, cancel_token: CancellationToken) -> None:
         """Run the file processing in a separate thread.
+        The errors are sent with signal_results_found as soon as they are found.
+        An unexpected error of the check is shown, and the result is not saved.
         Args:
             filepath (str): The path to the file to process.
             project_name (str): The name of the project.
             argument_parser (str): The parser to use for processing.
+            check_mode (str): CHECK_MODE_FULL or CHECK_MODE_QUICK.
+            cancel_token (CancellationToken): token cancelled by the main window to stop the process.
         """
 
-        process_file(filepath, project_name, argument_parser)
-        self.signal_run_process_finished.emit()
+        saved: bool = False
+        try:
+            saved = process_file(filepath, project_name, argument_parser, self.emit_results, cancel_token,
+                                 check_mode)
+        except Exception as e:
+            logger.error("Error during the check of %s: %s", filepath, e, exc_info=True)
+            popup_manager.show_error.emit(
+                QCA.translate("window title", "Check Error"),
+                QCA.translate("message error", "Error during the check of the file, the result was not saved: {0}")
+                .format(e)
+            )
+        finally:
+            self.signal_run_process_finished.emit(saved)
+
+    def emit_results(self, data: dict[str, ItemResult]) -> None:
+        """Send new errors to the main window.
+        Args:
+            data (dict[str, ItemResult]): new errors by id
+        """
+        self.signal_results_found.emit(data)
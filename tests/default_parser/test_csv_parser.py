@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.default_parser import csv_parser
+
+
+class TestCsvParser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "file.csv")
+        with open(self.filepath, "w", encoding="utf-8", newline="") as f:
+            f.write("id1,Bonjour\n,   \nid3,Texte\n")
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_column_with_id_column(self) -> None:
+        self.assertEqual(csv_parser.parse_file(self.filepath, {"col": "2", "colID": "1"}),
+                         [("id1", "Bonjour"), ("id3", "Texte")])
+
+    def test_invalid_file(self) -> None:
+        with open(self.filepath, "ab") as f:
+            f.write(b"id4,\xff\xfe\n")
+        with patch.object(csv_parser, "popup_manager") as popup_manager:
+            self.assertEqual(csv_parser.parse_file(self.filepath, {"col": "2"}), [])
+            with self.assertRaises(UnicodeDecodeError):
+                list(csv_parser.iter_file(self.filepath, {"col": "2"}))
+        self.assertEqual(popup_manager.show_error.emit.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from openpyxl import Workbook
+
+from rawtextcheck.default_parser import excel_parser
+
+
+class TestExcelParser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "file.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "id1"
+        ws["B1"] = "Bonjour"
+        ws["B3"] = "   "
+        ws["A5"] = None
+        ws["B5"] = "Cinq"
+        ws["D6"] = "Loin"
+        ws["B7"] = 7.5
+        wb.save(self.filepath)
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_column_with_row_number(self) -> None:
+        self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "B"}),
+                         [("1", "Bonjour"), ("5", "Cinq"), ("7", "7.5")])
+
+    def test_column_with_id_column(self) -> None:
+        self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "B", "colID": "A"}),
+                         [("id1", "Bonjour"), ("5", "Cinq"), ("7", "7.5")])
+        self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "D", "colID": "A"}), [("6", "Loin")])
+
+    def test_invalid_argument(self) -> None:
+        with patch.object(excel_parser, "popup_manager"):
+            self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "1"}), [])
+
+    def test_invalid_file(self) -> None:
+        with open(self.filepath, "wb") as f:
+            f.write(b"not an excel file")
+        with patch.object(excel_parser, "popup_manager") as popup_manager:
+            self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "B"}), [])
+            with self.assertRaises(Exception):
+                list(excel_parser.iter_file(self.filepath, {"col": "B"}))
+        self.assertEqual(popup_manager.show_error.emit.call_count, 2)
+
+    def test_workbook_closed_when_reading_stops(self) -> None:
+        workbooks = []
+
+        def load_workbook(*args, **kwargs):
+            workbook = real_load_workbook(*args, **kwargs)
+            workbook.close = Mock(wraps=workbook.close)
+            workbooks.append(workbook)
+            return workbook
+
+        real_load_workbook = excel_parser.load_workbook
+        with patch.object(excel_parser, "load_workbook", load_workbook):
+            lines = excel_parser.iter_file(self.filepath, {"col": "B"})
+            self.assertEqual(next(lines), ("1", "Bonjour"))
+            self.assertTrue(workbooks[0].read_only)
+            workbooks[0].close.assert_not_called()
+            lines.close()
+        workbooks[0].close.assert_called_once()
+
+class TestExcelParserSheets(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "chapters.xlsx")
+        wb = Workbook()
+        wb.active.title = "Intro"
+        wb.active["A1"] = "Bienvenue"
+        for chapter in range(1, 4):
+            ws = wb.create_sheet(f"Chapitre {chapter}")
+            ws["A1"] = f"Ligne un du chapitre {chapter}"
+            ws["A3"] = f"Ligne trois du chapitre {chapter}"
+        wb.save(self.filepath)
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_select_sheets(self) -> None:
+        sheet_names = ["Intro", "Chapitre 1", "2"]
+        self.assertEqual(excel_parser.select_sheets(sheet_names, "All"), sheet_names)
+        self.assertEqual(excel_parser.select_sheets(sheet_names, "2|Chapitre 1|1"), ["2", "Chapitre 1", "Intro"])
+        with patch.object(excel_parser, "popup_manager"):
+            self.assertEqual(excel_parser.select_sheets(sheet_names, "Chapitre 9|1"), ["Intro"])
+
+    def test_one_sheet_prefixed(self) -> None:
+        self.assertEqual(excel_parser.parse_file(self.filepath, {"col": "A", "sheets": "Chapitre 2"}),
+                         [("Chapitre 2!1", "Ligne un du chapitre 2"), ("Chapitre 2!3", "Ligne trois du chapitre 2")])
+
+    def test_sheets_in_parallel_in_order(self) -> None:
+        with patch.object(excel_parser, "PARALLEL_MIN_FILE_SIZE", 0):
+            lines = excel_parser.parse_file(self.filepath, {"col": "A", "sheets": "4|Chapitre 1|1"})
+            self.assertEqual([row_id for row_id, _ in lines],
+                             ["Chapitre 3!1", "Chapitre 3!3", "Chapitre 1!1", "Chapitre 1!3", "Intro!1"])
+            self.assertEqual(len(excel_parser.parse_file(self.filepath, {"col": "A", "sheets": "all"})), 7)
+
+    def test_small_file_sheets_in_order_without_processes(self) -> None:
+        with patch.object(excel_parser, "iter_sheets_parallel") as iter_sheets_parallel:
+            lines = excel_parser.parse_file(self.filepath, {"col": "A", "sheets": "4|Chapitre 1|1"})
+        iter_sheets_parallel.assert_not_called()
+        self.assertEqual([row_id for row_id, _ in lines],
+                         ["Chapitre 3!1", "Chapitre 3!3", "Chapitre 1!1", "Chapitre 1!3", "Intro!1"])
+
+    def test_read_sheet(self) -> None:
+        self.assertEqual(excel_parser.read_sheet(self.filepath, "Intro", 1, None), [("Intro!1", "Bienvenue")])
+
+
+if __name__ == "__main__":
+    unittest.main()
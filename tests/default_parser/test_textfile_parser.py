@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.default_parser import textfile_parser
+
+
+class TestTextfileParser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "file.txt")
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            f.write("Bonjour\n\n  Texte  \nFin\n")
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_lines(self) -> None:
+        self.assertEqual(textfile_parser.parse_file(self.filepath, {}),
+                         [("1", "Bonjour"), ("3", "Texte"), ("4", "Fin")])
+
+    def test_invalid_file(self) -> None:
+        with open(self.filepath, "ab") as f:
+            f.write(b"\xff\xfe")
+        with patch.object(textfile_parser, "popup_manager") as popup_manager:
+            self.assertEqual(textfile_parser.parse_file(self.filepath, {}), [])
+            with self.assertRaises(UnicodeDecodeError):
+                list(textfile_parser.iter_file(self.filepath, {}))
+        self.assertEqual(popup_manager.show_error.emit.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
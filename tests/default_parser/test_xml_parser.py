@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.default_parser import xml_parser
+
+
+XML_CONTENT = """<?xml version="1.0" encoding="utf-8"?>
+<root xmlns:x="urn:x" xmlns:t="urn:t">
+  <line id="a1">Bonjour &amp; salut</line>
+  <line>Texte</line>
+  <line>Texte</line>
+  <line name="nom"><b>enfant</b></line>
+  <line>dehors<line>dedans</line></line>
+  <x:line t:id="x1" t:name="attribut">espace</x:line>
+  <line>   </line>
+</root>
+"""
+
+
+class TestXmlParser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "file.xml")
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            f.write(XML_CONTENT)
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_text_with_line_of_element(self) -> None:
+        self.assertEqual(xml_parser.parse_file(self.filepath, {"tag": "line"}),
+                         [("3", "Bonjour & salut"), ("4", "Texte"), ("5", "Texte"), ("7", "dehors"), ("7", "dedans")])
+
+    def test_id_attribute(self) -> None:
+        self.assertEqual(xml_parser.parse_file(self.filepath, {"tag": "line", "idAttr": "id"})[:2],
+                         [("a1", "Bonjour & salut"), ("4", "Texte")])
+
+    def test_attribute(self) -> None:
+        self.assertEqual(xml_parser.parse_file(self.filepath, {"tag": "line", "attr": "name"}), [("6", "nom")])
+
+    def test_namespace(self) -> None:
+        self.assertEqual(xml_parser.parse_file(self.filepath, {"tag": "{urn:x}line"}), [("8", "espace")])
+
+    def test_namespaced_attributes(self) -> None:
+        arguments: dict[str, str] = {"tag": "{urn:x}line", "attr": "{urn:t}name", "idAttr": "{urn:t}id"}
+        self.assertEqual(xml_parser.parse_file(self.filepath, arguments), [("x1", "attribut")])
+
+    def test_small_chunks(self) -> None:
+        with patch.object(xml_parser, "READ_CHUNK_SIZE", 7):
+            lines = xml_parser.parse_file(self.filepath, {"tag": "line"})
+        self.assertEqual(lines, xml_parser.parse_file(self.filepath, {"tag": "line"}))
+
+    def test_lines_yielded_while_reading(self) -> None:
+        with patch.object(xml_parser, "READ_CHUNK_SIZE", 100):
+            lines = xml_parser.iter_file(self.filepath, {"tag": "line"})
+            self.assertEqual(next(lines), ("3", "Bonjour & salut"))
+            lines.close()
+
+    def test_invalid_file(self) -> None:
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write("<line>")
+        with patch.object(xml_parser, "popup_manager") as popup_manager:
+            self.assertEqual(xml_parser.parse_file(self.filepath, {"tag": "line"}), [])
+        popup_manager.show_error.emit.assert_called_once()
+
+    def test_invalid_file_raised_after_lines_read(self) -> None:
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write("<line>")
+        lines: list[tuple[str, str]] = []
+        with (patch.object(xml_parser, "popup_manager"),
+              patch.object(xml_parser, "READ_CHUNK_SIZE", 100),
+              self.assertRaises(xml_parser.expat.ExpatError)):
+            for line in xml_parser.iter_file(self.filepath, {"tag": "line"}):
+                lines.append(line)
+        self.assertEqual(lines[0], ("3", "Bonjour & salut"))
+
+
+if __name__ == "__main__":
+    unittest.main()
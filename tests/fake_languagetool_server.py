@@ -0,0 +1,158 @@
+"""
+Fake LanguageTool HTTP server, standing in for LanguageTool in tests and benchmarks
+without Java. It answers the /v2/check endpoint with a spelling match for every
+word of `misspellings` in the text, offsets in UTF-16 code units like LanguageTool,
+and the /v2/healthcheck endpoint. `rule_delays` simulates the time taken by rules
+not disabled in the request, for each request. A text containing a word of
+`poison` always fails, and the next `failures` requests fail. Like LanguageTool,
+a request with enabledOnly and disabled rules or categories is refused.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs
+
+
+SPELLING_RULE_ID = "MORFOLOGIK_RULE_FR"
+GRAMMAR_RULE_ID = "ACCORD"
+
+
+def utf16_length(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+class FakeLanguageToolServer:
+
+    def __init__(self, misspellings: set[str] | None = None, delay: float = 0.0,
+                 rule_delays: dict[str, float] | None = None) -> None:
+        self.misspellings: set[str] = misspellings if misspellings is not None else {"fote"}
+        self.grammar_errors: set[str] = {"les chat"}
+        self.delay: float = delay
+        self.rule_delays: dict[str, float] = rule_delays or {}
+        self.busy_seconds: float = 0.0
+        self.poison: set[str] = set()
+        self.failures: int = 0
+        self.requests: list[dict[str, str]] = []
+        self.connections: int = 0
+        self.alive: bool = True
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v2/"
+
+    def find_matches(self, text: str, params: dict[str, str]) -> list[dict[str, Any]]:
+        disabled_rules: set[str] = set(params.get("disabledRules", "").split(","))
+        enabled_categories: set[str] = set(params.get("enabledCategories", "").split(",")) - {""}
+        matches: list[dict[str, Any]] = []
+        candidates: list[tuple[int, int, str, str, str]] = []
+        for word in self.misspellings:
+            for found in re.finditer(rf"\b{re.escape(word)}\b", text):
+                candidates.append((found.start(), found.end(), SPELLING_RULE_ID, "misspelling", "TYPOS"))
+        for phrase in self.grammar_errors:
+            for found in re.finditer(re.escape(phrase), text):
+                candidates.append((found.start(), found.end(), GRAMMAR_RULE_ID, "grammar", "GRAMMAR"))
+        for start, end, rule_id, issue_type, category in sorted(candidates):
+            if rule_id in disabled_rules:
+                continue
+            if params.get("enabledOnly") == "true" and enabled_categories and category not in enabled_categories:
+                continue
+            matches.append({
+                "message": "Possible error.",
+                "replacements": [{"value": "faute"}],
+                "offset": utf16_length(text[:start]),
+                "length": utf16_length(text[start:end]),
+                "rule": {"id": rule_id, "issueType": issue_type, "category": {"id": category}},
+                "context": {"text": text[:80], "offset": 0, "length": 0}
+            })
+        return matches
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def send_json(self, status: int, content: Any) -> None:
+                body: bytes = json.dumps(content).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                if self.path == "/v2/healthcheck" and fake.alive:
+                    self.send_json(200, {})
+                else:
+                    self.send_json(503 if not fake.alive else 404, {})
+
+            def do_POST(self) -> None:
+                length: int = int(self.headers.get("Content-Length", 0))
+                data: dict[str, str] = {key: values[0] for key, values
+                                        in parse_qs(self.rfile.read(length).decode("utf-8"),
+                                                    keep_blank_values=True).items()}
+                if self.path != "/v2/check" or not fake.alive:
+                    self.send_json(503 if not fake.alive else 404, {})
+                    return
+                with fake._lock:
+                    fake.requests.append(data)
+                    failed: bool = fake.failures > 0
+                    fake.failures = max(0, fake.failures - 1)
+                if failed or any(word in data.get("text", "") for word in fake.poison):
+                    self.send_json(500, {})
+                    return
+                if data.get("enabledOnly") == "true" and (data.get("disabledRules") or data.get("disabledCategories")):
+                    self.send_json(400, {})
+                    return
+                disabled_rules: set[str] = set(data.get("disabledRules", "").split(","))
+                delay: float = fake.delay + sum(seconds for rule_id, seconds in fake.rule_delays.items()
+                                                if rule_id not in disabled_rules)
+                if delay:
+                    time.sleep(delay)
+                with fake._lock:
+                    fake.busy_seconds += delay
+                self.send_json(200, {"matches": fake.find_matches(data.get("text", ""), data)})
+
+        return Handler
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeLanguageTool:
+    """Stand-in for language_tool_python.LanguageTool, running a fake server."""
+
+    def __init__(self, misspellings: set[str] | None = None, delay: float = 0.0,
+                 rule_delays: dict[str, float] | None = None) -> None:
+        self.server = FakeLanguageToolServer(misspellings, delay, rule_delays)
+        self.url: str = self.server.url
+        self.language_tool_download_version: str = "6.5"
+        self.disabled_rules: set[str] = set()
+        self.enabled_rules: set[str] = set()
+        self.disabled_categories: set[str] = set()
+        self.enabled_categories: set[str] = set()
+        self.enabled_rules_only: bool = False
+        self.closed: bool = False
+
+    def close(self) -> None:
+        self.closed = True
+        self.server.close()
@@ -0,0 +1,48 @@
+import unittest
+
+from rawtextcheck.script import process
+from rawtextcheck.script.banword_matcher import BanwordMatcher
+
+
+class TestBanwordMatcher(unittest.TestCase):
+
+    def test_single_words(self) -> None:
+        matcher = BanwordMatcher(["truc", "machin"])
+        self.assertEqual(list(matcher.finditer("un truc et un machin, truc")), ["truc", "machin", "truc"])
+        self.assertEqual(list(matcher.finditer("trucs")), [])
+
+    def test_punctuation_stripped(self) -> None:
+        matcher = BanwordMatcher(["truc"])
+        self.assertEqual(list(matcher.finditer("truc, «truc» (truc)! truc...")), ["truc"] * 4)
+        matcher = BanwordMatcher(["truc"], strip_punctuation=False)
+        self.assertEqual(list(matcher.finditer("truc, truc")), ["truc"])
+
+    def test_punctuation_only_banword(self) -> None:
+        matcher = BanwordMatcher(["!!"])
+        self.assertEqual(list(matcher.finditer("quoi !! bon")), ["!!"])
+
+    def test_case_fold(self) -> None:
+        self.assertEqual(list(BanwordMatcher(["Truc"]).finditer("truc TRUC Truc")), ["Truc"])
+        matcher = BanwordMatcher(["Truc"], case_fold=True)
+        self.assertEqual(list(matcher.finditer("truc TRUC Truc")), ["Truc"] * 3)
+
+    def test_phrases(self) -> None:
+        matcher = BanwordMatcher(["coup de", "coup de grâce", "grâce"])
+        self.assertEqual(list(matcher.finditer("le coup  de grâce, coup du sort")),
+                         ["coup de", "coup de grâce", "grâce"])
+        self.assertEqual(list(matcher.finditer("un coup")), [])
+
+    def test_empty(self) -> None:
+        matcher = BanwordMatcher(["", "  "])
+        self.assertFalse(matcher)
+        self.assertEqual(list(matcher.finditer("texte")), [])
+
+    def test_generate_errors_banwords(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "un truc, deux trucs"), ("2", "rien"), ("3", "gros mot")]
+        errors = process.generate_errors_banwords(texts, {"truc", "gros mot"})
+        self.assertEqual([(error["line_number"], error["error"]) for error in errors],
+                         [("1", "truc"), ("3", "gros mot")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from rawtextcheck.script.batcher import AdaptiveBatcher
+
+
+def make_texts(lengths: list[int]) -> list[tuple[str, str]]:
+    return [(str(i), "x" * length) for i, length in enumerate(lengths)]
+
+
+class TestAdaptiveBatcher(unittest.TestCase):
+
+    def test_every_line_once_in_order(self) -> None:
+        texts: list[tuple[str, str]] = make_texts([i % 50 for i in range(1000)])
+        batcher = AdaptiveBatcher(char_budget=300, max_lines=20, min_chars=1, max_chars=10_000)
+        batches: list[list[tuple[str, str]]] = list(batcher.batches(texts))
+        self.assertEqual([line for batch in batches for line in batch], texts)
+        for batch in batches:
+            self.assertLessEqual(len(batch), 20)
+            self.assertLessEqual(len("\n".join(text for _, text in batch)), 300)
+
+    def test_long_line_alone(self) -> None:
+        texts: list[tuple[str, str]] = make_texts([10, 500, 10])
+        batcher = AdaptiveBatcher(char_budget=100, min_chars=1)
+        self.assertEqual([len(batch) for batch in batcher.batches(texts)], [1, 1, 1])
+
+    def test_budget_follows_timings(self) -> None:
+        batcher = AdaptiveBatcher(char_budget=10_000, min_chars=1_000, max_chars=100_000, target_seconds=1.0)
+        # 10 000 characters per second, already at the target
+        batcher.record(10_000, 1.0)
+        self.assertEqual(batcher.char_budget, 10_000)
+        # slower machine, the budget goes down
+        batcher.record(10_000, 4.0)
+        self.assertLess(batcher.char_budget, 10_000)
+        # very fast, growth is limited
+        budget: int = batcher.char_budget
+        batcher.record(budget, 0.001)
+        self.assertEqual(batcher.char_budget, budget * 2)
+
+    def test_budget_limits(self) -> None:
+        batcher = AdaptiveBatcher(char_budget=2_000, min_chars=1_000, max_chars=4_000, target_seconds=1.0)
+        for _ in range(10):
+            batcher.record(batcher.char_budget, 0.0)
+        self.assertEqual(batcher.char_budget, 4_000)
+        for _ in range(10):
+            batcher.record_failure()
+        self.assertEqual(batcher.char_budget, 1_000)
+
+    def test_budget_used_from_next_batch(self) -> None:
+        texts: list[tuple[str, str]] = make_texts([9] * 100)
+        batcher = AdaptiveBatcher(char_budget=100, min_chars=10, max_chars=1_000)
+        sizes: list[int] = []
+        for batch in batcher.batches(texts):
+            sizes.append(len(batch))
+            batcher.char_budget = 1_000
+        self.assertEqual(sizes, [10, 90])
+
+
+if __name__ == "__main__":
+    unittest.main()
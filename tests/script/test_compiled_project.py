@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+
+from rawtextcheck.newtype import ItemProject
+from rawtextcheck.script import compiled_project, json_projects
+
+
+def sample_project() -> ItemProject:
+    return ItemProject(
+        language="fr",
+        parser="textfile",
+        arg_parser="",
+        valid_characters="abcdefghijklmnopqrstuvwxyz ",
+        dictionary=["Silous"],
+        banwords=["truc"],
+        ignored_codes_into_space=["\\n"],
+        ignored_codes_into_nothing=["[c1]"],
+        ignored_substrings_into_space={"<": [">"]},
+        ignored_substrings_into_nothing={"{": ["}"]},
+        replace_codes={"@": "a", "{PLAYER}": "Silous"},
+        ignored_rules=["WHITESPACE_RULE"]
+    )
+
+
+class TestCompiledProject(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.old_json_path: str = json_projects.JSON_PROJECT_PATH
+        json_projects.JSON_PROJECT_PATH = os.path.join(self.test_dir.name, "data_projects.json")
+        with open(json_projects.JSON_PROJECT_PATH, "w", encoding="utf-8") as f:
+            json.dump({"Project": sample_project()}, f, ensure_ascii=False, indent=4)
+        compiled_project.clear_cache()
+
+    def tearDown(self) -> None:
+        json_projects.JSON_PROJECT_PATH = self.old_json_path
+        compiled_project.clear_cache()
+        self.test_dir.cleanup()
+
+    def test_compile_project(self) -> None:
+        project = compiled_project.compile_project(sample_project())
+        self.assertEqual(project.language, "fr")
+        self.assertEqual(project.parser, "textfile")
+        self.assertEqual(project.dictionary, frozenset({"Silous"}))
+        self.assertEqual(project.ignored_rules, frozenset({"WHITESPACE_RULE"}))
+        self.assertEqual(project.invalid_character_finder.find(["aA"]), [(0, "A")])
+        self.assertEqual(list(project.banword_matcher.finditer("un truc")), ["truc"])
+
+    def test_clean_texts(self) -> None:
+        project = compiled_project.compile_project(sample_project())
+        # replace codes, ignored codes and ignored substrings
+        self.assertEqual(project.clean_texts([("1", "{PLAYER}\\n[c1]<b>ok{x}"), ("2", "@")]),
+                         [("1", "Silous  ok"), ("2", "a")])
+
+    def test_clean_texts_removes_empty_lines(self) -> None:
+        project = compiled_project.compile_project(sample_project())
+        texts: list[tuple[str, str]] = [("1", "[c1]"), ("2", "{a}"), ("3", "b[c1]")]
+        self.assertEqual(project.clean_texts(texts), [("3", "b")])
+
+    def test_memoized_while_unchanged(self) -> None:
+        first = compiled_project.get_compiled_project("Project")
+        second = compiled_project.get_compiled_project("Project")
+        self.assertIsNotNone(first)
+        self.assertIs(first, second)
+
+    def test_compiled_again_when_changed(self) -> None:
+        first = compiled_project.get_compiled_project("Project")
+        json_projects.add_banword("Project", "machin")
+        second = compiled_project.get_compiled_project("Project")
+        self.assertIsNot(first, second)
+        self.assertEqual(list(second.banword_matcher.finditer("un machin")), ["machin"])  # type: ignore
+
+    def test_unknown_project(self) -> None:
+        self.assertIsNone(compiled_project.get_compiled_project("Unknown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.script import invalid_characters
+from rawtextcheck.script.invalid_characters import InvalidCharacterFinder
+
+
+VALID_CHARACTERS: str = "abcdefghijklmnopqrstuvwxyzéèàç .,!?'"
+
+
+def reference_find(lines: list[str], valid_characters: str) -> list[tuple[int, str]]:
+    return [(index, c) for index, line in enumerate(lines) for c in line if c not in valid_characters]
+
+
+def random_lines(rng: random.Random, count: int) -> list[str]:
+    alphabet: str = VALID_CHARACTERS + "ABZ0123456789œ€😀あ\t"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60))) for _ in range(count)]
+
+
+class TestInvalidCharacterFinder(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rng = random.Random(1213)
+
+    def check_finder(self) -> None:
+        finder = InvalidCharacterFinder(VALID_CHARACTERS)
+        lines: list[str] = random_lines(self.rng, 500)
+        self.assertEqual(finder.find(lines), reference_find(lines, VALID_CHARACTERS))
+        self.assertEqual(finder.find(["ok", "", "A€", "", "b😀"]), [(2, "A"), (2, "€"), (4, "😀")])
+        self.assertEqual(finder.find([]), [])
+        self.assertEqual(finder.find(["", ""]), [])
+
+    @unittest.skipIf(invalid_characters.np is None, "NumPy is not installed")
+    def test_numpy(self) -> None:
+        self.check_finder()
+
+    def test_translate_fallback(self) -> None:
+        with patch.object(invalid_characters, "np", None):
+            self.check_finder()
+
+    def test_no_valid_characters(self) -> None:
+        finder = InvalidCharacterFinder("")
+        self.assertEqual(finder.find(["ab"]), [(0, "a"), (0, "b")])
+        with patch.object(invalid_characters, "np", None):
+            finder = InvalidCharacterFinder(set())
+            self.assertEqual(finder.find(["ab"]), [(0, "a"), (0, "b")])
+
+
+if __name__ == "__main__":
+    unittest.main()
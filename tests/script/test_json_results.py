@@ -1,3 +1,4 @@
+import os
 import tempfile
 import unittest
 
@@ -54,6 +55,35 @@ class TestJsonResults(unittest.TestCase):
         # ensure unique keys
         self.assertEqual(len(set(ids)), len(ids))
 
+    def test_generate_id_errors_with_used_ids(self) -> None:
+        first = json_results.generate_id_errors(self.sample_data[:2])
+        second = json_results.generate_id_errors(self.sample_data[2:], first)
+        self.assertEqual(list(first) + list(second), list(self.generated_data))
+
+    def test_metadata(self) -> None:
+        self.assertIsNone(json_results.get_metadata(self.project_title, self.file_name))
+        json_results.save_metadata(self.project_title, self.file_name, {"check_mode": "quick"})
+        self.assertEqual(json_results.get_metadata(self.project_title, self.file_name), {"check_mode": "quick"})
+        self.assertEqual([file for file, _ in json_results.get_folder_data(self.project_title)],
+                         [self.file_name + json_results.JSON_EXT])
+
+    def test_metadata_not_a_result(self) -> None:
+        # the result of a file named "results.json.meta" is not the metadata of "results.json"
+        json_results.save_metadata(self.project_title, self.file_name, {"check_mode": "quick"})
+        json_results.save_data(self.project_title, self.file_name + ".meta", self.generated_data)
+        self.assertEqual(json_results.get_metadata(self.project_title, self.file_name), {"check_mode": "quick"})
+        self.assertIsNone(json_results.get_metadata(self.project_title, self.file_name + ".meta"))
+        self.assertEqual(json_results.get_file_data(self.project_title, self.file_name + ".meta"),
+                         self.generated_data)
+
+    def test_metadata_of_deleted_result(self) -> None:
+        json_results.save_metadata(self.project_title, self.file_name, {"check_mode": "quick"})
+        os.remove(os.path.join(self.test_dir.name, self.project_title, self.file_name + json_results.JSON_EXT))
+        self.assertIsNone(json_results.get_metadata(self.project_title, self.file_name))
+        # a new result does not get the metadata of the deleted one
+        json_results.save_data(self.project_title, self.file_name, self.generated_data)
+        self.assertIsNone(json_results.get_metadata(self.project_title, self.file_name))
+
     def test_delete_error_type(self) -> None:
         json_results.delete_error_type(self.project_title, self.file_name, "TypeB")
         data: dict[str, json_results.ItemResult] = json_results.get_file_data(self.project_title, self.file_name)
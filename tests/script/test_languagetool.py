@@ -0,0 +1,31 @@
+import unittest
+
+from rawtextcheck.script import languagetool
+
+
+class TestLineMapping(unittest.TestCase):
+
+    def test_combine_lines(self) -> None:
+        batch: list[tuple[str, str]] = [("1", "ab"), ("2", ""), ("5", "cde")]
+        combined_text, line_starts = languagetool.combine_lines(batch)
+        self.assertEqual(combined_text, "ab\n\ncde")
+        self.assertEqual(list(line_starts), [0, 3, 4])
+
+    def test_find_line_index(self) -> None:
+        batch: list[tuple[str, str]] = [("1", "ab"), ("2", ""), ("5", "cde")]
+        combined_text, line_starts = languagetool.combine_lines(batch)
+        expected: list[int] = [0, 0, 0, 1, 2, 2, 2]
+        self.assertEqual([languagetool.find_line_index(line_starts, offset)
+                          for offset in range(len(combined_text))], expected)
+
+    def test_same_as_linear_search(self) -> None:
+        batch: list[tuple[str, str]] = [(str(i), "x" * (i % 7)) for i in range(200)]
+        combined_text, line_starts = languagetool.combine_lines(batch)
+        line_offsets: list[int] = list(line_starts) + [len(combined_text) + 1]
+        for offset in range(len(combined_text)):
+            expected: int = next(i for i, line_offset in enumerate(line_offsets) if line_offset > offset) - 1
+            self.assertEqual(languagetool.find_line_index(line_starts, offset), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.newtype import ItemMatch
+from rawtextcheck.script import languagetool, languagetool_cache
+from rawtextcheck.script.languagetool_cache import LanguageToolCache
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+from tests.fake_languagetool_server import GRAMMAR_RULE_ID, SPELLING_RULE_ID, FakeLanguageTool
+
+
+def sample_match(offset: int, text: str, rule_id: str = "RULE", issue_type: str = "grammar") -> ItemMatch:
+    return ItemMatch(offset=offset, length=len(text), matched_text=text, rule_id=rule_id,
+                     rule_issue_type=issue_type, message="message", replacements=["a", "b"])
+
+
+class TestLanguageToolCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.cache = LanguageToolCache(os.path.join(self.test_dir.name, "sub", "cache.sqlite3"), max_entries=3)
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.test_dir.cleanup()
+
+    def test_put_and_get(self) -> None:
+        self.cache.put_many({"a": [sample_match(0, "x")], "b": []})
+        self.assertEqual(self.cache.get_many(["a", "b", "c", "a"]), {"a": [sample_match(0, "x")], "b": []})
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_persistent(self) -> None:
+        self.cache.put_many({"a": [sample_match(2, "é")]})
+        self.cache.close()
+        self.cache = LanguageToolCache(self.cache.path)
+        self.assertEqual(self.cache.get_many(["a"]), {"a": [sample_match(2, "é")]})
+
+    def test_least_recently_used_removed(self) -> None:
+        with patch("rawtextcheck.script.languagetool_cache.time.time", side_effect=[1, 2, 3, 4, 5]):
+            self.cache.put_many({"a": [], "b": []})
+            self.cache.put_many({"c": []})
+            self.cache.get_many(["a"])
+            self.cache.put_many({"d": []})
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(set(self.cache.get_many(["a", "b", "c", "d"])), {"a", "c", "d"})
+
+    def test_disabled_rules(self) -> None:
+        self.cache.put_many({"a": []}, {"RULE_A"})
+        self.cache.put_many({"b": []})
+        self.assertEqual(set(self.cache.get_many(["a", "b"])), {"b"})
+        self.assertEqual(set(self.cache.get_many(["a", "b"], {"RULE_A", "RULE_B"})), {"a", "b"})
+
+    def test_cache_without_disabled_rules_column(self) -> None:
+        path: str = os.path.join(self.test_dir.name, "old.sqlite3")
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("CREATE TABLE line_matches (key TEXT PRIMARY KEY, matches TEXT NOT NULL, "
+                               "last_used REAL NOT NULL)")
+            connection.execute("INSERT INTO line_matches VALUES ('a', '[]', 1)")
+        connection.close()
+        cache = LanguageToolCache(path)
+        self.assertEqual(cache.get_many(["a"], {"RULE_A"}), {"a": []})
+        cache.close()
+
+    def test_make_key(self) -> None:
+        key: str = languagetool_cache.make_key("fr", "6.5", "hash", "ligne")
+        self.assertEqual(key, languagetool_cache.make_key("fr", "6.5", "hash", "ligne"))
+        self.assertNotEqual(key, languagetool_cache.make_key("en", "6.5", "hash", "ligne"))
+        self.assertNotEqual(key, languagetool_cache.make_key("fr", "6.6", "hash", "ligne"))
+        self.assertNotEqual(key, languagetool_cache.make_key("fr", "6.5", "other", "ligne"))
+
+
+class TestAnalyzeTextWithCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.cache = LanguageToolCache(os.path.join(self.test_dir.name, "cache.sqlite3"))
+        self.tool = FakeLanguageTool()
+        self.pool = LanguageToolPool("fr", lambda: self.tool, 1)
+        self.pool.start()
+        self.patchers = [patch.object(languagetool, "pool", self.pool),
+                         patch.object(languagetool_cache, "_cache", self.cache)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.pool.close()
+        self.cache.close()
+        self.test_dir.cleanup()
+
+    @property
+    def checked_texts(self) -> list[str]:
+        return [request["text"] for request in self.tool.server.requests]
+
+    def test_only_missing_lines_analyzed(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "une fote"), ("2", "correct")]
+        first = languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(self.checked_texts, ["une fote\ncorrect"])
+
+        texts.append(("3", "encore fote"))
+        second = languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(self.checked_texts, ["une fote\ncorrect", "encore fote"])
+        self.assertEqual(second[:len(first)], first)
+        self.assertEqual([(error["line_number"], error["error"]) for error in second], [("1", "fote"), ("3", "fote")])
+
+    def test_cached_matches_filtered(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "une fote")]
+        languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(languagetool.analyze_text(texts, {"fote"}, set()), [])
+        self.assertEqual(languagetool.analyze_text(texts, set(), {SPELLING_RULE_ID}), [])
+        self.assertEqual(len(self.checked_texts), 1)
+
+    def test_ignored_rules_disabled_in_request(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "les chat ont une fote")]
+        result = languagetool.analyze_text(texts, set(), {GRAMMAR_RULE_ID})
+        self.assertEqual(self.tool.server.requests[0]["disabledRules"], GRAMMAR_RULE_ID)
+        self.assertEqual([error["error_type"] for error in result], [SPELLING_RULE_ID])
+
+    def test_rule_enabled_again_misses(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "les chat")]
+        self.assertEqual(languagetool.analyze_text(texts, set(), {GRAMMAR_RULE_ID}), [])
+        result = languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(len(self.checked_texts), 2)
+        self.assertEqual([error["error_type"] for error in result], [GRAMMAR_RULE_ID])
+
+    def test_rules_change_misses(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "une fote")]
+        languagetool.analyze_text(texts, set(), set())
+        self.tool.disabled_rules = {SPELLING_RULE_ID}
+        languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(len(self.checked_texts), 2)
+
+    def test_duplicate_lines_analyzed_once(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "Oui" if i % 2 else "une fote") for i in range(2000)]
+        with patch.object(languagetool_cache, "get_cache", return_value=None):
+            result = languagetool.analyze_text(texts, set(), set())
+        self.assertEqual(self.checked_texts, ["une fote\nOui"])
+        self.assertEqual([error["line_number"] for error in result], [str(i) for i in range(0, 2000, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
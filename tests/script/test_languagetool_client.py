@@ -0,0 +1,50 @@
+import unittest
+
+from rawtextcheck.script.languagetool_client import LanguageToolClient, utf16_to_index
+from tests.fake_languagetool_server import FakeLanguageToolServer
+
+
+class TestUtf16ToIndex(unittest.TestCase):
+
+    def test_ascii(self) -> None:
+        self.assertEqual(utf16_to_index("abc")(2), 2)
+
+    def test_astral_characters(self) -> None:
+        text: str = "a😀b😀😀c é"
+        to_index = utf16_to_index(text)
+        utf16_offset: int = 0
+        for index, char in enumerate(text):
+            self.assertEqual(to_index(utf16_offset), index)
+            utf16_offset += len(char.encode("utf-16-le")) // 2
+        self.assertEqual(to_index(utf16_offset), len(text))
+
+
+class TestLanguageToolClient(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = FakeLanguageToolServer()
+        self.client = LanguageToolClient(self.server.url, "fr")
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.close()
+
+    def test_check(self) -> None:
+        matches = self.client.check("une fote et 😀 fote", {"disabledRules": "OTHER"})
+        self.assertEqual([match["offset"] for match in matches], [4, 15])
+        self.assertEqual(self.server.requests[0]["language"], "fr")
+        self.assertEqual(self.server.requests[0]["disabledRules"], "OTHER")
+
+    def test_connection_kept_alive(self) -> None:
+        for _ in range(20):
+            self.client.check("une fote")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_is_alive(self) -> None:
+        self.assertTrue(self.client.is_alive())
+        self.server.alive = False
+        self.assertFalse(self.client.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Any
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.script import languagetool, languagetool_cache
+from rawtextcheck.script.batcher import AdaptiveBatcher
+from rawtextcheck.script.cancellation import CancellationToken
+from rawtextcheck.script.languagetool_pool import LanguageToolPool, get_pool_size
+from tests.fake_languagetool_server import FakeLanguageTool
+
+
+class TestLanguageToolPool(unittest.TestCase):
+
+    def test_pool_size(self) -> None:
+        self.assertEqual(get_pool_size(3), 3)
+        self.assertGreaterEqual(get_pool_size(0), 1)
+
+    def test_start_and_close(self) -> None:
+        tools: list[FakeLanguageTool] = []
+
+        def create_tool() -> FakeLanguageTool:
+            tools.append(FakeLanguageTool())
+            return tools[-1]
+
+        pool = LanguageToolPool("fr", create_tool, 3)
+        pool.start()
+        self.assertEqual(len(pool.tools), 3)
+        self.assertEqual(len(pool.clients), 3)
+        pool.close()
+        self.assertEqual(pool.tools, [])
+        self.assertTrue(all(tool.closed for tool in tools))
+
+    def test_failed_server_not_in_pool(self) -> None:
+        calls: list[int] = []
+        lock = threading.Lock()
+
+        def create_tool() -> FakeLanguageTool:
+            with lock:
+                calls.append(1)
+                if len(calls) == 2:
+                    raise RuntimeError("no port")
+            return FakeLanguageTool()
+
+        pool = LanguageToolPool("fr", create_tool, 3)
+        pool.start()
+        self.assertEqual(len(pool.tools), 2)
+        pool.close()
+
+    def test_dead_server_restarted(self) -> None:
+        pool = LanguageToolPool("fr", FakeLanguageTool, 1)
+        pool.start()
+        dead_tool = pool.tools[0]
+        dead_tool.server.alive = False
+        with self.assertRaises(Exception):
+            pool.check("texte")
+        self.assertTrue(dead_tool.closed)
+        self.assertIsNot(pool.tools[0], dead_tool)
+        self.assertEqual(pool.check("une fote")[0]["offset"], 4)
+        pool.close()
+
+    def test_close_wakes_waiting_requests(self) -> None:
+        pool = LanguageToolPool("fr", lambda: FakeLanguageTool(delay=0.2), 1)
+        pool.start()
+        errors: list[Exception] = []
+
+        def check() -> None:
+            try:
+                pool.check("une fote")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=check) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        pool.close()
+        for thread in threads:
+            thread.join(5)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertGreaterEqual(len(errors), 2)
+        self.assertTrue(all(isinstance(error, RuntimeError) and "closed" in str(error) for error in errors[-2:]))
+        with self.assertRaises(RuntimeError):
+            pool.check("une fote")
+
+    def test_warm_up_every_server(self) -> None:
+        pool = LanguageToolPool("fr", FakeLanguageTool, 3)
+        pool.start()
+        pool.warm_up("une phrase")
+        self.assertTrue(all(len(tool.server.requests) == 1 for tool in pool.tools))
+        pool.close()
+
+
+class TestParallelCheck(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pool = LanguageToolPool("fr", lambda: FakeLanguageTool(delay=0.05), 4)
+        self.pool.start()
+        self.patchers = [patch.object(languagetool, "pool", self.pool),
+                         patch.object(languagetool_cache, "get_cache", return_value=None)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.pool.close()
+
+    def test_results_in_line_order(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), f"ligne {i} fote" if i % 3 == 0 else f"ligne {i}")
+                                        for i in range(400)]
+        lines_matches = languagetool.check_lines(texts, AdaptiveBatcher(max_lines=10))
+        for (_, line), matches in zip(texts, lines_matches):
+            self.assertIsNotNone(matches)
+            self.assertEqual(len(matches or []), line.count("fote"))
+            for match in matches or []:
+                self.assertEqual(line[match["offset"]:match["offset"] + match["length"]], "fote")
+
+    def test_batches_sent_at_the_same_time(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), f"ligne {i}") for i in range(80)]
+        start_time: float = time.perf_counter()
+        languagetool.check_lines(texts, AdaptiveBatcher(max_lines=10))
+        seconds: float = time.perf_counter() - start_time
+        # 8 batches of 0.05 s on 4 servers
+        self.assertLess(seconds, 8 * 0.05 * 0.75)
+
+    def test_cancelled_stops_sending_batches(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), f"ligne {i} fote") for i in range(400)]
+        cancel_token = CancellationToken()
+        batcher = AdaptiveBatcher(max_lines=10)
+        real_record = batcher.record
+
+        def record(chars: int, seconds: float) -> None:
+            real_record(chars, seconds)
+            cancel_token.cancel()
+
+        batcher.record = record  # type: ignore
+        lines_matches = languagetool.check_lines(texts, batcher, cancel_token=cancel_token)
+        analyzed: int = sum(matches is not None for matches in lines_matches)
+        # the batches sent before the first answer are still analyzed
+        self.assertGreater(analyzed, 0)
+        self.assertLessEqual(analyzed, 8 * 10)
+        self.assertEqual(sum(len(tool.server.requests) for tool in self.pool.tools) * 10, analyzed)
+
+
+class TestFailedBatches(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pool = LanguageToolPool("fr", FakeLanguageTool, 2)
+        self.pool.start()
+        self.patchers = [patch.object(languagetool, "pool", self.pool),
+                         patch.object(languagetool, "LANGUAGETOOL_RETRY_DELAY", 0.0),
+                         patch.object(languagetool, "popup_manager")]
+        for patcher in self.patchers:
+            patcher.start()
+
+    @property
+    def errors(self) -> list[str]:
+        return [call.args[1] for call in languagetool.popup_manager.show_error.emit.call_args_list]
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.pool.close()
+
+    def test_transient_failure_retried(self) -> None:
+        self.pool.tools[0].server.failures = 1
+        self.pool.tools[1].server.failures = 1
+        texts: list[tuple[str, str]] = [(str(i), f"ligne {i} fote") for i in range(20)]
+        lines_matches = languagetool.check_lines(texts, AdaptiveBatcher(max_lines=10))
+        self.assertTrue(all(matches is not None for matches in lines_matches))
+        self.assertEqual(self.errors, [])
+
+    def test_cancelled_during_retry_delay(self) -> None:
+        for tool in self.pool.tools:
+            tool.server.failures = 100
+        texts: list[tuple[str, str]] = [(str(i), f"ligne {i} fote") for i in range(20)]
+        cancel_token = CancellationToken()
+        threading.Timer(0.1, cancel_token.cancel).start()
+        start_time: float = time.perf_counter()
+        with patch.object(languagetool, "LANGUAGETOOL_RETRY_DELAY", 30.0):
+            lines_matches = languagetool.check_lines(texts, AdaptiveBatcher(max_lines=10), cancel_token=cancel_token)
+        self.assertLess(time.perf_counter() - start_time, 5.0)
+        self.assertEqual(lines_matches, [None] * 20)
+        self.assertEqual(self.errors, [])
+
+    def test_poison_lines_skipped(self) -> None:
+        for tool in self.pool.tools:
+            tool.server.poison = {"poison"}
+        texts: list[tuple[str, str]] = [(str(i), "poison" if i in (13, 37) else f"ligne {i} fote")
+                                        for i in range(50)]
+        lines_matches = languagetool.check_lines(texts, AdaptiveBatcher(max_lines=25))
+        self.assertEqual([i for i, matches in enumerate(lines_matches) if matches is None], [13, 37])
+        self.assertTrue(all(len(matches) == 1 for matches in lines_matches if matches is not None))
+        self.assertEqual(len(self.errors), 1)
+        self.assertIn("13, 37", self.errors[0])
+
+    def test_halves_sent_within_the_servers(self) -> None:
+        for tool in self.pool.tools:
+            tool.server.poison = {"poison"}
+        texts: list[tuple[str, str]] = [(str(i), "poison" if i % 10 == 3 else f"ligne {i} fote")
+                                        for i in range(80)]
+        # batches submitted and not answered yet, and their maximum
+        counts: dict[str, int] = {"in_flight": 0, "max": 0}
+        lock = threading.Lock()
+        check_batch = languagetool.check_batch
+
+        def counted_check_batch(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return check_batch(*args, **kwargs)
+            finally:
+                with lock:
+                    counts["in_flight"] -= 1
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, *args: Any, **kwargs: Any) -> Future:
+                with lock:
+                    counts["in_flight"] += 1
+                    counts["max"] = max(counts["max"], counts["in_flight"])
+                return super().submit(*args, **kwargs)
+
+        with (patch.object(languagetool, "check_batch", counted_check_batch),
+              patch.object(languagetool, "ThreadPoolExecutor", CountingExecutor)):
+            lines_matches = languagetool.check_lines(texts, AdaptiveBatcher(max_lines=20))
+        self.assertEqual([i for i, matches in enumerate(lines_matches) if matches is None],
+                         list(range(3, 80, 10)))
+        self.assertLessEqual(counts["max"], len(self.pool.tools))
+
+
+if __name__ == "__main__":
+    unittest.main()
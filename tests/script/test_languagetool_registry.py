@@ -0,0 +1,272 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from PyQt5.QtCore import Qt
+
+from rawtextcheck.script import languagetool, languagetool_settings
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+from rawtextcheck.script.languagetool_registry import EngineRegistry
+from tests.fake_languagetool_server import FakeLanguageTool
+
+
+class TestEngineRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.started: list[str] = []
+        self.registry = EngineRegistry(self.start_pool, memory_budget_mb=2_000,
+                                       server_memory_mb=1_000, idle_timeout=60)
+
+    def tearDown(self) -> None:
+        self.registry.close_all()
+
+    def start_pool(self, language: str) -> LanguageToolPool:
+        self.started.append(language)
+        pool = LanguageToolPool(language, FakeLanguageTool, 1)
+        pool.start()
+        return pool
+
+    def test_pool_reused(self) -> None:
+        french = self.registry.get("fr")
+        self.registry.get("en")
+        self.assertIs(self.registry.get("fr"), french)
+        self.assertEqual(self.started, ["fr", "en"])
+        self.assertEqual(self.registry.languages, ["en", "fr"])
+
+    def test_least_recently_used_closed_over_budget(self) -> None:
+        french = self.registry.get("fr")
+        self.registry.get("en")
+        self.registry.get("fr")
+        self.registry.get("de")
+        self.assertEqual(self.registry.languages, ["fr", "de"])
+        self.assertEqual(self.registry.memory_mb(), 2_000)
+        self.assertEqual(french.check("une fote")[0]["offset"], 4)
+
+    def test_newest_kept_over_budget(self) -> None:
+        self.registry.memory_budget_mb = 500
+        self.registry.get("fr")
+        self.registry.get("en")
+        self.assertEqual(self.registry.languages, ["en"])
+
+    def test_idle_closed(self) -> None:
+        french = self.registry.get("fr")
+        self.registry.get("en")
+        french.last_used = time.monotonic() - 120
+        self.registry.close_idle()
+        self.assertEqual(self.registry.languages, ["en"])
+        self.assertEqual(french.tools, [])
+
+    def test_busy_not_closed(self) -> None:
+        french = self.registry.get("fr")
+        french.last_used = time.monotonic() - 120
+        with patch.object(LanguageToolPool, "is_busy", return_value=True):
+            self.registry.close_idle()
+        self.assertEqual(self.registry.languages, ["fr"])
+
+
+class TestSlowStart(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.started: list[str] = []
+        self.starting = threading.Event()
+        self.release = threading.Event()
+        self.registry = EngineRegistry(self.start_pool, idle_timeout=60)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.registry.close_all()
+
+    def start_pool(self, language: str) -> LanguageToolPool:
+        self.started.append(language)
+        if language == "fr":
+            self.starting.set()
+            self.release.wait(5)
+        pool = LanguageToolPool(language, FakeLanguageTool, 1)
+        pool.start()
+        return pool
+
+    def get_in_thread(self, language: str, pools: list[LanguageToolPool]) -> threading.Thread:
+        thread = threading.Thread(target=lambda: pools.append(self.registry.get(language)))
+        thread.start()
+        return thread
+
+    def test_other_language_not_blocked(self) -> None:
+        pools: list[LanguageToolPool] = []
+        thread: threading.Thread = self.get_in_thread("fr", pools)
+        self.assertTrue(self.starting.wait(5))
+        self.assertEqual(self.registry.get("en").language, "en")
+        self.assertEqual(self.registry.languages, ["en"])
+        self.release.set()
+        thread.join(5)
+        self.assertEqual(self.registry.languages, ["en", "fr"])
+
+    def test_same_language_started_once(self) -> None:
+        pools: list[LanguageToolPool] = []
+        threads: list[threading.Thread] = [self.get_in_thread("fr", pools)]
+        self.assertTrue(self.starting.wait(5))
+        threads.append(self.get_in_thread("fr", pools))
+        threading.Timer(0.05, self.release.set).start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.started, ["fr"])
+        self.assertIs(pools[0], pools[1])
+
+
+class TestConfiguredRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.registry = EngineRegistry(self.start_pool, idle_timeout=60)
+        self.patchers = [patch.object(languagetool, "registry", self.registry),
+                         patch.object(languagetool, "server_settings", None),
+                         patch.object(languagetool_settings, "get_pool_size", return_value=4),
+                         patch.dict(os.environ)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        self.registry.close_all()
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def start_pool(self, language: str) -> LanguageToolPool:
+        pool = LanguageToolPool(language, FakeLanguageTool, 4)
+        pool.start()
+        return pool
+
+    def configure(self, total_memory_mb: int) -> None:
+        settings = languagetool_settings.default_server_settings(total_memory_mb, 8)
+        with patch.object(languagetool_settings, "get_total_memory_mb", return_value=total_memory_mb):
+            languagetool.configure_servers(settings)
+
+    def test_languages_kept_with_computed_settings(self) -> None:
+        self.configure(16_384)
+        self.registry.get("fr")
+        self.registry.get("en")
+        self.assertEqual(self.registry.languages, ["fr", "en"])
+        self.registry.get("de")
+        self.assertEqual(self.registry.languages, ["en", "de"])
+        self.assertLessEqual(self.registry.memory_mb(), self.registry.memory_budget_mb)
+        # the configured heaps of the servers kept fit in the budget
+        heap_mb: int = languagetool.server_settings["heap_mb"]  # type: ignore
+        self.assertLessEqual(2 * 4 * heap_mb, self.registry.memory_budget_mb)
+
+    def test_low_memory_keeps_one_language(self) -> None:
+        self.configure(4_096)
+        self.registry.get("fr")
+        self.registry.get("en")
+        self.assertEqual(self.registry.languages, ["en"])
+
+
+class TestInitializeTool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.started: list[str] = []
+        self.registry = EngineRegistry(self.start_pool)
+        self.patchers = [patch.object(languagetool, "registry", self.registry),
+                         patch.object(languagetool, "pool", None)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        languagetool.close_tool()
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def start_pool(self, language: str) -> LanguageToolPool:
+        self.started.append(language)
+        pool = LanguageToolPool(language, FakeLanguageTool, 1)
+        pool.start()
+        return pool
+
+    def test_alternate_languages(self) -> None:
+        for language in ["fr", "en", "fr", "en", "fr"]:
+            languagetool.initialize_tool(language)
+            self.assertEqual(languagetool.pool.language, language)  # type: ignore
+        self.assertEqual(self.started, ["fr", "en"])
+
+    def test_close_tool(self) -> None:
+        languagetool.initialize_tool("fr")
+        languagetool.close_tool()
+        self.assertIsNone(languagetool.pool)
+        self.assertEqual(self.registry.languages, [])
+
+
+class TestPrewarm(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.started: list[str] = []
+        self.starting = threading.Event()
+        self.release = threading.Event()
+        self.registry = EngineRegistry(self.start_pool)
+        self.states: list[tuple[str, str]] = []
+        self.patchers = [patch.object(languagetool, "registry", self.registry),
+                         patch.object(languagetool, "pool", None),
+                         patch.object(languagetool, "engine_status", languagetool.EngineStatus())]
+        for patcher in self.patchers:
+            patcher.start()
+        languagetool.engine_status.changed.connect(lambda language, state: self.states.append((language, state)),
+                                                   Qt.ConnectionType.DirectConnection)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        languagetool.close_tool()
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def start_pool(self, language: str) -> LanguageToolPool:
+        self.started.append(language)
+        if language == "fr":
+            self.starting.set()
+            self.release.wait(5)
+        pool = LanguageToolPool(language, FakeLanguageTool, 1)
+        pool.start()
+        pool.warm_up("une phrase")
+        return pool
+
+    def test_prewarm_ready(self) -> None:
+        self.release.set()
+        languagetool.prewarm("fr").join(5)
+        self.assertEqual(self.registry.languages, ["fr"])
+        self.assertEqual(self.states, [("fr", "starting"), ("fr", "ready")])
+
+    def test_initialize_waits_for_prewarm(self) -> None:
+        thread: threading.Thread = languagetool.prewarm("fr")
+        self.assertTrue(self.starting.wait(5))
+        threading.Timer(0.05, self.release.set).start()
+        languagetool.initialize_tool("fr")
+        thread.join(5)
+        self.assertEqual(self.started, ["fr"])
+        self.assertEqual(languagetool.pool.language, "fr")  # type: ignore
+        self.assertEqual(languagetool.engine_status.state, "ready")
+
+    def test_close_during_prewarm(self) -> None:
+        thread: threading.Thread = languagetool.prewarm("fr")
+        self.assertTrue(self.starting.wait(5))
+        start_time: float = time.perf_counter()
+        languagetool.close_tool()
+        self.assertLess(time.perf_counter() - start_time, 1.0)
+        self.assertTrue(thread.is_alive())
+        self.release.set()
+        thread.join(5)
+        self.assertEqual(self.registry.languages, [])
+        self.assertEqual(languagetool.engine_status.state, "failed")
+
+    def test_other_language_not_waiting_for_prewarm(self) -> None:
+        thread: threading.Thread = languagetool.prewarm("fr")
+        self.assertTrue(self.starting.wait(5))
+        languagetool.initialize_tool("en")
+        self.assertEqual(languagetool.pool.language, "en")  # type: ignore
+        self.release.set()
+        thread.join(5)
+
+    def test_prewarm_failed(self) -> None:
+        self.registry = EngineRegistry(lambda language: (_ for _ in ()).throw(RuntimeError("no java")))
+        with patch.object(languagetool, "registry", self.registry):
+            languagetool.prewarm("fr").join(5)
+        self.assertEqual(languagetool.engine_status.state, "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from language_tool_python.config_file import CONFIG_SCHEMA
+
+from rawtextcheck.script import json_config, languagetool_settings
+
+
+class TestLanguageToolSettings(unittest.TestCase):
+
+    def test_heap_shared_between_servers(self) -> None:
+        with patch.object(languagetool_settings, "get_pool_size", return_value=4):
+            settings = languagetool_settings.default_server_settings(16_384, 8)
+        # budget of 8 GB for 2 languages of 4 servers, 1 GB by server with the JVM
+        self.assertEqual(settings["heap_mb"], 768)
+        self.assertEqual(settings["max_check_threads"], 2)
+        self.assertEqual(settings["cache_size"], 7_680)
+
+    def test_heap_limits(self) -> None:
+        with patch.object(languagetool_settings, "get_pool_size", return_value=16):
+            self.assertEqual(languagetool_settings.default_server_settings(2_048, 4)["heap_mb"], 512)
+            self.assertEqual(languagetool_settings.default_server_settings(2_048, 4)["max_check_threads"], 1)
+        with patch.object(languagetool_settings, "get_pool_size", return_value=1):
+            self.assertEqual(languagetool_settings.default_server_settings(65_536, 4)["heap_mb"], 4_096)
+
+    def test_memory_budget_from_ram(self) -> None:
+        self.assertEqual(languagetool_settings.default_memory_budget_mb(16_384), 8_192)
+        with patch.object(languagetool_settings, "get_pool_size", return_value=1):
+            settings = languagetool_settings.default_server_settings(65_536, 4)
+        self.assertEqual(languagetool_settings.estimated_server_memory_mb(settings), 4_096 + 256)
+
+    def test_server_config_keys(self) -> None:
+        config = languagetool_settings.to_server_config(languagetool_settings.default_server_settings())
+        self.assertTrue(set(config) <= set(CONFIG_SCHEMA))
+
+    def test_java_options_keep_previous(self) -> None:
+        settings = languagetool_settings.default_server_settings(4_096, 1)
+        with (patch.object(languagetool_settings, "_JAVA_TOOL_OPTIONS", "-Dfile.encoding=UTF-8"),
+              patch.dict(os.environ)):
+            languagetool_settings.apply_java_options(settings)
+            options: str = languagetool_settings.apply_java_options(settings)
+            self.assertEqual(options, f"-Dfile.encoding=UTF-8 -Xmx{settings['heap_mb']}m")
+            self.assertEqual(os.environ["JAVA_TOOL_OPTIONS"], options)
+
+    def test_config_without_settings(self) -> None:
+        with tempfile.TemporaryDirectory() as test_dir:
+            path: str = os.path.join(test_dir, "config.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"language": "fr", "languagetool_server": {"heap_mb": 1_000}}, f)
+            with patch.object(json_config, "JSON_CONFIG_PATH", path):
+                settings = json_config.get_languagetool_server()
+        self.assertEqual(settings["heap_mb"], 1_000)
+        self.assertEqual(set(settings), {"heap_mb", "cache_size", "pipeline_caching", "max_check_threads"})
+
+
+if __name__ == "__main__":
+    unittest.main()
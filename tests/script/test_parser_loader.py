@@ -0,0 +1,111 @@
+import os
+import tempfile
+from types import ModuleType
+import unittest
+
+from rawtextcheck.default_parser import LIST_DEFAULT_PARSER
+from rawtextcheck.script import parser_loader
+
+
+def write_plugin(folder: str, name: str, content: str) -> None:
+    with open(os.path.join(folder, name + ".py"), "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestPluginRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.registry = parser_loader.PluginRegistry(self.test_dir.name)
+        write_plugin(self.test_dir.name, "first", "def parse_file(filepath, args):\n    return []\n")
+        write_plugin(self.test_dir.name, "second", "VERSION = 1\n\ndef parse_file(filepath, args):\n    return []\n")
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_loaded_once(self) -> None:
+        parsers = self.registry.get_parsers()
+        self.assertEqual(list(parsers), ["first", "second"])
+        self.assertIs(self.registry.get_parsers()["first"], parsers["first"])
+        metrics = self.registry.get_metrics()
+        self.assertEqual(metrics["first"].load_count, 1)
+        self.assertGreaterEqual(metrics["first"].load_time, 0)
+
+    def test_reload_only_changed(self) -> None:
+        parsers = self.registry.get_parsers()
+        write_plugin(self.test_dir.name, "second", "VERSION = 22\n\ndef parse_file(filepath, args):\n    return []\n")
+        new_parsers = self.registry.get_parsers()
+        self.assertIs(new_parsers["first"], parsers["first"])
+        self.assertEqual(new_parsers["second"].VERSION, 22)
+        self.assertEqual(self.registry.get_metrics()["second"].load_count, 2)
+        self.assertEqual(self.registry.get_metrics()["first"].load_count, 1)
+
+    def test_removed_plugin(self) -> None:
+        self.registry.get_parsers()
+        os.remove(os.path.join(self.test_dir.name, "first.py"))
+        self.assertEqual(list(self.registry.get_parsers()), ["second"])
+        self.assertNotIn("first", self.registry.get_metrics())
+
+    def test_broken_plugin_not_loaded_again(self) -> None:
+        write_plugin(self.test_dir.name, "broken", "raise ValueError('broken')\n")
+        write_plugin(self.test_dir.name, "no_parse", "VALUE = 1\n")
+        with self.assertLogs(parser_loader.logger, "ERROR"):
+            self.assertEqual(list(self.registry.get_parsers()), ["first", "second"])
+        self.registry.get_parsers()
+        self.assertEqual(self.registry.get_metrics()["broken"].load_count, 1)
+        self.assertIsNone(self.registry.get_metrics()["no_parse"].module)
+
+    def test_iter_file_plugin(self) -> None:
+        write_plugin(self.test_dir.name, "streaming", "def iter_file(filepath, args):\n    yield '1', 'ligne'\n")
+        self.assertIn("streaming", self.registry.get_parsers())
+
+    def test_get_all_parsers(self) -> None:
+        registry = parser_loader.registry
+        parser_loader.registry = self.registry
+        try:
+            parsers = parser_loader.get_all_parsers()
+        finally:
+            parser_loader.registry = registry
+        self.assertTrue(set(LIST_DEFAULT_PARSER) <= set(parsers))
+        self.assertIn("first", parsers)
+
+
+class TestIterParserFile(unittest.TestCase):
+
+    def test_legacy_parser(self) -> None:
+        parser = ModuleType("legacy")
+        parser.parse_file = lambda filepath, args: [("1", filepath), ("2", args["col"])]  # type: ignore
+        lines = parser_loader.iter_parser_file(parser, "a.txt", {"col": "2"})
+        self.assertNotIsInstance(lines, list)
+        self.assertEqual(list(lines), [("1", "a.txt"), ("2", "2")])
+
+    def test_streaming_parser_read_lazily(self) -> None:
+        read: list[str] = []
+
+        def iter_file(filepath: str, args: dict[str, str]):
+            for i in range(1, 4):
+                read.append(str(i))
+                yield str(i), "ligne"
+
+        parser = ModuleType("streaming")
+        parser.iter_file = iter_file  # type: ignore
+        parser.parse_file = lambda filepath, args: self.fail("parse_file called")  # type: ignore
+        lines = parser_loader.iter_parser_file(parser, "a.txt", {})
+        self.assertEqual(next(lines), ("1", "ligne"))
+        self.assertEqual(read, ["1"])
+        self.assertEqual(list(lines), [("2", "ligne"), ("3", "ligne")])
+
+    def test_textfile_parser(self) -> None:
+        textfile_parser = LIST_DEFAULT_PARSER["textfile"]
+        with tempfile.TemporaryDirectory() as folder:
+            filepath = os.path.join(folder, "file.txt")
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write("une\n\n  deux \ntrois\n")
+            lines = textfile_parser.iter_file(filepath, {"notContains": "trois"})
+            self.assertEqual(next(lines), ("1", "une"))
+            self.assertEqual(list(lines), [("3", "deux")])
+            self.assertEqual(textfile_parser.parse_file(filepath, {}), [("1", "une"), ("3", "deux"), ("4", "trois")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+from collections.abc import Iterator
+from functools import partial
+from types import SimpleNamespace
+import unittest
+from unittest.mock import patch
+
+from rawtextcheck.script import compiled_project, json_results, languagetool, languagetool_cache, parser_loader, process
+from rawtextcheck.script.cancellation import CancellationToken
+from rawtextcheck.script.languagetool_pool import LanguageToolPool
+from tests.fake_languagetool_server import GRAMMAR_RULE_ID, SPELLING_RULE_ID, FakeLanguageTool
+from tests.script.test_compiled_project import sample_project
+
+
+class TestIterChunks(unittest.TestCase):
+
+    def test_chunks_grow(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "ligne") for i in range(100)]
+        chunks = list(process.iter_chunks(texts, 5, 30))
+        self.assertEqual([len(chunk) for chunk in chunks], [5, 10, 20, 30, 30, 5])
+        self.assertEqual([line for chunk in chunks for line in chunk], texts)
+
+    def test_lazy(self) -> None:
+        texts = ((str(i), "ligne") for i in range(1000))
+        next(process.iter_chunks(texts, 10, 100))
+        self.assertEqual(next(texts), ("10", "ligne"))
+
+
+class TestIterErrors(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.project = compiled_project.compile_project(sample_project())
+        self.pool = LanguageToolPool("fr", FakeLanguageTool, 1)
+        self.pool.start()
+        self.patchers = [patch.object(languagetool, "pool", self.pool),
+                         patch.object(languagetool_cache, "get_cache", return_value=None)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.pool.close()
+
+    def test_errors_by_chunk_in_line_order(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "une fote de truc" if i % 2 else "Ligne") for i in range(12)]
+        with patch.object(process, "iter_chunks", partial(process.iter_chunks, first_size=4)):
+            chunks = list(process.iter_errors(texts, self.project))
+        self.assertEqual(len(chunks), 2)
+        errors = [(error["line_number"], error["error"]) for chunk in chunks for error in chunk]
+        self.assertEqual([line_number for line_number, _ in errors],
+                         sorted((line_number for line_number, _ in errors), key=int))
+        self.assertIn(("1", "fote"), errors)
+        self.assertIn(("1", "truc"), errors)
+        self.assertIn(("0", "L"), errors)
+
+    def test_duplicate_lines_across_chunks_analyzed_once(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "une fote" if i % 2 else "Oui") for i in range(12)]
+        with patch.object(process, "iter_chunks", partial(process.iter_chunks, first_size=4)):
+            chunks = list(process.iter_errors(texts, self.project))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual([request["text"] for request in self.pool.tools[0].server.requests], ["Oui\nune fote"])
+        errors = [error["line_number"] for chunk in chunks for error in chunk if error["error"] == "fote"]
+        self.assertEqual(errors, [str(i) for i in range(1, 12, 2)])
+
+    def test_dedupe_ratio_logged_once_per_file(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "une fote" if i % 2 else "Oui") for i in range(12)]
+        with (patch.object(process, "iter_chunks", partial(process.iter_chunks, first_size=4)),
+              self.assertLogs(process.logger, "INFO") as logs):
+            list(process.iter_errors(texts, self.project))
+        dedupe_logs: list[str] = [output for output in logs.output if "Deduplicated" in output]
+        self.assertEqual(len(dedupe_logs), 1)
+        self.assertIn("12 lines of the file into 2 unique lines (83.3% saved)", dedupe_logs[0])
+
+    def test_batcher_kept_between_chunks(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), f"Ligne {i}") for i in range(12)]
+        batcher = self.pool.batcher
+        with (patch.object(process, "iter_chunks", partial(process.iter_chunks, first_size=4)),
+              patch.object(batcher, "record", wraps=batcher.record) as record):
+            list(process.iter_errors(texts, self.project))
+        self.assertEqual(record.call_count, 2)
+
+    def test_quick_mode_spelling_only(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "les chat ont une fote")]
+        full = [error["error"] for chunk in process.iter_errors(texts, self.project) for error in chunk]
+        quick = [error["error"] for chunk in process.iter_errors(texts, self.project,
+                                                                 check_mode=process.CHECK_MODE_QUICK)
+                 for error in chunk]
+        self.assertIn("les chat", full)
+        self.assertNotIn("les chat", quick)
+        self.assertIn("fote", quick)
+        request = self.pool.tools[0].server.requests[-1]
+        self.assertEqual(request["enabledOnly"], "true")
+        self.assertEqual(request["enabledCategories"], "TYPOS")
+
+    def test_quick_mode_with_ignored_rules(self) -> None:
+        texts: list[tuple[str, str]] = [("1", "les chat ont une fote"), ("2", "une autre fote")]
+        project = compiled_project.compile_project({**sample_project(),
+                                                    "ignored_rules": [GRAMMAR_RULE_ID, SPELLING_RULE_ID]})
+        with patch.object(languagetool, "popup_manager") as popup_manager:
+            errors = [error for chunk in process.iter_errors(texts, project, check_mode=process.CHECK_MODE_QUICK)
+                      for error in chunk]
+        popup_manager.show_error.emit.assert_not_called()
+        self.assertNotIn(SPELLING_RULE_ID, [error["error_type"] for error in errors])
+        request = self.pool.tools[0].server.requests[-1]
+        self.assertNotIn("disabledRules", request)
+        self.assertEqual(request["enabledCategories"], "TYPOS")
+
+    def test_cancelled_before_chunk(self) -> None:
+        texts: list[tuple[str, str]] = [(str(i), "une fote") for i in range(12)]
+        cancel_token = CancellationToken()
+        with patch.object(process, "iter_chunks", partial(process.iter_chunks, first_size=4)):
+            errors = process.iter_errors(texts, self.project, cancel_token)
+            self.assertTrue(next(errors))
+            cancel_token.cancel()
+            self.assertEqual(list(errors), [])
+        self.assertEqual(len(self.pool.tools[0].server.requests), 1)
+
+
+class TestProcessFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.project = compiled_project.compile_project(sample_project())
+        self.lines: list[tuple[str, str]] = [("1", "un truc")]
+        self.read_error: Exception | None = None
+        parser = SimpleNamespace(iter_file=self.iter_file)
+        self.patchers = [patch.object(compiled_project, "get_compiled_project", return_value=self.project),
+                         patch.object(parser_loader, "get_all_parsers", return_value={self.project.parser: parser}),
+                         patch.object(languagetool, "initialize_tool"),
+                         patch.object(json_results, "save_data"),
+                         patch.object(json_results, "save_metadata")]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def iter_file(self, filepath: str, arguments: dict[str, str]) -> Iterator[tuple[str, str]]:
+        yield from self.lines
+        if self.read_error is not None:
+            raise self.read_error
+
+    def test_parser_error_not_saved(self) -> None:
+        self.read_error = ValueError("invalid file")
+        self.assertFalse(process.process_file("file.txt", "Project", ""))
+        json_results.save_data.assert_not_called()  # type: ignore
+        json_results.save_metadata.assert_not_called()  # type: ignore
+
+    def test_other_errors_raised(self) -> None:
+        def on_results(data: dict) -> None:
+            raise RuntimeError("bug")
+
+        with patch.object(languagetool, "analyze_text", return_value=[]):
+            self.assertTrue(process.process_file("file.txt", "Project", ""))
+            with self.assertRaises(RuntimeError):
+                process.process_file("file.txt", "Project", "", on_results)
+        json_results.save_data.assert_called_once()  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+import random
+import re
+import unittest
+
+from rawtextcheck.script.text_matcher import TextCleaner, build_trie_pattern
+
+
+GAME_CODES_INTO_SPACE: list[str] = ["\\n", "[br]", "{WAIT}", "{WAIT_LONG}", "<lf>"]
+GAME_CODES_INTO_NOTHING: list[str] = ["{PLAYER}", "{P}", "[c1]", "[c12]", "[/c]", "\\i", "<sfx=01>"]
+WORDS: list[str] = ["Bonjour", "le", "monde", "épée", "!", "?", "d'un", "coup", "42", " ", "  "]
+
+
+def reference_remove_substrings(text: str, ignored_substrings: dict[str, list[str]], replacement: str) -> str:
+    """one scan of the text per dictionary, the first start of the dictionary with an end wins"""
+    result: list[str] = []
+    i: int = 0
+    while i < len(text):
+        for start, ends in ignored_substrings.items():
+            if not text.startswith(start, i):
+                continue
+            found: list[tuple[int, int]] = [(text.find(end, i + len(start)), index)
+                                            for index, end in enumerate(ends)]
+            found = [(position, index) for position, index in found if position != -1]
+            if found:
+                position, index = min(found)
+                result.append(replacement)
+                i = position + len(ends[index])
+                break
+        else:
+            result.append(text[i])
+            i += 1
+    return "".join(result)
+
+
+def reference_clean(text: str, replace_codes: dict[str, str],
+                    codes_into_space: list[str], codes_into_nothing: list[str],
+                    substrings_into_space: dict[str, list[str]],
+                    substrings_into_nothing: dict[str, list[str]]) -> str:
+    """cleaning done before the TextCleaner, one stage after the other and one replace per code"""
+    for code, value in replace_codes.items():
+        text = text.replace(code, value)
+    for code in codes_into_space:
+        text = text.replace(code, " ")
+    for code in codes_into_nothing:
+        text = text.replace(code, "")
+    text = reference_remove_substrings(text, substrings_into_space, " ")
+    return reference_remove_substrings(text, substrings_into_nothing, "")
+
+
+def random_line(rng: random.Random, codes: list[str]) -> str:
+    """generate a line mixing words and codes"""
+    return "".join(rng.choice(codes) if rng.random() < 0.3 else rng.choice(WORDS)
+                   for _ in range(rng.randint(0, 30)))
+
+
+class TestBuildTriePattern(unittest.TestCase):
+
+    def test_empty(self) -> None:
+        self.assertEqual(build_trie_pattern([]), "")
+        self.assertEqual(build_trie_pattern([""]), "")
+
+    def test_matches_every_word(self) -> None:
+        words: list[str] = ["a", "ab", "abc", "b", "[c1]", "[c12]", "(.*)"]
+        pattern: re.Pattern[str] = re.compile(build_trie_pattern(words))
+        for word in words:
+            self.assertEqual(pattern.fullmatch(word).group(), word)  # type: ignore
+
+    def test_longest_match(self) -> None:
+        pattern: re.Pattern[str] = re.compile(build_trie_pattern(["ab", "a", "abcd"]))
+        self.assertEqual(pattern.findall("abcabcdxa"), ["ab", "abcd", "a"])
+
+
+class TestTextCleanerCodes(unittest.TestCase):
+
+    def test_no_code(self) -> None:
+        cleaner = TextCleaner({}, [], [], {}, {})
+        self.assertFalse(cleaner)
+        self.assertEqual(cleaner.sub("text [c1]"), "text [c1]")
+
+    def test_space_and_nothing(self) -> None:
+        cleaner = TextCleaner({}, ["\\n"], ["[c1]", "[/c]"], {}, {})
+        self.assertEqual(cleaner.sub("Hello\\n[c1]world[/c]!"), "Hello world!")
+
+    def test_leftmost_longest(self) -> None:
+        # longest code wins whatever the order of the list
+        cleaner = TextCleaner({}, [], ["{P}", "{PLAYER}", "{"], {}, {})
+        self.assertEqual(cleaner.sub("{PLAYER} {P} {X"), "  X")
+
+    def test_code_in_both_lists_is_space(self) -> None:
+        cleaner = TextCleaner({}, ["<lf>"], ["<lf>"], {}, {})
+        self.assertEqual(cleaner.sub("a<lf>b"), "a b")
+
+    def test_no_rescan_after_replacement(self) -> None:
+        # removing "X" does not create a new "ab" code
+        cleaner = TextCleaner({}, [], ["X", "ab"], {}, {})
+        self.assertEqual(cleaner.sub("aXb"), "ab")
+
+    def test_empty_code_ignored(self) -> None:
+        cleaner = TextCleaner({"": "a"}, [""], [""], {}, {})
+        self.assertFalse(cleaner)
+        self.assertEqual(cleaner.sub("abc"), "abc")
+
+    def test_replacement_not_replaced_again(self) -> None:
+        # sequential replacements chain, the cleaner replaces the raw text only
+        replace_codes: dict[str, str] = {"a": "b", "b": "c"}
+        self.assertEqual(reference_clean("ab", replace_codes, [], [], {}, {}), "cc")
+        self.assertEqual(TextCleaner(replace_codes, [], [], {}, {}).sub("ab"), "bc")
+
+    def test_overlapping_codes_longest_first(self) -> None:
+        # sequential replacements depend on the order of the codes, the cleaner takes the longest code
+        replace_codes: dict[str, str] = {"b": "Y", "ab": "X"}
+        self.assertEqual(reference_clean("ab", replace_codes, [], [], {}, {}), "aY")
+        self.assertEqual(TextCleaner(replace_codes, [], [], {}, {}).sub("ab"), "X")
+
+
+class TestTextCleanerSubstrings(unittest.TestCase):
+
+    def test_no_delimiter(self) -> None:
+        cleaner = TextCleaner({}, [], [], {}, {"<": []})
+        self.assertFalse(cleaner)
+        self.assertEqual(cleaner.sub("a <b> c"), "a <b> c")
+
+    def test_space_and_nothing_in_same_pass(self) -> None:
+        cleaner = TextCleaner({}, [], [], {"<": [">"]}, {"{": ["}"]})
+        self.assertEqual(cleaner.sub("a<b>c{d}e"), "a ce")
+
+    def test_first_end_after_start(self) -> None:
+        cleaner = TextCleaner({}, [], [], {}, {"[": ["]", "|"]})
+        self.assertEqual(cleaner.sub("a[b|c]d"), "ac]d")
+
+    def test_start_without_end_kept(self) -> None:
+        cleaner = TextCleaner({}, [], [], {}, {"<": [">"]})
+        self.assertEqual(cleaner.sub("a < b < c"), "a < b < c")
+        self.assertEqual(cleaner.sub("<<a>"), "")
+
+    def test_longest_start_with_an_end(self) -> None:
+        cleaner = TextCleaner({}, [], [], {"<": [">"]}, {"<!--": ["-->"]})
+        self.assertEqual(cleaner.sub("a<!-- b -->c"), "ac")
+        # no end for the longest start, the shorter one is used
+        self.assertEqual(cleaner.sub("a<!-- b >c"), "a c")
+
+    def test_many_unclosed_starts(self) -> None:
+        cleaner = TextCleaner({}, [], [], {}, {"<": [">"]})
+        line: str = "<" * 20000 + "a"
+        self.assertEqual(cleaner.sub(line), line)
+
+
+class TestTextCleanerAgainstSequential(unittest.TestCase):
+    """TextCleaner against the stages applied one after the other,
+    for codes and delimiters where the two give the same result."""
+
+    def setUp(self) -> None:
+        self.rng = random.Random(1234)
+
+    def test_codes(self) -> None:
+        codes_into_space: list[str] = ["\\n", "[br]", "{WAIT}", "<lf>"]
+        codes_into_nothing: list[str] = ["{PLAYER}", "[c1]", "[/c]", "\\i", "<sfx=01>"]
+        cleaner = TextCleaner({}, codes_into_space, codes_into_nothing, {}, {})
+        for _ in range(2000):
+            line: str = random_line(self.rng, codes_into_space + codes_into_nothing)
+            self.assertEqual(cleaner.sub(line),
+                             reference_clean(line, {}, codes_into_space, codes_into_nothing, {}, {}), line)
+
+    def test_prefix_codes_sorted_longest_first(self) -> None:
+        # with codes sharing a prefix, the sequential stages agree when longest codes come first
+        codes_into_space: list[str] = sorted(GAME_CODES_INTO_SPACE, key=len, reverse=True)
+        codes_into_nothing: list[str] = sorted(GAME_CODES_INTO_NOTHING, key=len, reverse=True)
+        cleaner = TextCleaner({}, codes_into_space, codes_into_nothing, {}, {})
+        for _ in range(2000):
+            line: str = random_line(self.rng, GAME_CODES_INTO_SPACE + GAME_CODES_INTO_NOTHING)
+            self.assertEqual(cleaner.sub(line),
+                             reference_clean(line, {}, codes_into_space, codes_into_nothing, {}, {}), line)
+
+    def test_replace_codes(self) -> None:
+        replace_codes: dict[str, str] = {"$": "'", "#o": "ō", "{PLAYER}": "Silous", "\\e": "é"}
+        cleaner = TextCleaner(replace_codes, [], [], {}, {})
+        for _ in range(2000):
+            line: str = random_line(self.rng, list(replace_codes))
+            self.assertEqual(cleaner.sub(line), reference_clean(line, replace_codes, [], [], {}, {}), line)
+
+    def test_substrings(self) -> None:
+        substrings_into_space: dict[str, list[str]] = {"<": [">"], "[[": ["]]", "|"]}
+        substrings_into_nothing: dict[str, list[str]] = {"{": ["}"], "#": ["#"]}
+        tokens: list[str] = ["<", ">", "[[", "]]", "|", "{", "}", "#"]
+        for space, nothing in ((substrings_into_space, {}), ({}, substrings_into_nothing)):
+            cleaner = TextCleaner({}, [], [], space, nothing)
+            for _ in range(2000):
+                line: str = random_line(self.rng, tokens)
+                self.assertEqual(cleaner.sub(line), reference_clean(line, {}, [], [], space, nothing), line)
+
+    def test_every_stage(self) -> None:
+        # well-formed markup, where the stages applied one after the other give the same result
+        replace_codes: dict[str, str] = {"{PLAYER}": "Silous", "\\e": "é"}
+        codes_into_space: list[str] = ["\\n", "[br]"]
+        codes_into_nothing: list[str] = ["[c1]", "[/c]"]
+        substrings_into_space: dict[str, list[str]] = {"<": [">"]}
+        substrings_into_nothing: dict[str, list[str]] = {"#": ["#"]}
+        cleaner = TextCleaner(replace_codes, codes_into_space, codes_into_nothing,
+                              substrings_into_space, substrings_into_nothing)
+        tokens: list[str] = ["{PLAYER}", "\\e", "\\n", "[br]", "[c1]", "[/c]", "<b>", "<i=2>", "#tag#"]
+        for _ in range(2000):
+            line: str = random_line(self.rng, tokens)
+            self.assertEqual(cleaner.sub(line),
+                             reference_clean(line, replace_codes, codes_into_space, codes_into_nothing,
+                                             substrings_into_space, substrings_into_nothing),
+                             line)
+
+    def test_replacement_not_cleaned_again(self) -> None:
+        # the sequential stages clean the value of a replace code, the cleaner keeps it
+        self.assertEqual(reference_clean("a$rb", {"$r": "[br]"}, ["[br]"], [], {}, {}), "a b")
+        self.assertEqual(TextCleaner({"$r": "[br]"}, ["[br]"], [], {}, {}).sub("a$rb"), "a[br]b")
+
+    def test_codes_not_removed_before_substrings(self) -> None:
+        # the sequential stages remove the code "b>" first, the cleaner finds "<" first and ends at "b>"
+        line: str = "a<b>c>d"
+        self.assertEqual(reference_clean(line, {}, [], ["b>"], {}, {"<": [">"]}), "ad")
+        self.assertEqual(TextCleaner({}, [], ["b>"], {}, {"<": [">"]}).sub(line), "ac>d")
+
+
+if __name__ == "__main__":
+    unittest.main()